@@ -1,6 +1,12 @@
-from fastapi import APIRouter, HTTPException
-from app.models.job import JobSearchRequest, JobSearchResponse
+import json
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from app.models.job import JobSearchRequest, JobSearchResponse, JobQueryResponse
 from app.services.job_search import JobSearchService
+from app.services.job_store import get_job_store
 
 router = APIRouter()
 job_search_service = JobSearchService()
@@ -9,15 +15,66 @@ job_search_service = JobSearchService()
 async def search_jobs(request: JobSearchRequest):
     """채용 공고 검색"""
     try:
-        jobs = await job_search_service.search_jobs(request)
+        outcome = await job_search_service.search_jobs_with_status(request)
+        
+        # 새로 수집한 결과는 저장소에 반영 (적합도 분석 등에서 공고 ID로 조회, 블로킹 DB 작업이라 스레드풀에서 실행)
+        if outcome.cache_status == "miss":
+            await run_in_threadpool(get_job_store().upsert_jobs, outcome.jobs)
+        
         return JobSearchResponse(
-            total=len(jobs),
-            jobs=jobs,
-            search_params=request
+            total=len(outcome.jobs),
+            jobs=outcome.jobs,
+            search_params=request,
+            partial=outcome.partial,
+            source_status=outcome.source_status,
+            cache_status=outcome.cache_status
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"검색 중 오류 발생: {str(e)}")
 
+@router.get("/search/stream")
+async def stream_search_jobs(
+    keyword: str,
+    location: Optional[str] = None,
+    max_results: int = Query(20, ge=1, le=100),
+    sources: List[str] = Query(["linkedin", "indeed"]),
+):
+    """채용 공고 검색 결과를 Server-Sent Events로 스트리밍"""
+    request = JobSearchRequest(keyword=keyword, location=location, max_results=max_results, sources=sources)
+    
+    async def event_stream():
+        total = 0
+        async for job in job_search_service.stream_jobs(request):
+            total += 1
+            yield f"event: job\ndata: {job.model_dump_json()}\n\n"
+        yield f"event: done\ndata: {json.dumps({'total': total})}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/query", response_model=JobQueryResponse)
+async def query_jobs(
+    q: str = Query(..., min_length=1, description="검색어 (모든 단어 포함, 끝에 *를 붙이면 접두어 검색)"),
+    source: Optional[str] = None,
+    company: Optional[str] = None,
+    location: Optional[str] = None,
+    since: Optional[datetime] = Query(None, description="이 시각 이후에 확인된 공고만"),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+):
+    """저장된 채용 공고 전문 검색 (제목/회사/설명, 관련도 순)"""
+    try:
+        total, results = await run_in_threadpool(
+            get_job_store().search_jobs,
+            q, source=source, company=company, location=location, seen_since=since, limit=limit, offset=offset
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"검색 중 오류 발생: {str(e)}")
+    return JobQueryResponse(total=total, limit=limit, offset=offset, results=results)
+
 @router.get("/sources")
 async def get_sources():
     """사용 가능한 검색 소스 목록"""
@@ -28,3 +85,12 @@ async def get_sources():
         ]
     }
 
+@router.get("/stats")
+async def get_stats():
+    """검색 결과 캐시, 스크래퍼 캐시 및 동일 검색 병합 통계"""
+    return {
+        "result_cache": job_search_service.result_cache.stats(),
+        "coalesced_searches": job_search_service.search_flight.stats(),
+        "http_cache": job_search_service.indeed_scraper.response_cache.stats(),
+        "description_cache": job_search_service.linkedin_scraper.description_cache.stats(),
+    }
@@ -9,6 +9,7 @@ import json
 import shutil
 import os
 from datetime import datetime
+from app.services.snapshot_store import SnapshotStore
 
 class SearchRequest(BaseModel):
     keyword: str
@@ -46,6 +47,22 @@ async def list_job_files():
     
     return {"files": files}
 
+@router.get("/snapshots")
+async def list_snapshots():
+    """저장된 스냅샷 목록 (기준 스냅샷과 일일 변경분)"""
+    return {"snapshots": SnapshotStore("jobs/snapshots").entries()}
+
+@router.get("/snapshots/{at}")
+async def get_snapshot_view(at: str):
+    """지정한 날짜(YYYY-MM-DD) 또는 시각(ISO 형식) 기준의 전체 채용 공고 목록"""
+    try:
+        view = SnapshotStore("jobs/snapshots").load_view(at)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="날짜(YYYY-MM-DD) 또는 ISO 형식 시각을 입력하세요")
+    if view is None:
+        raise HTTPException(status_code=404, detail="해당 시점의 스냅샷을 찾을 수 없습니다")
+    return view
+
 @router.get("/jobs/{filename}")
 async def get_job_file(filename: str):
     """특정 채용 공고 파일 내용"""
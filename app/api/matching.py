@@ -1,35 +1,28 @@
 from fastapi import APIRouter, HTTPException
-from app.models.matching import MatchingRequest, MatchingResponse
+from fastapi.concurrency import run_in_threadpool
+from app.models.matching import (
+    MatchingRequest, MatchingResponse, MatchingBatchRequest, MatchingBatchResponse, MatchingBatchItem
+)
 from app.services.matching import MatchingService
-from app.api.resume import resume_storage
+from app.services.job_features import JobFeatureCache
 from app.services.job_search import JobSearchService
+from app.services.job_store import get_job_store
 
 router = APIRouter()
-matching_service = MatchingService()
+# 공고 특징은 공고 저장소에 함께 저장해 재시작 후에도 재사용
+matching_service = MatchingService(feature_cache=JobFeatureCache(persistent=True))
 job_search_service = JobSearchService()
 
-# 임시 채용 공고 저장소 (실제로는 데이터베이스 사용 권장)
-job_storage = {}
-
 @router.post("/analyze", response_model=MatchingResponse)
 async def analyze_match(request: MatchingRequest):
     """이력서와 채용 공고의 적합도 분석"""
     try:
-        # 이력서 조회
-        if request.resume_id not in resume_storage:
-            raise HTTPException(status_code=404, detail="이력서를 찾을 수 없습니다.")
-        
-        resume_info = resume_storage[request.resume_id]
-        resume_data = resume_info["resume_data"]
-        
-        # 채용 공고 조회 (임시 저장소 또는 재검색)
-        if request.job_id not in job_storage:
-            raise HTTPException(status_code=404, detail="채용 공고를 찾을 수 없습니다.")
+        # 저장소 조회/저장은 블로킹 DB 작업이라 이벤트 루프를 막지 않도록 스레드풀에서 실행
+        resume_data, job = await run_in_threadpool(_load_match_inputs, request)
         
-        job = job_storage[request.job_id]
-        
-        # 적합도 계산
+        # 적합도 계산 후 결과 저장
         match_score = await matching_service.calculate_match(resume_data, job)
+        await run_in_threadpool(get_job_store().save_match, request.resume_id, request.job_id, match_score)
         
         # 분석 텍스트 생성
         analysis = f"""
@@ -62,11 +55,65 @@ async def analyze_match(request: MatchingRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"적합도 분석 중 오류 발생: {str(e)}")
 
+def _load_match_inputs(request: MatchingRequest):
+    """적합도 분석에 쓸 (이력서 데이터, 채용 공고) 조회 (동기)"""
+    store = get_job_store()
+    
+    # 이력서 조회
+    resume_info = store.get_resume(request.resume_id)
+    if resume_info is None:
+        raise HTTPException(status_code=404, detail="이력서를 찾을 수 없습니다.")
+    
+    # 채용 공고 조회 (검색, 저장 요청 또는 일일 수집으로 저장된 공고)
+    job = store.get_job(request.job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="채용 공고를 찾을 수 없습니다.")
+    
+    return resume_info["resume_data"], job
+
+@router.post("/batch", response_model=MatchingBatchResponse)
+async def analyze_match_batch(request: MatchingBatchRequest):
+    """이력서 하나와 여러 채용 공고의 적합도 일괄 분석 (점수 순 상위 top_n개 반환)"""
+    try:
+        # 저장소 조회와 점수 계산은 CPU/디스크 작업이라 이벤트 루프를 막지 않도록 스레드풀에서 실행
+        return await run_in_threadpool(_rank_batch, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"적합도 분석 중 오류 발생: {str(e)}")
+
+def _rank_batch(request: MatchingBatchRequest) -> MatchingBatchResponse:
+    """일괄 분석 본체 (동기)"""
+    store = get_job_store()
+    
+    resume_info = store.get_resume(request.resume_id)
+    if resume_info is None:
+        raise HTTPException(status_code=404, detail="이력서를 찾을 수 없습니다.")
+    
+    # 분석 대상: 지정한 공고 또는 저장된 최근 공고
+    if request.job_ids:
+        jobs = store.get_jobs(request.job_ids)
+    else:
+        jobs = store.query_jobs(limit=request.limit)
+    
+    # 공고가 많으면 역색인으로 고른 후보만 전체 점수 계산
+    ranked = matching_service.rank(resume_info["resume_data"], jobs, request.top_n)
+    store.save_matches(request.resume_id, {job.id: score for job, score in ranked})
+    
+    return MatchingBatchResponse(
+        resume_id=request.resume_id,
+        total=len(jobs),
+        results=[
+            MatchingBatchItem(job_id=job.id, job_title=job.title, company=job.company, match_score=score)
+            for job, score in ranked
+        ]
+    )
+
 @router.post("/store-job")
 async def store_job(job_data: dict):
-    """채용 공고를 임시 저장소에 저장 (검색 후 사용)"""
+    """채용 공고를 저장소에 저장 (검색 후 사용)"""
     from app.models.job import JobPosting
     job = JobPosting(**job_data)
-    job_storage[job.id] = job
+    await run_in_threadpool(get_job_store().upsert_jobs, [job])
     return {"message": "채용 공고가 저장되었습니다.", "job_id": job.id}
 
@@ -1,15 +1,14 @@
 import os
 import shutil
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from app.models.resume import ResumeUpload
 from app.services.resume_parser import ResumeParser
+from app.services.job_store import get_job_store
 
 router = APIRouter()
 resume_parser = ResumeParser()
 
-# 저장된 이력서 데이터 (실제로는 데이터베이스 사용 권장)
-resume_storage = {}
-
 @router.post("/upload", response_model=ResumeUpload)
 async def upload_resume(file: UploadFile = File(...)):
     """이력서 업로드 및 파싱"""
@@ -22,12 +21,8 @@ async def upload_resume(file: UploadFile = File(...)):
         # 이력서 파싱
         file_id, resume_data = await resume_parser.parse_resume(file_path, file.filename)
         
-        # 저장
-        resume_storage[file_id] = {
-            "file_path": file_path,
-            "filename": file.filename,
-            "resume_data": resume_data
-        }
+        # 저장 (재시작 후나 다른 워커에서도 조회할 수 있도록 데이터베이스에 저장)
+        await run_in_threadpool(get_job_store().save_resume, file_id, file.filename, file_path, resume_data)
         
         return ResumeUpload(
             file_id=file_id,
@@ -41,8 +36,9 @@ async def upload_resume(file: UploadFile = File(...)):
 @router.get("/{file_id}")
 async def get_resume(file_id: str):
     """업로드된 이력서 조회"""
-    if file_id not in resume_storage:
+    resume_info = await run_in_threadpool(get_job_store().get_resume, file_id)
+    if resume_info is None:
         raise HTTPException(status_code=404, detail="이력서를 찾을 수 없습니다.")
     
-    return resume_storage[file_id]
+    return resume_info
 
@@ -29,6 +29,17 @@ async def root():
         "version": "1.0.0"
     }
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """공유 리소스 정리"""
+    from app.services.http_client import close_http_client
+    from app.services.job_store import get_job_store
+    from app.api import job_search, matching
+    job_search.job_search_service.close()
+    matching.job_search_service.close()
+    await close_http_client()
+    get_job_store().close()
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 
 class JobPosting(BaseModel):
@@ -21,10 +21,27 @@ class JobSearchRequest(BaseModel):
     location: Optional[str] = Field(None, description="지역 (선택사항)")
     max_results: int = Field(20, ge=1, le=100, description="최대 결과 수")
     sources: List[str] = Field(["linkedin", "indeed"], description="검색할 플랫폼")
+    deadline_ms: Optional[int] = Field(None, ge=1, description="검색 제한 시간 (밀리초, 초과 시 부분 결과 반환)")
 
 class JobSearchResponse(BaseModel):
     """채용 공고 검색 응답"""
     total: int
     jobs: List[JobPosting]
     search_params: JobSearchRequest
+    partial: bool = False  # 제한 시간 초과 등으로 일부 소스 결과가 빠졌는지 여부
+    source_status: Dict[str, str] = {}  # 소스별 상태: "ok", "timeout", "error"
+    cache_status: str = "miss"  # 결과 캐시 상태: "fresh", "stale"(백그라운드 갱신 중), "miss"
+
+class JobQueryResult(BaseModel):
+    """전문 검색 결과 항목"""
+    job: JobPosting
+    score: float  # 관련도 (bm25, 클수록 관련도 높음)
+    snippet: str  # 검색어가 강조된 설명 일부
+
+class JobQueryResponse(BaseModel):
+    """저장된 채용 공고 전문 검색 응답"""
+    total: int
+    limit: int
+    offset: int
+    results: List[JobQueryResult]
 
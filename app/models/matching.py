@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Dict
 
 class MatchScore(BaseModel):
@@ -26,3 +26,22 @@ class MatchingResponse(BaseModel):
     match_score: MatchScore
     analysis: str  # 상세 분석 텍스트
 
+class MatchingBatchRequest(BaseModel):
+    """이력서 하나와 여러 채용 공고의 일괄 적합도 분석 요청"""
+    resume_id: str
+    job_ids: List[str] = Field([], description="분석할 공고 ID (비우면 저장된 최근 공고 전체)")
+    limit: int = Field(1000, ge=1, le=10000, description="job_ids가 비었을 때 분석할 최근 공고 수")
+    top_n: int = Field(20, ge=1, le=1000, description="반환할 상위 결과 수")
+
+class MatchingBatchItem(BaseModel):
+    """일괄 분석 결과 항목"""
+    job_id: str
+    job_title: str
+    company: str
+    match_score: MatchScore
+
+class MatchingBatchResponse(BaseModel):
+    """일괄 적합도 분석 응답 (전체 점수 순)"""
+    resume_id: str
+    total: int  # 분석한 공고 수
+    results: List[MatchingBatchItem]
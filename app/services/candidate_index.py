@@ -0,0 +1,186 @@
+import os
+from array import array
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional
+import numpy as np
+from app.services.job_features import JobFeatures
+
+# 후보 검색 설정 (환경 변수로 조정 가능)
+CANDIDATE_MIN_SHARED = int(os.getenv('CANDIDATE_MIN_SHARED', '1'))
+CANDIDATE_POOL_FACTOR = int(os.getenv('CANDIDATE_POOL_FACTOR', '5'))
+CANDIDATE_POOL_MIN = int(os.getenv('CANDIDATE_POOL_MIN', '200'))
+# 무효 슬롯 비율이 이 값을 넘으면 살아 있는 공고만으로 색인을 다시 만듦
+CANDIDATE_INDEX_MAX_DEAD_FRACTION = float(os.getenv('CANDIDATE_INDEX_MAX_DEAD_FRACTION', '0.5'))
+
+# 스킬 항목은 단어와 겹치지 않도록 접두어를 붙여 색인
+_SKILL_PREFIX = 'skill:'
+
+# 공고 특징의 경력/학력 플래그 (근사 점수 계산용 비트)
+FLAG_SENIOR = 1
+FLAG_JUNIOR = 2
+FLAG_EDUCATION = 4
+
+def flags_of(features: JobFeatures) -> int:
+    """공고 특징의 경력/학력 플래그 조합"""
+    return (
+        (FLAG_SENIOR if features.is_senior else 0)
+        | (FLAG_JUNIOR if features.is_junior else 0)
+        | (FLAG_EDUCATION if features.requires_education else 0)
+    )
+
+def candidate_pool_size(top_n: int) -> int:
+    """상위 top_n개를 고르기 위해 전체 점수를 계산할 후보 수"""
+    return max(top_n * CANDIDATE_POOL_FACTOR, CANDIDATE_POOL_MIN)
+
+class CandidateIndex:
+    """단어/스킬 -> 채용 공고 역색인 (전체 적합도 계산 전에 후보 공고를 고르는 데 사용)
+    
+    설명 매칭에 쓰이는 단어(4글자 이상)와 공고의 사전 스킬을 색인하고, 이력서와
+    겹치는 항목 수로 설명/스킬 점수를 근사해 근사 점수 상위 후보만 돌려준다.
+    공고 내용이 바뀌거나 코퍼스에서 빠지면 이전 항목은 무효 처리하고, 무효 슬롯 비율이
+    max_dead_fraction을 넘으면 살아 있는 공고만 남기도록 압축한다.
+    """
+    
+    def __init__(self, max_dead_fraction: float = CANDIDATE_INDEX_MAX_DEAD_FRACTION):
+        self.max_dead_fraction = max_dead_fraction
+        self._postings: Dict[str, array] = defaultdict(lambda: array('i'))
+        self._slots: Dict[str, int] = {}
+        self._hashes: List[str] = []
+        self._job_ids: List[str] = []
+        self._alive = array('b')
+        self._word_counts = array('i')
+        self._skill_counts = array('i')
+        self._flags = array('b')  # 경력/학력 플래그 (FLAG_* 조합)
+        self._dead = 0
+    
+    def __len__(self) -> int:
+        return len(self._slots)
+    
+    @property
+    def dead_fraction(self) -> float:
+        """전체 슬롯 중 무효 슬롯 비율"""
+        return self._dead / len(self._job_ids) if self._job_ids else 0.0
+    
+    def add(self, job_id: str, features: JobFeatures):
+        """공고 색인 (같은 내용으로 이미 색인돼 있으면 무시)"""
+        slot = self._slots.get(job_id)
+        if slot is not None:
+            if self._hashes[slot] == features.content_hash:
+                return
+            self._alive[slot] = 0
+            self._dead += 1
+        
+        slot = len(self._job_ids)
+        self._slots[job_id] = slot
+        self._job_ids.append(job_id)
+        self._hashes.append(features.content_hash)
+        self._alive.append(1)
+        self._word_counts.append(len(features.words))
+        self._skill_counts.append(len(features.skills))
+        self._flags.append(flags_of(features))
+        for word in features.words:
+            if len(word) > 3:
+                self._postings[word].append(slot)
+        for skill in features.skills:
+            self._postings[_SKILL_PREFIX + skill].append(slot)
+    
+    def add_many(self, job_ids: Iterable[str], features: Iterable[JobFeatures]):
+        """여러 공고 색인"""
+        for job_id, job_features in zip(job_ids, features):
+            self.add(job_id, job_features)
+        self._compact_if_needed()
+    
+    def retain(self, job_ids: Iterable[str]):
+        """주어진 공고만 남기고 나머지 색인 항목은 무효 처리 (코퍼스에서 빠진 공고 제거)"""
+        keep = set(job_ids)
+        for job_id in [job_id for job_id in self._slots if job_id not in keep]:
+            self._alive[self._slots.pop(job_id)] = 0
+            self._dead += 1
+        self._compact_if_needed()
+    
+    def _compact_if_needed(self):
+        """무효 슬롯 비율이 기준을 넘으면 압축"""
+        if self._dead and self.dead_fraction > self.max_dead_fraction:
+            self.compact()
+    
+    def compact(self):
+        """무효 슬롯을 버리고 살아 있는 공고만 앞에서부터 다시 번호를 매김"""
+        alive = np.frombuffer(self._alive, dtype=np.int8).astype(bool)
+        kept = np.flatnonzero(alive)
+        remap = np.full(len(self._job_ids), -1, dtype=np.int32)
+        remap[kept] = np.arange(len(kept), dtype=np.int32)
+        
+        postings: Dict[str, array] = defaultdict(lambda: array('i'))
+        for term, slots in self._postings.items():
+            remapped = remap[np.frombuffer(slots, dtype=np.int32)]
+            remapped = remapped[remapped >= 0]
+            if len(remapped):
+                postings[term].frombytes(remapped.tobytes())
+        
+        self._postings = postings
+        self._job_ids = [self._job_ids[slot] for slot in kept]
+        self._hashes = [self._hashes[slot] for slot in kept]
+        self._slots = {job_id: slot for slot, job_id in enumerate(self._job_ids)}
+        self._alive = array('b', bytes([1]) * len(kept))
+        self._word_counts = array('i', (self._word_counts[slot] for slot in kept))
+        self._skill_counts = array('i', (self._skill_counts[slot] for slot in kept))
+        self._flags = array('b', (self._flags[slot] for slot in kept))
+        self._dead = 0
+    
+    def align(self, job_ids: List[str], values: np.ndarray) -> np.ndarray:
+        """공고 순서의 값을 색인 슬롯 순서 배열로 변환 (색인되지 않은 슬롯은 0)"""
+        aligned = np.zeros(len(self._job_ids))
+        aligned[[self._slots[job_id] for job_id in job_ids]] = values
+        return aligned
+    
+    def _shared_counts(self, terms: Iterable[str], size: int) -> np.ndarray:
+        """공고별로 주어진 항목과 겹치는 수"""
+        postings = [np.frombuffer(self._postings[term], dtype=np.int32) for term in terms if term in self._postings]
+        if not postings:
+            return np.zeros(size, dtype=np.int64)
+        return np.bincount(np.concatenate(postings), minlength=size)
+    
+    def candidates(
+        self,
+        resume,
+        limit: int,
+        approximate: Optional[Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]] = None,
+        job_ids: Optional[Iterable[str]] = None,
+        min_shared: int = CANDIDATE_MIN_SHARED,
+    ) -> List[str]:
+        """이력서(ResumeFeatures)와 겹치는 항목이 min_shared개 이상인 공고 중 근사 점수 상위 limit개의 ID
+        
+        approximate(스킬 점수, 설명 점수, 플래그)로 공고별 근사 점수를 계산하고 (없으면 두 점수의 합),
+        job_ids를 주면 그 공고들 안에서만 고른다.
+        """
+        size = len(self._job_ids)
+        if size == 0:
+            return []
+        
+        words = [word for word in resume.words if len(word) > 3]
+        skills = {_SKILL_PREFIX + key for key in resume.skill_keys if key}
+        shared_words = self._shared_counts(words, size)
+        shared_skills = self._shared_counts(skills, size)
+        
+        # 스킬 점수: 겹치는 스킬 / 공고 스킬 (없으면 중간), 설명 점수: 겹치는 단어 수 / min(공고 단어 수, 100)
+        word_counts = np.frombuffer(self._word_counts, dtype=np.int32)
+        skill_counts = np.frombuffer(self._skill_counts, dtype=np.int32)
+        skills_score = np.where(skill_counts > 0, np.minimum(shared_skills / np.maximum(skill_counts, 1), 1.0) * 100, 50.0)
+        description_score = np.minimum(shared_words / np.maximum(np.minimum(word_counts, 100), 1), 1.0) * 100
+        if approximate is None:
+            approx = skills_score + description_score
+        else:
+            approx = approximate(skills_score, description_score, np.frombuffer(self._flags, dtype=np.int8).copy())
+        
+        eligible = np.frombuffer(self._alive, dtype=np.int8).astype(bool)
+        eligible &= (shared_words + shared_skills) >= min_shared
+        if job_ids is not None:
+            allowed = np.zeros(size, dtype=bool)
+            allowed[[self._slots[job_id] for job_id in job_ids if job_id in self._slots]] = True
+            eligible &= allowed
+        
+        slots = np.flatnonzero(eligible)
+        if len(slots) > limit:
+            slots = slots[np.argpartition(-approx[slots], limit - 1)[:limit]]
+        slots = slots[np.argsort(-approx[slots], kind='stable')]
+        return [self._job_ids[slot] for slot in slots]
@@ -0,0 +1,157 @@
+import os
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
+from app.models.job import JobPosting
+
+# 유사 중복 판정 설정 (환경 변수로 조정 가능)
+NEAR_DUP_THRESHOLD = float(os.getenv('NEAR_DUP_THRESHOLD', '0.8'))
+NEAR_DUP_NUM_PERM = int(os.getenv('NEAR_DUP_NUM_PERM', '64'))
+NEAR_DUP_BANDS = int(os.getenv('NEAR_DUP_BANDS', '16'))
+# 설명 단어가 이보다 적은 공고(상세 설명 수집 실패 등)는 내용으로 판정하지 않고 공고 ID로만 중복 판정
+NEAR_DUP_MIN_TOKENS = int(os.getenv('NEAR_DUP_MIN_TOKENS', '10'))
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+def _tokens(text: Optional[str]) -> List[str]:
+    """소문자로 정규화한 단어 목록"""
+    return _TOKEN_PATTERN.findall((text or "").lower())
+
+def listing_key(job: JobPosting) -> Tuple[str, str, str]:
+    """소스가 달라도 같은 공고면 같아지는 (제목, 회사, 도시) 키 (지역은 첫 번째 쉼표 앞부분만 사용)"""
+    city = (job.location or "").split(',')[0]
+    return (" ".join(_tokens(job.title)), " ".join(_tokens(job.company)), " ".join(_tokens(city)))
+
+class NearDuplicateIndex:
+    """MinHash 서명과 LSH 버킷으로 유사 중복 채용 공고를 찾는 인덱스
+    
+    - 같은 소스 안의 재게시 등: 제목, 회사, 지역, 설명을 정규화한 단어 shingle의 MinHash
+      서명을 만들고, 서명을 band로 나눠 같은 버킷에 들어간 후보만 Jaccard 유사도로 비교한다.
+    - 소스가 다른 같은 공고 (Indeed는 요약, LinkedIn은 전체 설명): 제목/회사/도시가 같은
+      공고 중 짧은 쪽 설명 shingle이 긴 쪽에 threshold 이상 포함되면 중복으로 본다.
+    - 설명이 min_tokens 단어보다 짧은 공고는 내용으로 판정하지 않고 공고 ID로만 판정한다.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = NEAR_DUP_THRESHOLD,
+        num_perm: int = NEAR_DUP_NUM_PERM,
+        bands: int = NEAR_DUP_BANDS,
+        shingle_size: int = 3,
+        seed: int = 42,
+        min_tokens: int = NEAR_DUP_MIN_TOKENS,
+    ):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.min_tokens = min_tokens
+        
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+        
+        self._buckets: Dict[tuple, List[str]] = defaultdict(list)
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._keys: Set[str] = set()
+        # (제목, 회사, 도시) -> [(공고 키, 소스, 설명 shingle 집합)]
+        self._listings: Dict[Tuple[str, str, str], List[Tuple[str, str, Set[str]]]] = defaultdict(list)
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def _grams(self, tokens: List[str]) -> Set[str]:
+        """단어 shingle 집합"""
+        size = self.shingle_size
+        if len(tokens) < size:
+            return {" ".join(tokens)}
+        return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+    
+    def _shingles(self, job: JobPosting) -> np.ndarray:
+        """정규화한 제목/회사/지역/설명의 단어 shingle 해시 집합"""
+        grams = self._grams(_tokens(f"{job.title} {job.company} {job.location or ''} {job.description}"))
+        return np.fromiter((zlib.crc32(gram.encode('utf-8')) for gram in grams), dtype=np.uint64, count=len(grams))
+    
+    def signature(self, job: JobPosting) -> np.ndarray:
+        """공고의 MinHash 서명"""
+        shingles = self._shingles(job)
+        with np.errstate(over='ignore'):
+            hashes = (np.outer(self._a, shingles) + self._b[:, None]) % _MERSENNE_PRIME & _MAX_HASH
+        return hashes.min(axis=1)
+    
+    def _band_keys(self, signature: np.ndarray) -> List[tuple]:
+        """서명을 band 단위로 나눈 LSH 버킷 키"""
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+    
+    def find_duplicate(self, job: JobPosting, signature: Optional[np.ndarray] = None) -> Optional[str]:
+        """이미 색인된 유사 중복 공고의 키 반환 (없으면 None)"""
+        if signature is None:
+            signature = self.signature(job)
+        
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+        
+        for key in candidates:
+            similarity = float(np.mean(self._signatures[key] == signature))
+            if similarity >= self.threshold:
+                return key
+        return None
+    
+    def _find_cross_source(self, job: JobPosting, listing: Tuple[str, str, str], grams: Set[str]) -> Optional[str]:
+        """제목/회사/도시가 같고 설명이 서로 포함 관계인 다른 소스 공고의 키"""
+        for key, source, other_grams in self._listings.get(listing, ()):
+            if source == job.source:
+                continue
+            shorter, longer = (grams, other_grams) if len(grams) <= len(other_grams) else (other_grams, grams)
+            if len(shorter & longer) / len(shorter) >= self.threshold:
+                return key
+        return None
+    
+    def add(self, key: str, job: JobPosting) -> Optional[str]:
+        """유사 중복이 없으면 색인하고 None, 있으면 색인하지 않고 기존 공고 키 반환"""
+        if key in self._keys:
+            return key
+        
+        description_tokens = _tokens(job.description)
+        if len(description_tokens) < self.min_tokens:
+            # 설명이 없거나 너무 짧으면 제목/회사만으로는 다른 공고와 구분할 수 없으므로 ID로만 판정
+            self._keys.add(key)
+            return None
+        
+        listing = listing_key(job)
+        grams = self._grams(description_tokens)
+        duplicate = self._find_cross_source(job, listing, grams)
+        if duplicate is not None:
+            return duplicate
+        
+        signature = self.signature(job)
+        duplicate = self.find_duplicate(job, signature)
+        if duplicate is not None:
+            return duplicate
+        
+        self._keys.add(key)
+        self._listings[listing].append((key, job.source, grams))
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].append(key)
+        return None
+
+def dedupe_jobs(jobs: List[JobPosting], index: Optional[NearDuplicateIndex] = None) -> List[JobPosting]:
+    """공고 ID가 같거나 내용이 유사한 중복 공고 제거 (먼저 나온 공고 유지)"""
+    index = index or NearDuplicateIndex()
+    unique_jobs = []
+    for job in jobs:
+        if index.add(job.id, job) is None:
+            unique_jobs.append(job)
+    return unique_jobs
@@ -0,0 +1,146 @@
+import os
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Set
+from app.utils.job_id import canonicalize_url
+
+# 캐시 설정 (환경 변수로 조정 가능)
+DESCRIPTION_CACHE_PATH = os.getenv('DESCRIPTION_CACHE_PATH', 'cache/descriptions.sqlite3')
+DESCRIPTION_CACHE_TTL_DAYS = float(os.getenv('DESCRIPTION_CACHE_TTL_DAYS', '30'))
+DESCRIPTION_CACHE_MAX_ENTRIES = int(os.getenv('DESCRIPTION_CACHE_MAX_ENTRIES', '20000'))
+# 조회 시각(last_access) 갱신을 모아 두었다가 한 번에 기록하는 최대 개수
+DESCRIPTION_CACHE_FLUSH_SIZE = int(os.getenv('DESCRIPTION_CACHE_FLUSH_SIZE', '500'))
+
+class DescriptionCache:
+    """채용 공고 URL을 키로 하는 상세 설명 디스크 캐시 (TTL + LRU 제거)
+    
+    조회할 때마다 커밋하지 않도록 조회 시각 갱신과 만료 항목 삭제는 모아 두었다가
+    flush()에서 한 번에 기록하고, 최대 개수 초과 항목도 그때 제거한다.
+    호출 측(스크래퍼)은 이벤트 루프를 막지 않도록 스레드에서 호출하고 검색마다 flush()한다.
+    """
+    
+    def __init__(
+        self,
+        path: str = DESCRIPTION_CACHE_PATH,
+        ttl_seconds: float = DESCRIPTION_CACHE_TTL_DAYS * 86400,
+        max_entries: int = DESCRIPTION_CACHE_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.flush_size = DESCRIPTION_CACHE_FLUSH_SIZE
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending_access: Dict[str, float] = {}
+        self._pending_expired: Set[str] = set()
+        
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS descriptions (
+                url TEXT PRIMARY KEY,
+                description TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_descriptions_last_access ON descriptions(last_access)")
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(job_url: str) -> str:
+        """추적용 쿼리 파라미터를 제거한 캐시 키"""
+        return canonicalize_url(job_url)
+    
+    def get(self, job_url: str) -> Optional[str]:
+        """캐시된 상세 설명 조회 (만료되었으면 None)"""
+        key = self.make_key(job_url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description, fetched_at FROM descriptions WHERE url = ?", (key,)
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None
+            
+            description, fetched_at = row
+            if now - fetched_at > self.ttl_seconds:
+                self._pending_expired.add(key)
+                self.misses += 1
+                return None
+            
+            self._pending_access[key] = now
+            if len(self._pending_access) >= self.flush_size:
+                self._flush()
+            self.hits += 1
+            return description
+    
+    def set(self, job_url: str, description: str):
+        """상세 설명 저장 (최대 개수를 넘은 항목은 flush()에서 제거)"""
+        key = self.make_key(job_url)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO descriptions (url, description, fetched_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, description, now, now)
+            )
+            self._pending_access.pop(key, None)
+            self._pending_expired.discard(key)
+            self._conn.commit()
+    
+    def flush(self):
+        """모아 둔 조회 시각 갱신과 만료 항목 삭제를 기록하고, 최대 개수를 넘으면 가장 오래 사용되지 않은 항목 제거"""
+        with self._lock:
+            self._flush()
+    
+    def _flush(self):
+        """flush 본체 (호출 측에서 잠금)"""
+        if self._pending_expired:
+            self._conn.executemany("DELETE FROM descriptions WHERE url = ?", [(key,) for key in self._pending_expired])
+        if self._pending_access:
+            self._conn.executemany(
+                "UPDATE descriptions SET last_access = ? WHERE url = ?",
+                [(accessed_at, key) for key, accessed_at in self._pending_access.items()]
+            )
+        self._conn.execute("""
+            DELETE FROM descriptions WHERE url IN (
+                SELECT url FROM descriptions ORDER BY last_access DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.max_entries,))
+        self._conn.commit()
+        self._pending_expired.clear()
+        self._pending_access.clear()
+    
+    def stats(self) -> dict:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "entries": entries,
+        }
+    
+    def close(self):
+        """모아 둔 변경을 기록하고 DB 연결 종료"""
+        with self._lock:
+            self._flush()
+            self._conn.close()
+
+_shared_cache: Optional[DescriptionCache] = None
+
+def get_description_cache() -> DescriptionCache:
+    """프로세스 전역에서 공유하는 상세 설명 캐시 반환"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = DescriptionCache()
+    return _shared_cache
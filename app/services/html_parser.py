@@ -0,0 +1,26 @@
+import re
+from typing import List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+
+# lxml이 설치되어 있으면 더 빠른 lxml 파서 사용
+try:
+    import lxml  # noqa: F401
+    PARSER_BACKEND = 'lxml'
+except ImportError:
+    PARSER_BACKEND = 'html.parser'
+
+def parse_elements(html: str, tag: str, class_name: str) -> List[Tag]:
+    """지정한 태그/클래스 요소만 파싱해 반환 (페이지 전체 트리를 만들지 않음)"""
+    # 파싱 단계에서는 class 속성이 분리되지 않은 문자열이므로 공백 단위로 매칭
+    class_pattern = re.compile(rf'(?:^|\s){re.escape(class_name)}(?:\s|$)')
+    strainer = SoupStrainer(tag, class_=class_pattern)
+    soup = BeautifulSoup(html, PARSER_BACKEND, parse_only=strainer)
+    return soup.find_all(tag, class_=class_name)
+
+def parse_first_text(html: str, tag: str, class_name: str) -> Optional[str]:
+    """지정한 태그/클래스의 첫 요소 텍스트 반환 (없으면 None)"""
+    elements = parse_elements(html, tag, class_name)
+    if elements:
+        return elements[0].get_text(strip=True)
+    return None
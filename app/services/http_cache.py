@@ -0,0 +1,123 @@
+import os
+import time
+from typing import Optional
+import httpx
+from app.utils.lru import LRUCache
+
+# 캐시 설정 (환경 변수로 조정 가능)
+HTTP_CACHE_TTL = float(os.getenv('HTTP_CACHE_TTL', '300'))
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv('HTTP_CACHE_MAX_ENTRIES', '500'))
+
+class CachedResponse:
+    """캐시된 응답 본문과 재검증용 헤더"""
+    
+    def __init__(self, text: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+        self.size = len(text.encode('utf-8'))
+        self.stored_at = time.time()
+    
+    @property
+    def age(self) -> float:
+        """저장 후 경과 시간 (초)"""
+        return time.time() - self.stored_at
+
+class HttpResponseCache:
+    """ETag/Last-Modified 기반 조건부 요청을 지원하는 응답 캐시 (LRU)
+    
+    TTL 이내의 응답은 네트워크 요청 없이 반환하고, TTL이 지나면
+    If-None-Match/If-Modified-Since 헤더로 재검증한다.
+    """
+    
+    def __init__(self, ttl: float = HTTP_CACHE_TTL, max_entries: int = HTTP_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "LRUCache[CachedResponse]" = LRUCache(max_entries)
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[dict] = None) -> str:
+        """URL과 쿼리 파라미터로 캐시 키 생성"""
+        return str(httpx.URL(url, params=params))
+    
+    async def fetch_text(self, client: httpx.AsyncClient, url: str, params: Optional[dict] = None) -> str:
+        """캐시를 거쳐 GET 요청 후 응답 본문 반환"""
+        key = self.make_key(url, params)
+        entry = self._entries.peek(key)
+        
+        if entry is not None and entry.age < self.ttl:
+            self._entries.touch(key)
+            self.hits += 1
+            return entry.text
+        
+        # 만료된 항목은 조건부 요청으로 재검증
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        
+        response = await client.get(url, params=params, headers=headers)
+        
+        if response.status_code == 304 and entry is not None:
+            entry.stored_at = time.time()
+            self._entries.touch(key)
+            self.revalidated += 1
+            return entry.text
+        
+        response.raise_for_status()
+        self.misses += 1
+        
+        if 'no-store' not in response.headers.get('Cache-Control', ''):
+            self._entries.put(key, CachedResponse(
+                response.text,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+            ))
+        return response.text
+    
+    def get_fresh(self, key: str) -> Optional[str]:
+        """TTL 이내의 캐시 본문 조회 (브라우저로 렌더링한 페이지 등)"""
+        entry = self._entries.peek(key)
+        if entry is None or entry.age >= self.ttl:
+            self.misses += 1
+            return None
+        self._entries.touch(key)
+        self.hits += 1
+        return entry.text
+    
+    def put(self, key: str, text: str):
+        """재검증 헤더 없이 본문 저장"""
+        self._entries.put(key, CachedResponse(text))
+    
+    def clear(self):
+        """캐시 비우기"""
+        self._entries.clear()
+    
+    def stats(self) -> dict:
+        """캐시 크기 조정을 위한 통계"""
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "bytes": sum(entry.size for entry in self._entries.values()),
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "evictions": self._entries.evictions,
+            "hit_rate": round((self.hits + self.revalidated) / lookups, 3) if lookups else 0.0,
+        }
+
+_shared_cache: Optional[HttpResponseCache] = None
+
+def get_response_cache() -> HttpResponseCache:
+    """프로세스 전역에서 공유하는 응답 캐시 반환"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = HttpResponseCache()
+    return _shared_cache
@@ -0,0 +1,48 @@
+import os
+from typing import Optional
+import httpx
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 커넥션 풀 설정 (환경 변수로 조정 가능)
+HTTP_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', '20'))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('HTTP_MAX_KEEPALIVE_CONNECTIONS', '10'))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv('HTTP_KEEPALIVE_EXPIRY', '30'))
+HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', '10'))
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+def create_http_client(
+    max_connections: int = HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections: int = HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+    timeout: float = HTTP_TIMEOUT,
+) -> httpx.AsyncClient:
+    """커넥션 풀을 사용하는 비동기 HTTP 클라이언트 생성"""
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    return httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        limits=limits,
+        timeout=timeout,
+        follow_redirects=True,
+    )
+
+def get_http_client() -> httpx.AsyncClient:
+    """프로세스 전역에서 공유하는 HTTP 클라이언트 반환"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = create_http_client()
+    return _shared_client
+
+async def close_http_client():
+    """공유 HTTP 클라이언트 종료"""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
@@ -1,80 +1,227 @@
 import asyncio
-from typing import List, Optional
-import requests
-from bs4 import BeautifulSoup
+import math
+from contextlib import aclosing
+from typing import AsyncIterator, List, Optional, Set
+import httpx
 from app.models.job import JobPosting
+from app.services.http_client import get_http_client
+from app.services.http_cache import HttpResponseCache, get_response_cache
+from app.services.html_parser import parse_elements
+from app.services.page_archive import PageArchive, get_page_archive
+from app.utils.job_id import make_job_id
 from datetime import datetime
-import urllib.parse
 
 class IndeedScraper:
     """Indeed 채용 공고 스크래퍼"""
     
-    def __init__(self):
-        self.base_url = "https://www.indeed.com/jobs"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+    # Indeed 검색 결과 한 페이지당 공고 수 (start= 오프셋 단위)
+    PAGE_SIZE = 10
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        max_concurrent_pages: int = 4,
+        response_cache: Optional[HttpResponseCache] = None,
+        archive: Optional[PageArchive] = None,
+    ):
+        self.base_url = base_url or "https://www.indeed.com/jobs"
+        self._client = client
+        self._response_cache = response_cache
+        self._archive = archive
+        self.max_concurrent_pages = max_concurrent_pages
+        self._page_semaphore: Optional[asyncio.Semaphore] = None
+        self._page_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """요청에 사용할 HTTP 클라이언트 (기본: 공유 커넥션 풀)"""
+        return self._client or get_http_client()
+    
+    @property
+    def response_cache(self) -> HttpResponseCache:
+        """검색 결과 페이지 응답 캐시 (기본: 공유 캐시)"""
+        return self._response_cache or get_response_cache()
+    
+    @property
+    def archive(self) -> PageArchive:
+        """페이지 기록/재생 저장소 (기본: 환경 변수 설정)"""
+        return self._archive or get_page_archive()
     
-    async def search(self, keyword: str, location: Optional[str] = None, max_results: int = 20) -> List[JobPosting]:
-        """Indeed에서 채용 공고 검색"""
+    @property
+    def page_semaphore(self) -> asyncio.Semaphore:
+        """검색 결과 페이지 동시 요청 제한 (동시에 실행되는 모든 검색이 공유, 이벤트 루프마다 하나 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._page_semaphore is None or self._page_semaphore_loop is not loop:
+            self._page_semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+            self._page_semaphore_loop = loop
+        return self._page_semaphore
+    
+    async def search(
+        self,
+        keyword: str,
+        location: Optional[str] = None,
+        max_results: int = 20,
+        paginate: bool = True,
+    ) -> List[JobPosting]:
+        """Indeed에서 채용 공고 검색 (오류가 나면 출력하고 그때까지 모은 결과 반환)"""
+        jobs = []
         try:
-            # 검색 파라미터 구성
-            params = {
-                'q': keyword,
-                'limit': max_results
-            }
-            if location:
-                params['l'] = location
-            
-            url = f"{self.base_url}?{urllib.parse.urlencode(params)}"
-            
-            # HTTP 요청
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            jobs = []
-            
-            # Indeed 채용 공고 요소 찾기
-            job_cards = soup.find_all('div', class_='job_seen_beacon')[:max_results]
-            
-            for idx, card in enumerate(job_cards):
-                try:
-                    title_elem = card.find('h2', class_='jobTitle')
-                    company_elem = card.find('span', class_='companyName')
-                    location_elem = card.find('div', class_='companyLocation')
-                    link_elem = card.find('a', class_='jcs-JobTitle')
-                    summary_elem = card.find('div', class_='job-snippet')
-                    
-                    if title_elem and company_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True)
-                        location_text = location_elem.get_text(strip=True) if location_elem else None
-                        summary = summary_elem.get_text(strip=True) if summary_elem else ""
-                        
-                        # 링크 구성
-                        link = link_elem.get('href', '') if link_elem else ''
-                        if link and not link.startswith('http'):
-                            link = f"https://www.indeed.com{link}"
-                        
-                        job = JobPosting(
-                            id=f"indeed_{idx}",
-                            title=title,
-                            company=company,
-                            location=location_text,
-                            description=summary,
-                            url=link,
-                            source="indeed",
-                            posted_date=datetime.now()
-                        )
-                        jobs.append(job)
-                except Exception as e:
-                    print(f"채용 공고 파싱 오류: {e}")
-                    continue
-            
-            return jobs
-            
+            async with aclosing(self.search_iter(keyword, location, max_results, paginate)) as pages:
+                async for page_jobs in pages:
+                    jobs.extend(page_jobs)
         except Exception as e:
             print(f"Indeed 검색 오류: {e}")
-            return []
-
+        return jobs[:max_results]
+    
+    async def search_iter(
+        self,
+        keyword: str,
+        location: Optional[str] = None,
+        max_results: int = 20,
+        paginate: bool = True,
+        known_ids: Optional[Set[str]] = None,
+        seen_known_ids: Optional[Set[str]] = None,
+    ) -> AsyncIterator[List[JobPosting]]:
+        """검색 결과를 페이지 단위로 생성하는 비동기 제너레이터
+        
+        known_ids가 주어지면 최신순(sort=date)으로 검색해 페이지를 순서대로 하나씩 가져오고,
+        이미 알고 있는 공고는 제외하며 알고 있는 공고만 있는 페이지에서 중단한다 (이후 페이지는 요청하지 않음).
+        제외한 공고 중 이번 검색에서 다시 본 공고의 ID는 seen_known_ids에 추가한다.
+        페이지 요청이 실패하면 예외를 그대로 전달한다 (호출한 쪽에서 소스 오류로 처리).
+        """
+        known_ids = known_ids or set()
+        seen_known_ids = seen_known_ids if seen_known_ids is not None else set()
+        # 검색 파라미터 구성
+        params = {
+            'q': keyword,
+            'limit': max_results
+        }
+        if location:
+            params['l'] = location
+        if known_ids:
+            # 알고 있는 공고에서 멈추려면 새 공고가 앞에 오는 최신순이어야 함 (기본은 관련도순)
+            params['sort'] = 'date'
+        
+        if not paginate or max_results <= self.PAGE_SIZE:
+            cards = await self._fetch_page(params)
+            page_jobs = self._parse_cards(cards[:max_results])
+            seen_known_ids.update(job.id for job in page_jobs if job.id in known_ids)
+            yield [job for job in page_jobs if job.id not in known_ids]
+            return
+        
+        async with aclosing(self._iter_pages(params, max_results, known_ids, seen_known_ids)) as pages:
+            async for page_jobs in pages:
+                yield page_jobs
+    
+    async def _iter_pages(
+        self, params: dict, max_results: int, known_ids: Set[str], seen_known_ids: Set[str]
+    ) -> AsyncIterator[List[JobPosting]]:
+        """필요한 start= 오프셋을 계산해 여러 페이지 가져오기 (페이지 요청이 실패하면 예외 전달)"""
+        offsets = [page * self.PAGE_SIZE for page in range(math.ceil(max_results / self.PAGE_SIZE))]
+        collected = 0
+        seen_ids = set()
+        # 증분 수집은 앞 페이지에서 멈출 수 있으므로 한 페이지씩 순서대로 요청
+        pages = self._fetch_pages(params, offsets, in_order=bool(known_ids))
+        async with aclosing(pages):
+            # 오프셋 순서대로 결과를 확인하고, 빈 페이지나 중복(또는 이미 알고 있는 공고)만 있는 페이지에서 중단
+            async for cards in pages:
+                page_jobs = self._parse_cards(cards)
+                seen_known_ids.update(job.id for job in page_jobs if job.id in known_ids)
+                new_jobs = [job for job in page_jobs if job.id not in seen_ids and job.id not in known_ids]
+                if not new_jobs:
+                    break
+                
+                for job in new_jobs:
+                    seen_ids.add(job.id)
+                new_jobs = new_jobs[:max_results - collected]
+                collected += len(new_jobs)
+                yield new_jobs
+                if collected >= max_results:
+                    break
+    
+    async def _fetch_pages(self, params: dict, offsets: List[int], in_order: bool = False) -> AsyncIterator[list]:
+        """오프셋 순서대로 페이지별 카드 목록 생성
+        
+        in_order면 앞 페이지를 넘겨준 뒤에 다음 페이지를 요청하고, 아니면 모든 페이지를 동시에 요청한다.
+        """
+        if in_order:
+            for offset in offsets:
+                yield await self._fetch_page({**params, 'start': offset})
+            return
+        
+        semaphore = self.page_semaphore
+        
+        async def fetch(offset: int) -> list:
+            async with semaphore:
+                return await self._fetch_page({**params, 'start': offset})
+        
+        tasks = [asyncio.create_task(fetch(offset)) for offset in offsets]
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            # 아직 대기 중인 페이지 요청을 취소하고, 이미 실패한 요청까지 모두 회수
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _fetch_html(self, params: dict) -> str:
+        """검색 결과 페이지 HTML 가져오기 (재생 모드면 아카이브에서 제공)"""
+        url = self.response_cache.make_key(self.base_url, params)
+        if self.archive.replaying:
+            return self.archive.load(url) or ""
+        
+        # HTTP 요청 (응답 캐시를 거친 비동기 요청)
+        page_source = await self.response_cache.fetch_text(self.client, self.base_url, params)
+        if self.archive.recording:
+            self.archive.save(url, page_source)
+        return page_source
+    
+    async def _fetch_page(self, params: dict) -> list:
+        """검색 결과 페이지 하나를 가져와 채용 공고 카드 요소 반환"""
+        page_source = await self._fetch_html(params)
+        
+        # Indeed 채용 공고 요소만 파싱
+        return parse_elements(page_source, 'div', 'job_seen_beacon')
+    
+    def _parse_cards(self, job_cards: list) -> List[JobPosting]:
+        """채용 공고 카드 요소를 JobPosting 목록으로 변환"""
+        jobs = []
+        
+        for card in job_cards:
+            try:
+                title_elem = card.find('h2', class_='jobTitle')
+                company_elem = card.find('span', class_='companyName')
+                location_elem = card.find('div', class_='companyLocation')
+                link_elem = card.find('a', class_='jcs-JobTitle')
+                summary_elem = card.find('div', class_='job-snippet')
+                
+                if title_elem and company_elem:
+                    title = title_elem.get_text(strip=True)
+                    company = company_elem.get_text(strip=True)
+                    location_text = location_elem.get_text(strip=True) if location_elem else None
+                    summary = summary_elem.get_text(strip=True) if summary_elem else ""
+                    
+                    # 링크 구성
+                    link = link_elem.get('href', '') if link_elem else ''
+                    if link and not link.startswith('http'):
+                        link = f"https://www.indeed.com{link}"
+                    
+                    job = JobPosting(
+                        id=make_job_id("indeed", link, fallback=f"{title}|{company}|{location_text or ''}"),
+                        title=title,
+                        company=company,
+                        location=location_text,
+                        description=summary,
+                        url=link,
+                        source="indeed",
+                        posted_date=datetime.now()
+                    )
+                    jobs.append(job)
+            except Exception as e:
+                print(f"채용 공고 파싱 오류: {e}")
+                continue
+        
+        return jobs
@@ -0,0 +1,139 @@
+import os
+import hashlib
+from typing import Dict, List
+from app.models.job import JobPosting
+from app.services.skill_matcher import get_skill_matcher
+from app.services.job_store import get_job_store
+from app.utils.lru import LRUCache
+
+# 캐시 설정 (환경 변수로 조정 가능)
+JOB_FEATURE_CACHE_MAX_ENTRIES = int(os.getenv('JOB_FEATURE_CACHE_MAX_ENTRIES', '20000'))
+
+# 특징 계산 방식이 바뀌면 올려서 저장된 특징을 무효화
+FEATURE_VERSION = 1
+
+# 경력 수준/학력 요구사항 판단 키워드 (공고 설명에서 검색)
+SENIOR_KEYWORDS = ['senior', 'lead', 'manager', '5+', '10+']
+JUNIOR_KEYWORDS = ['junior', 'entry', '0-2', '1-3']
+EDUCATION_KEYWORDS = ['bachelor', 'master', 'phd', 'degree', 'university', 'college']
+
+def content_hash(job: JobPosting) -> str:
+    """공고 내용(제목, 설명)과 특징 계산 방식(버전, 스킬 사전)의 해시"""
+    basis = f"{FEATURE_VERSION}\n{get_skill_matcher().signature}\n{job.title}\n{job.description}"
+    return hashlib.sha1(basis.encode('utf-8')).hexdigest()
+
+class JobFeatures:
+    """적합도 계산에 쓰는 채용 공고 쪽 특징 (공고 내용당 한 번만 계산해 모든 이력서에 재사용)"""
+    
+    def __init__(
+        self,
+        content_hash: str,
+        full_text: str,
+        skills: List[str],
+        is_senior: bool,
+        is_junior: bool,
+        requires_education: bool,
+    ):
+        self.content_hash = content_hash
+        self.full_text = full_text  # 소문자로 정규화한 제목 + 설명
+        self.words = set(full_text.split())
+        self.skills = set(skills)  # 공고에 나오는 사전 스킬 (대표 이름 소문자)
+        self.is_senior = is_senior
+        self.is_junior = is_junior
+        self.requires_education = requires_education
+    
+    @classmethod
+    def from_job(cls, job: JobPosting) -> "JobFeatures":
+        """채용 공고에서 특징 계산"""
+        full_text = (job.title + " " + job.description).lower()
+        description = job.description.lower()
+        return cls(
+            content_hash=content_hash(job),
+            full_text=full_text,
+            skills=[skill.lower() for skill in get_skill_matcher().find(full_text)],
+            is_senior=any(kw in description for kw in SENIOR_KEYWORDS),
+            is_junior=any(kw in description for kw in JUNIOR_KEYWORDS),
+            requires_education=any(kw in description for kw in EDUCATION_KEYWORDS),
+        )
+    
+    def to_dict(self) -> dict:
+        """저장용 dict (단어 집합은 정규화 텍스트에서 다시 만듦)"""
+        return {
+            "full_text": self.full_text,
+            "skills": sorted(self.skills),
+            "is_senior": self.is_senior,
+            "is_junior": self.is_junior,
+            "requires_education": self.requires_education,
+        }
+    
+    @classmethod
+    def from_dict(cls, content_hash: str, data: dict) -> "JobFeatures":
+        """저장된 dict에서 복원"""
+        return cls(content_hash=content_hash, **data)
+
+class JobFeatureCache:
+    """공고 ID + 내용 해시 기준 채용 공고 특징 캐시 (메모리 LRU, 선택적으로 공고 저장소에 영구 저장)
+    
+    공고 내용이 바뀌면 해시가 달라져 다시 계산한다.
+    """
+    
+    def __init__(self, max_entries: int = JOB_FEATURE_CACHE_MAX_ENTRIES, persistent: bool = False):
+        self.max_entries = max_entries
+        self.persistent = persistent
+        self._entries: "LRUCache[JobFeatures]" = LRUCache(max_entries)
+        self.hits = 0
+        self.loaded = 0
+        self.computed = 0
+    
+    def get(self, job: JobPosting) -> JobFeatures:
+        """공고 하나의 특징 반환"""
+        return self.get_many([job])[0]
+    
+    def get_many(self, jobs: List[JobPosting]) -> List[JobFeatures]:
+        """여러 공고의 특징 반환 (메모리 -> 저장소 -> 새로 계산 순, 입력 순서대로)"""
+        hashes = [content_hash(job) for job in jobs]
+        features: Dict[int, JobFeatures] = {}
+        missing = []
+        for index, (job, job_hash) in enumerate(zip(jobs, hashes)):
+            cached = self._entries.peek(job.id)
+            if cached is not None and cached.content_hash == job_hash:
+                self._entries.touch(job.id)
+                self.hits += 1
+                features[index] = cached
+            else:
+                missing.append(index)
+        
+        if missing and self.persistent:
+            stored = get_job_store().load_job_features([jobs[index].id for index in missing])
+            still_missing = []
+            for index in missing:
+                entry = stored.get(jobs[index].id)
+                if entry is not None and entry[0] == hashes[index]:
+                    features[index] = JobFeatures.from_dict(*entry)
+                    self._entries.put(jobs[index].id, features[index])
+                    self.loaded += 1
+                else:
+                    still_missing.append(index)
+            missing = still_missing
+        
+        computed = {}
+        for index in missing:
+            features[index] = JobFeatures.from_job(jobs[index])
+            self._entries.put(jobs[index].id, features[index])
+            computed[jobs[index].id] = features[index]
+            self.computed += 1
+        
+        if computed and self.persistent:
+            get_job_store().save_job_features(computed)
+        
+        return [features[index] for index in range(len(jobs))]
+    
+    def stats(self) -> dict:
+        """캐시 통계"""
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "loaded": self.loaded,
+            "computed": self.computed,
+        }
@@ -1,42 +1,218 @@
 import asyncio
-from typing import List
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
 from app.models.job import JobPosting, JobSearchRequest
 from app.services.linkedin_scraper import LinkedInScraper
 from app.services.indeed_scraper import IndeedScraper
+from app.services.dedup import NearDuplicateIndex, dedupe_jobs
+from app.services.singleflight import SingleFlight
+from app.services.result_cache import SearchResultCache
+
+class SearchOutcome:
+    """검색 결과와 소스별 상태 ("ok", "timeout", "error") 및 캐시 상태 ("fresh", "stale", "miss")"""
+    
+    def __init__(
+        self,
+        jobs: List[JobPosting],
+        source_status: Dict[str, str],
+        partial: bool = False,
+        cache_status: str = "miss",
+    ):
+        self.jobs = jobs
+        self.source_status = source_status
+        self.partial = partial
+        self.cache_status = cache_status
+    
+    def with_cache_status(self, cache_status: str) -> "SearchOutcome":
+        """캐시 상태만 바꾼 결과 (캐시된 원본은 그대로 유지)"""
+        return SearchOutcome(self.jobs, self.source_status, self.partial, cache_status)
 
 class JobSearchService:
     """채용 공고 검색 서비스"""
     
-    def __init__(self):
-        self.linkedin_scraper = LinkedInScraper()
-        self.indeed_scraper = IndeedScraper()
+    def __init__(
+        self,
+        linkedin_scraper: Optional[LinkedInScraper] = None,
+        indeed_scraper: Optional[IndeedScraper] = None,
+        result_cache: Optional[SearchResultCache] = None,
+    ):
+        self.linkedin_scraper = linkedin_scraper or LinkedInScraper()
+        self.indeed_scraper = indeed_scraper or IndeedScraper()
+        self.search_flight = SingleFlight()
+        self.result_cache = result_cache or SearchResultCache()
+        self._refresh_tasks = set()
     
     async def search_jobs(self, request: JobSearchRequest) -> List[JobPosting]:
         """여러 소스에서 채용 공고 검색"""
-        all_jobs = []
-        tasks = []
+        outcome = await self.search_jobs_with_status(request)
+        return outcome.jobs
+    
+    @staticmethod
+    def request_key(request: JobSearchRequest) -> Tuple:
+        """검색 결과가 같은 요청끼리 같은 값이 되도록 정규화한 요청 키"""
+        return (
+            " ".join(request.keyword.lower().split()),
+            " ".join((request.location or "").lower().split()),
+            request.max_results,
+            tuple(sorted(set(request.sources))),
+            request.deadline_ms,
+        )
+    
+    async def search_jobs_with_status(self, request: JobSearchRequest) -> SearchOutcome:
+        """여러 소스에서 채용 공고 검색 (deadline_ms 초과 시 수집된 부분 결과와 소스별 상태 반환)
+        
+        캐시된 결과가 있으면 바로 반환하고, 만료된(stale) 결과는 반환과 동시에 백그라운드로 갱신한다.
+        같은 요청이 동시에 들어오면 스크래핑은 한 번만 하고 결과를 함께 사용한다.
+        """
+        key = self.request_key(request)
+        cached, cache_status = self.result_cache.get(key)
+        if cached is not None:
+            if cache_status == "stale":
+                self._schedule_refresh(key, request)
+            return cached.with_cache_status(cache_status)
+        
+        outcome = await self.search_flight.do(key, lambda: self._search_and_store(key, request))
+        return outcome.with_cache_status("miss")
+    
+    def _schedule_refresh(self, key: Tuple, request: JobSearchRequest):
+        """만료된 캐시 결과를 백그라운드에서 갱신 (이미 같은 검색이 실행 중이면 합류)"""
+        async def refresh():
+            try:
+                await self.search_flight.do(key, lambda: self._search_and_store(key, request))
+            except Exception as e:
+                print(f"검색 결과 갱신 중 오류 발생: {e}")
+        
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    async def _search_and_store(self, key: Tuple, request: JobSearchRequest) -> SearchOutcome:
+        """검색 후 모든 소스가 정상 완료된 결과만 캐시에 저장 (오류/시간 초과 소스가 있으면 저장하지 않음)"""
+        outcome = await self._search(request)
+        if all(status == "ok" for status in outcome.source_status.values()):
+            self.result_cache.put(key, outcome)
+        return outcome
+    
+    async def search_new_jobs(
+        self, request: JobSearchRequest, known_ids: Set[str], seen_known_ids: Optional[Set[str]] = None
+    ) -> List[JobPosting]:
+        """이미 알고 있는 공고(known_ids)를 제외한 새 공고만 검색 (증분 수집용, 결과 캐시 미사용)
+        
+        검색 결과에 다시 나온 알고 있는 공고의 ID는 seen_known_ids에 추가한다.
+        """
+        outcome = await self._search(request, known_ids, seen_known_ids)
+        return outcome.jobs
+    
+    async def _search(
+        self,
+        request: JobSearchRequest,
+        known_ids: Optional[Set[str]] = None,
+        seen_known_ids: Optional[Set[str]] = None,
+    ) -> SearchOutcome:
+        """소스별 스크래핑 실행 및 결과 병합"""
+        iterators = self._source_iterators(request, known_ids, seen_known_ids)
+        collected: Dict[str, List[JobPosting]] = {source: [] for source in iterators}
+        
+        async def collect(source: str, iterator):
+            async with aclosing(iterator) as batches:
+                async for batch in batches:
+                    collected[source].extend(batch)
         
+        tasks = {source: asyncio.create_task(collect(source, iterator)) for source, iterator in iterators.items()}
+        source_status: Dict[str, str] = {}
+        
+        if tasks:
+            timeout = request.deadline_ms / 1000 if request.deadline_ms else None
+            _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+            
+            # 제한 시간 안에 끝나지 않은 소스는 취소하고 그때까지 모은 결과만 사용
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            
+            for source, task in tasks.items():
+                if task in pending:
+                    source_status[source] = "timeout"
+                elif task.exception() is not None:
+                    print(f"검색 중 오류 발생: {task.exception()}")
+                    source_status[source] = "error"
+                else:
+                    source_status[source] = "ok"
+        
+        all_jobs = [job for jobs in collected.values() for job in jobs]
+        
+        # 중복 제거 (공고 ID 및 내용 유사도 기준)
+        unique_jobs = dedupe_jobs(all_jobs)
+        
+        return SearchOutcome(
+            jobs=unique_jobs[:request.max_results],
+            source_status=source_status,
+            partial=any(status != "ok" for status in source_status.values())
+        )
+    
+    def _source_iterators(
+        self,
+        request: JobSearchRequest,
+        known_ids: Optional[Set[str]] = None,
+        seen_known_ids: Optional[Set[str]] = None,
+    ) -> Dict[str, AsyncIterator[List[JobPosting]]]:
+        """요청된 소스별 검색 결과 비동기 제너레이터"""
+        iterators = {}
         if "linkedin" in request.sources:
-            tasks.append(self.linkedin_scraper.search(request.keyword, request.location, request.max_results))
+            iterators["linkedin"] = self.linkedin_scraper.search_iter(
+                request.keyword, request.location, request.max_results,
+                known_ids=known_ids, seen_known_ids=seen_known_ids
+            )
         
         if "indeed" in request.sources:
-            tasks.append(self.indeed_scraper.search(request.keyword, request.location, request.max_results))
+            iterators["indeed"] = self.indeed_scraper.search_iter(
+                request.keyword, request.location, request.max_results,
+                known_ids=known_ids, seen_known_ids=seen_known_ids
+            )
         
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for result in results:
-                if isinstance(result, list):
-                    all_jobs.extend(result)
-                elif isinstance(result, Exception):
-                    print(f"검색 중 오류 발생: {result}")
-        
-        # 중복 제거 (URL 기준)
-        seen_urls = set()
-        unique_jobs = []
-        for job in all_jobs:
-            if job.url not in seen_urls:
-                seen_urls.add(job.url)
-                unique_jobs.append(job)
-        
-        return unique_jobs[:request.max_results]
-
+        return iterators
+    
+    async def stream_jobs(self, request: JobSearchRequest) -> AsyncIterator[JobPosting]:
+        """소스별 결과가 나오는 대로 채용 공고를 생성하는 비동기 제너레이터 (공고 ID 및 유사 중복 제거)"""
+        iterators = self._source_iterators(request).values()
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        
+        async def pump(iterator):
+            try:
+                async with aclosing(iterator) as batches:
+                    async for batch in batches:
+                        await queue.put(batch)
+            except Exception as e:
+                print(f"검색 중 오류 발생: {e}")
+            finally:
+                await queue.put(done)
+        
+        tasks = [asyncio.create_task(pump(iterator)) for iterator in iterators]
+        remaining = len(tasks)
+        near_duplicates = NearDuplicateIndex()
+        count = 0
+        try:
+            while remaining and count < request.max_results:
+                batch = await queue.get()
+                if batch is done:
+                    remaining -= 1
+                    continue
+                
+                for job in batch:
+                    if near_duplicates.add(job.id, job) is not None:
+                        continue
+                    yield job
+                    count += 1
+                    if count >= request.max_results:
+                        break
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def close(self):
+        """백그라운드 갱신 작업과 스크래퍼 리소스(브라우저 풀) 정리"""
+        for task in list(self._refresh_tasks):
+            task.cancel()
+        self.linkedin_scraper.close()
@@ -0,0 +1,440 @@
+import os
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import (
+    Column, DateTime, Float, Index, Integer, MetaData, String, Table, Text,
+    create_engine, event, func, select, text,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from app.models.job import JobPosting
+from app.models.matching import MatchScore
+from app.models.resume import ResumeData
+
+# 저장소 설정 (환경 변수로 조정 가능)
+DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///data/jobs.db')
+
+# 한 번의 INSERT 문에 넣을 최대 행 수 (SQLite 바인드 변수 제한 대비)
+UPSERT_BATCH_SIZE = 500
+
+metadata = MetaData()
+
+# seq는 전문 검색 인덱스(jobs_fts)의 rowid로 쓰는 정수 키 (VACUUM 후에도 바뀌지 않음)
+jobs_table = Table(
+    'jobs', metadata,
+    Column('seq', Integer, primary_key=True),
+    Column('id', String, nullable=False, unique=True),
+    Column('source', String, nullable=False),
+    Column('title', Text, nullable=False),
+    Column('company', Text, nullable=False),
+    Column('location', Text),
+    Column('description', Text, nullable=False, default=''),
+    Column('url', Text, nullable=False),
+    Column('posted_date', DateTime),
+    Column('salary', Text),
+    Column('job_type', String),
+    Column('first_seen', DateTime, nullable=False),
+    Column('last_seen', DateTime, nullable=False),
+    Index('idx_jobs_source', 'source'),
+    Index('idx_jobs_company', 'company'),
+    Index('idx_jobs_location', 'location'),
+    Index('idx_jobs_first_seen', 'first_seen'),
+    Index('idx_jobs_last_seen', 'last_seen'),
+)
+
+resumes_table = Table(
+    'resumes', metadata,
+    Column('file_id', String, primary_key=True),
+    Column('filename', Text, nullable=False),
+    Column('file_path', Text, nullable=False),
+    Column('resume_data', Text, nullable=False),  # ResumeData JSON
+    Column('created_at', DateTime, nullable=False),
+)
+
+match_results_table = Table(
+    'match_results', metadata,
+    Column('resume_id', String, primary_key=True),
+    Column('job_id', String, primary_key=True),
+    Column('overall_score', Float, nullable=False),
+    Column('match_score', Text, nullable=False),  # MatchScore JSON
+    Column('created_at', DateTime, nullable=False),
+    Index('idx_match_results_score', 'resume_id', 'overall_score'),
+)
+
+# 적합도 계산용 공고 특징 (app/services/job_features.py, 내용 해시가 같을 때만 재사용)
+job_features_table = Table(
+    'job_features', metadata,
+    Column('job_id', String, primary_key=True),
+    Column('content_hash', String, nullable=False),
+    Column('features', Text, nullable=False),  # JobFeatures.to_dict() JSON
+    Column('computed_at', DateTime, nullable=False),
+)
+
+JOB_FIELDS = ('id', 'source', 'title', 'company', 'location', 'description', 'url', 'posted_date', 'salary', 'job_type')
+
+# 제목/회사/설명 전문 검색 인덱스 (jobs 테이블을 원본으로 하는 FTS5 외부 콘텐츠 테이블, 트리거로 동기화)
+FULLTEXT_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, company, description,
+        content='jobs', content_rowid='seq', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, company, description)
+        VALUES (new.seq, new.title, new.company, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.seq, old.title, old.company, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, description ON jobs
+    WHEN old.title IS NOT new.title OR old.company IS NOT new.company OR old.description IS NOT new.description
+    BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.seq, old.title, old.company, old.description);
+        INSERT INTO jobs_fts(rowid, title, company, description)
+        VALUES (new.seq, new.title, new.company, new.description);
+    END
+    """,
+]
+
+# 검색 순위 가중치 (bm25: 제목, 회사, 설명 순)
+FULLTEXT_WEIGHTS = (10.0, 5.0, 1.0)
+
+class JobStore:
+    """채용 공고, 파싱된 이력서, 적합도 분석 결과를 저장하는 영구 저장소 (SQLAlchemy)
+    
+    크롤러와 API(여러 uvicorn 워커 포함)가 같은 데이터베이스를 공유한다.
+    SQLite 전용 기능(upsert, FTS5 전문 검색)을 사용하므로 sqlite URL만 지원한다.
+    """
+    
+    def __init__(self, url: str = DATABASE_URL):
+        self.url = url
+        database_url = make_url(url)
+        if database_url.get_backend_name() != 'sqlite':
+            raise ValueError(f"DATABASE_URL은 sqlite URL이어야 합니다 (예: sqlite:///data/jobs.db): {url}")
+        if database_url.database and database_url.database != ':memory:':
+            Path(database_url.database).parent.mkdir(parents=True, exist_ok=True)
+        
+        self.engine = create_engine(url, connect_args={'check_same_thread': False})
+        event.listen(self.engine, 'connect', self._configure_sqlite)
+        metadata.create_all(self.engine)
+        # 기존 데이터베이스에는 나중에 추가된 인덱스가 없으므로 따로 생성
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+        self._create_fulltext_index()
+    
+    @staticmethod
+    def _configure_sqlite(dbapi_connection, _):
+        """여러 프로세스가 동시에 읽고 쓸 수 있도록 WAL 모드 사용"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+    
+    def _create_fulltext_index(self):
+        """전문 검색 인덱스와 동기화 트리거 생성 (인덱스가 새로 생기면 기존 공고로 채움)"""
+        with self.engine.begin() as conn:
+            exists = conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'")).first()
+            for statement in FULLTEXT_DDL:
+                conn.execute(text(statement))
+            if not exists:
+                conn.execute(text("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')"))
+    
+    # 채용 공고
+    
+    def upsert_jobs(self, jobs: Iterable[JobPosting], seen_at: Optional[datetime] = None) -> int:
+        """채용 공고 일괄 저장 (이미 있으면 내용과 last_seen 갱신, first_seen은 유지)"""
+        seen_at = seen_at or datetime.now()
+        rows = [
+            {**{field: getattr(job, field) for field in JOB_FIELDS}, 'first_seen': seen_at, 'last_seen': seen_at}
+            for job in jobs
+        ]
+        if not rows:
+            return 0
+        
+        with self.engine.begin() as conn:
+            for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+                statement = sqlite_insert(jobs_table).values(rows[start:start + UPSERT_BATCH_SIZE])
+                conn.execute(statement.on_conflict_do_update(
+                    index_elements=[jobs_table.c.id],
+                    set_={
+                        **{field: statement.excluded[field] for field in JOB_FIELDS if field != 'id'},
+                        'last_seen': statement.excluded.last_seen,
+                    }
+                ))
+        return len(rows)
+    
+    def get_job(self, job_id: str) -> Optional[JobPosting]:
+        """공고 ID로 채용 공고 조회"""
+        with self.engine.connect() as conn:
+            row = conn.execute(select(jobs_table).where(jobs_table.c.id == job_id)).mappings().first()
+        return self._to_job(row) if row else None
+    
+    def get_jobs(self, job_ids: List[str]) -> List[JobPosting]:
+        """여러 공고 ID로 채용 공고 일괄 조회 (요청 순서 유지, 없는 ID는 제외)"""
+        found = {}
+        with self.engine.connect() as conn:
+            for start in range(0, len(job_ids), UPSERT_BATCH_SIZE):
+                chunk = job_ids[start:start + UPSERT_BATCH_SIZE]
+                for row in conn.execute(select(jobs_table).where(jobs_table.c.id.in_(chunk))).mappings():
+                    found[row['id']] = self._to_job(row)
+        return [found[job_id] for job_id in job_ids if job_id in found]
+    
+    def query_jobs(
+        self,
+        source: Optional[str] = None,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        seen_since: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[JobPosting]:
+        """조건에 맞는 채용 공고 조회 (최근에 확인된 순)"""
+        query = select(jobs_table)
+        if source:
+            query = query.where(jobs_table.c.source == source)
+        if company:
+            query = query.where(jobs_table.c.company == company)
+        if location:
+            query = query.where(jobs_table.c.location == location)
+        if seen_since:
+            query = query.where(jobs_table.c.last_seen >= seen_since)
+        query = query.order_by(jobs_table.c.last_seen.desc(), jobs_table.c.id).limit(limit).offset(offset)
+        
+        with self.engine.connect() as conn:
+            return [self._to_job(row) for row in conn.execute(query).mappings()]
+    
+    def count_jobs(self) -> int:
+        """저장된 채용 공고 수"""
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(jobs_table)).scalar_one()
+    
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        """사용자 검색어를 FTS5 MATCH 식으로 변환 (모든 단어 포함, 끝의 *는 접두어 검색)"""
+        terms = []
+        for term in query.split():
+            prefix = term.endswith('*')
+            term = term.rstrip('*').replace('"', '""')
+            if term:
+                terms.append(f'"{term}"*' if prefix else f'"{term}"')
+        return " ".join(terms)
+    
+    def search_jobs(
+        self,
+        query: str,
+        source: Optional[str] = None,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        seen_since: Optional[datetime] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Tuple[int, List[Dict]]:
+        """전문 검색 (bm25 순위, 회사/지역은 부분 일치 필터)
+        
+        (전체 결과 수, [{"job", "score", "snippet"}]) 반환
+        """
+        match = self._match_expression(query)
+        if not match:
+            return 0, []
+        
+        conditions = ["jobs_fts MATCH :match"]
+        params = {'match': match}
+        if source:
+            conditions.append("jobs.source = :source")
+            params['source'] = source
+        if company:
+            conditions.append("jobs.company LIKE :company")
+            params['company'] = f"%{company}%"
+        if location:
+            conditions.append("jobs.location LIKE :location")
+            params['location'] = f"%{location}%"
+        if seen_since:
+            conditions.append("jobs.last_seen >= :seen_since")
+            params['seen_since'] = seen_since
+        
+        source_sql = f"FROM jobs_fts JOIN jobs ON jobs.seq = jobs_fts.rowid WHERE {' AND '.join(conditions)}"
+        weights = ", ".join(str(weight) for weight in FULLTEXT_WEIGHTS)
+        
+        with self.engine.connect() as conn:
+            total = conn.execute(text(f"SELECT count(*) {source_sql}"), params).scalar_one()
+            rows = conn.execute(
+                text(
+                    f"SELECT jobs.*, bm25(jobs_fts, {weights}) AS score, "
+                    f"snippet(jobs_fts, 2, '<mark>', '</mark>', '…', 16) AS snippet "
+                    f"{source_sql} ORDER BY score LIMIT :limit OFFSET :offset"
+                ),
+                {**params, 'limit': limit, 'offset': offset}
+            ).mappings().all()
+        
+        # bm25는 관련도가 높을수록 작은(음수) 값이므로 부호를 바꿔 반환
+        return total, [
+            {"job": self._to_job(row), "score": round(-row['score'], 4), "snippet": row['snippet']}
+            for row in rows
+        ]
+    
+    @staticmethod
+    def _to_job(row) -> JobPosting:
+        """jobs 행을 JobPosting으로 변환"""
+        return JobPosting(**{field: row[field] for field in JOB_FIELDS})
+    
+    # 공고 특징
+    
+    def load_job_features(self, job_ids: List[str]) -> Dict[str, Tuple[str, dict]]:
+        """저장된 공고 특징 조회 ({job_id: (content_hash, features dict)})"""
+        found = {}
+        with self.engine.connect() as conn:
+            for start in range(0, len(job_ids), UPSERT_BATCH_SIZE):
+                chunk = job_ids[start:start + UPSERT_BATCH_SIZE]
+                query = select(job_features_table).where(job_features_table.c.job_id.in_(chunk))
+                for row in conn.execute(query).mappings():
+                    found[row['job_id']] = (row['content_hash'], json.loads(row['features']))
+        return found
+    
+    def save_job_features(self, features: Dict) -> int:
+        """공고 특징 일괄 저장 ({job_id: JobFeatures}, 이미 있으면 덮어쓰기)"""
+        now = datetime.now()
+        rows = [
+            {
+                'job_id': job_id,
+                'content_hash': job_features.content_hash,
+                'features': json.dumps(job_features.to_dict(), ensure_ascii=False),
+                'computed_at': now,
+            }
+            for job_id, job_features in features.items()
+        ]
+        if not rows:
+            return 0
+        
+        with self.engine.begin() as conn:
+            for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+                statement = sqlite_insert(job_features_table).values(rows[start:start + UPSERT_BATCH_SIZE])
+                conn.execute(statement.on_conflict_do_update(
+                    index_elements=[job_features_table.c.job_id],
+                    set_={
+                        'content_hash': statement.excluded.content_hash,
+                        'features': statement.excluded.features,
+                        'computed_at': statement.excluded.computed_at,
+                    }
+                ))
+        return len(rows)
+    
+    # 이력서
+    
+    def save_resume(self, file_id: str, filename: str, file_path: str, resume_data: ResumeData):
+        """파싱된 이력서 저장 (같은 file_id면 덮어쓰기)"""
+        statement = sqlite_insert(resumes_table).values(
+            file_id=file_id,
+            filename=filename,
+            file_path=file_path,
+            resume_data=resume_data.model_dump_json(),
+            created_at=datetime.now(),
+        )
+        with self.engine.begin() as conn:
+            conn.execute(statement.on_conflict_do_update(
+                index_elements=[resumes_table.c.file_id],
+                set_={
+                    'filename': statement.excluded.filename,
+                    'file_path': statement.excluded.file_path,
+                    'resume_data': statement.excluded.resume_data,
+                }
+            ))
+    
+    def get_resume(self, file_id: str) -> Optional[Dict]:
+        """저장된 이력서 조회 (file_path, filename, resume_data)"""
+        with self.engine.connect() as conn:
+            row = conn.execute(select(resumes_table).where(resumes_table.c.file_id == file_id)).mappings().first()
+        if row is None:
+            return None
+        return {
+            "file_path": row['file_path'],
+            "filename": row['filename'],
+            "resume_data": ResumeData.model_validate_json(row['resume_data'])
+        }
+    
+    # 적합도 분석 결과
+    
+    def save_match(self, resume_id: str, job_id: str, match_score: MatchScore):
+        """적합도 분석 결과 저장 (같은 이력서/공고 쌍이면 덮어쓰기)"""
+        self.save_matches(resume_id, {job_id: match_score})
+    
+    def save_matches(self, resume_id: str, match_scores: Dict[str, MatchScore]):
+        """한 이력서의 여러 공고 적합도 분석 결과 일괄 저장"""
+        now = datetime.now()
+        rows = [
+            {
+                'resume_id': resume_id,
+                'job_id': job_id,
+                'overall_score': match_score.overall_score,
+                'match_score': match_score.model_dump_json(),
+                'created_at': now,
+            }
+            for job_id, match_score in match_scores.items()
+        ]
+        if not rows:
+            return
+        
+        with self.engine.begin() as conn:
+            for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+                statement = sqlite_insert(match_results_table).values(rows[start:start + UPSERT_BATCH_SIZE])
+                conn.execute(statement.on_conflict_do_update(
+                    index_elements=[match_results_table.c.resume_id, match_results_table.c.job_id],
+                    set_={
+                        'overall_score': statement.excluded.overall_score,
+                        'match_score': statement.excluded.match_score,
+                        'created_at': statement.excluded.created_at,
+                    }
+                ))
+    
+    def get_match(self, resume_id: str, job_id: str) -> Optional[MatchScore]:
+        """저장된 적합도 분석 결과 조회"""
+        with self.engine.connect() as conn:
+            row = conn.execute(
+                select(match_results_table.c.match_score).where(
+                    match_results_table.c.resume_id == resume_id,
+                    match_results_table.c.job_id == job_id,
+                )
+            ).first()
+        return MatchScore.model_validate_json(row[0]) if row else None
+    
+    def top_matches(self, resume_id: str, limit: int = 10) -> List[Dict]:
+        """이력서의 적합도 상위 공고 ID와 점수"""
+        query = (
+            select(match_results_table.c.job_id, match_results_table.c.overall_score)
+            .where(match_results_table.c.resume_id == resume_id)
+            .order_by(match_results_table.c.overall_score.desc())
+            .limit(limit)
+        )
+        with self.engine.connect() as conn:
+            return [{"job_id": row.job_id, "overall_score": row.overall_score} for row in conn.execute(query)]
+    
+    def stats(self) -> dict:
+        """테이블별 행 수"""
+        with self.engine.connect() as conn:
+            return {
+                table.name: conn.execute(select(func.count()).select_from(table)).scalar_one()
+                for table in (jobs_table, resumes_table, match_results_table, job_features_table)
+            }
+    
+    def close(self):
+        """커넥션 풀 정리"""
+        self.engine.dispose()
+
+_shared_store: Optional[JobStore] = None
+
+def get_job_store() -> JobStore:
+    """환경 변수 설정(DATABASE_URL)으로 만든 공유 저장소 반환"""
+    global _shared_store
+    if _shared_store is None:
+        _shared_store = JobStore()
+    return _shared_store
@@ -1,26 +1,89 @@
 import asyncio
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Set
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
-import time
+from selenium.common.exceptions import TimeoutException
+import httpx
 from app.models.job import JobPosting
+from app.services.http_client import get_http_client
+from app.services.http_cache import HttpResponseCache, get_response_cache
+from app.services.html_parser import parse_elements, parse_first_text
+from app.services.page_archive import PageArchive, get_page_archive
+from app.utils.job_id import make_job_id
+from app.services.description_cache import DescriptionCache, get_description_cache
+from app.services.webdriver_pool import WebDriverPool, PooledDriver
 from datetime import datetime
 import os
 
 class LinkedInScraper:
     """LinkedIn 채용 공고 스크래퍼"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        pool_size: Optional[int] = None,
+        page_timeout: float = 10,
+        scroll_timeout: float = 3,
+        max_scrolls: int = 10,
+        detail_mode: Optional[str] = None,
+        detail_concurrency: Optional[int] = None,
+        detail_timeout: Optional[float] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        description_cache: Optional[DescriptionCache] = None,
+        response_cache: Optional[HttpResponseCache] = None,
+        archive: Optional[PageArchive] = None,
+    ):
         self.base_url = "https://www.linkedin.com/jobs/search"
-        self.driver = None
+        self.pool = WebDriverPool(self._create_driver, size=pool_size)
+        self._client = client
+        self._description_cache = description_cache
+        self._response_cache = response_cache
+        self._archive = archive
+        # 페이지 준비 상태 대기 설정 (초)
+        self.page_timeout = page_timeout
+        self.scroll_timeout = scroll_timeout
+        self.max_scrolls = max_scrolls
+        # 상세 설명 수집 설정: "http"(공개 채용 공고 페이지 직접 요청) 또는 "browser"(풀의 브라우저 사용)
+        self.detail_mode = detail_mode or os.getenv('LINKEDIN_DETAIL_MODE', 'http')
+        self.detail_concurrency = detail_concurrency or int(os.getenv('LINKEDIN_DETAIL_CONCURRENCY', '5'))
+        self.detail_timeout = detail_timeout or float(os.getenv('LINKEDIN_DETAIL_TIMEOUT', '15'))
+        self._detail_semaphore: Optional[asyncio.Semaphore] = None
+        self._detail_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
     
-    def _init_driver(self):
-        """Selenium 드라이버 초기화"""
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """상세 페이지 요청에 사용할 HTTP 클라이언트 (기본: 공유 커넥션 풀)"""
+        return self._client or get_http_client()
+    
+    @property
+    def description_cache(self) -> DescriptionCache:
+        """상세 설명 디스크 캐시 (기본: 공유 캐시)"""
+        return self._description_cache or get_description_cache()
+    
+    @property
+    def response_cache(self) -> HttpResponseCache:
+        """렌더링한 검색 결과 페이지 캐시 (기본: 공유 캐시, 상세 페이지는 설명 캐시가 담당)"""
+        return self._response_cache or get_response_cache()
+    
+    @property
+    def archive(self) -> PageArchive:
+        """페이지 기록/재생 저장소 (기본: 환경 변수 설정)"""
+        return self._archive or get_page_archive()
+    
+    @property
+    def detail_semaphore(self) -> asyncio.Semaphore:
+        """상세 설명 동시 요청 제한 (동시에 실행되는 모든 검색이 공유, 이벤트 루프마다 하나 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._detail_semaphore is None or self._detail_semaphore_loop is not loop:
+            self._detail_semaphore = asyncio.Semaphore(self.detail_concurrency)
+            self._detail_semaphore_loop = loop
+        return self._detail_semaphore
+    
+    def _create_driver(self):
+        """Selenium 드라이버 생성"""
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -30,95 +93,268 @@ class LinkedInScraper:
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
         
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        return driver
     
     async def search(self, keyword: str, location: Optional[str] = None, max_results: int = 20) -> List[JobPosting]:
         """LinkedIn에서 채용 공고 검색"""
         try:
-            if not self.driver:
-                self._init_driver()
-            
-            # 검색 URL 구성
-            params = f"?keywords={keyword.replace(' ', '%20')}"
-            if location:
-                params += f"&location={location.replace(' ', '%20')}"
-            
-            url = f"{self.base_url}{params}"
-            self.driver.get(url)
-            
-            # 페이지 로딩 대기
-            await asyncio.sleep(3)
-            
-            # 스크롤하여 더 많은 결과 로드
-            for _ in range(3):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                await asyncio.sleep(2)
-            
-            # HTML 파싱
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            jobs = []
-            
-            # LinkedIn 채용 공고 요소 찾기
-            job_cards = soup.find_all('div', class_='base-card')[:max_results]
-            
-            for idx, card in enumerate(job_cards):
-                try:
-                    title_elem = card.find('h3', class_='base-search-card__title')
-                    company_elem = card.find('h4', class_='base-search-card__subtitle')
-                    location_elem = card.find('span', class_='job-search-card__location')
-                    link_elem = card.find('a', class_='base-card__full-link')
-                    
-                    if title_elem and company_elem and link_elem:
-                        title = title_elem.get_text(strip=True)
-                        company = company_elem.get_text(strip=True)
-                        location_text = location_elem.get_text(strip=True) if location_elem else None
-                        job_url = link_elem.get('href', '')
-                        
-                        # 상세 정보 가져오기 (선택사항)
-                        description = await self._get_job_description(job_url) if job_url else ""
-                        
-                        job = JobPosting(
-                            id=f"linkedin_{idx}",
-                            title=title,
-                            company=company,
-                            location=location_text,
-                            description=description,
-                            url=job_url if job_url.startswith('http') else f"https://www.linkedin.com{job_url}",
-                            source="linkedin",
-                            posted_date=datetime.now()
-                        )
-                        jobs.append(job)
-                except Exception as e:
-                    print(f"채용 공고 파싱 오류: {e}")
-                    continue
-            
-            return jobs
+            # 카드 목록을 먼저 모은 뒤 상세 설명은 동시에 수집
+            cards = await self._load_cards(keyword, location, max_results)
+            descriptions = await self._fetch_descriptions([card['url'] for card in cards])
+            await asyncio.to_thread(self.description_cache.flush)
             
+            return [
+                self._build_job(card, description)
+                for card, description in zip(cards, descriptions)
+            ]
+        
         except Exception as e:
             print(f"LinkedIn 검색 오류: {e}")
             return []
     
+    async def search_iter(
+        self,
+        keyword: str,
+        location: Optional[str] = None,
+        max_results: int = 20,
+        known_ids: Optional[Set[str]] = None,
+        seen_known_ids: Optional[Set[str]] = None,
+    ) -> AsyncIterator[List[JobPosting]]:
+        """상세 설명이 준비되는 순서대로 채용 공고를 생성하는 비동기 제너레이터
+        
+        known_ids가 주어지면 최신순(sortBy=DD)으로 검색해 이미 알고 있는 공고만 나올 때 스크롤을 멈추고, 새 공고의 상세 설명만 수집한다.
+        제외한 공고 중 이번 검색에서 다시 본 공고의 ID는 seen_known_ids에 추가한다.
+        검색 결과 페이지를 불러오지 못하면 예외를 그대로 전달한다 (호출한 쪽에서 소스 오류로 처리).
+        """
+        tasks = []
+        try:
+            cards = await self._load_cards(keyword, location, max_results, known_ids)
+            if known_ids:
+                if seen_known_ids is not None:
+                    seen_known_ids.update(self._card_id(card) for card in cards if self._card_id(card) in known_ids)
+                cards = [card for card in cards if self._card_id(card) not in known_ids]
+            
+            async def fetch(card: dict) -> JobPosting:
+                description = await self._fetch_description_bounded(card['url'])
+                return self._build_job(card, description)
+            
+            tasks = [asyncio.create_task(fetch(card)) for card in cards]
+            for next_job in asyncio.as_completed(tasks):
+                yield [await next_job]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # 이번 검색에서 모아 둔 캐시 조회 시각을 한 번에 기록
+            if tasks:
+                await asyncio.to_thread(self.description_cache.flush)
+    
+    async def _load_cards(
+        self, keyword: str, location: Optional[str], max_results: int, known_ids: Optional[Set[str]] = None
+    ) -> List[dict]:
+        """검색 결과 페이지를 로드해 채용 공고 카드 정보 추출"""
+        # 검색 URL 구성
+        params = f"?keywords={keyword.replace(' ', '%20')}"
+        if location:
+            params += f"&location={location.replace(' ', '%20')}"
+        if known_ids:
+            # 알고 있는 공고에서 스크롤을 멈추려면 새 공고가 앞에 오는 최신순이어야 함 (기본은 관련도순)
+            params += "&sortBy=DD"
+        
+        url = f"{self.base_url}{params}"
+        
+        # 같은 검색을 최근에 렌더링했다면 브라우저를 열지 않고 재사용
+        # (증분 수집은 알고 있는 공고에서 스크롤을 멈춘 페이지이므로 별도 키로 저장)
+        cache_key = f"{url}#max_results={max_results}"
+        if known_ids:
+            cache_key += "&incremental=1"
+        if self.archive.replaying:
+            page_source = self.archive.load(cache_key) or ""
+            return self._parse_cards(page_source, max_results)
+        
+        page_source = self.response_cache.get_fresh(cache_key)
+        from_cache = page_source is not None
+        if not from_cache:
+            # 풀에서 브라우저를 하나 빌려 검색 결과 페이지만 로드 (브라우저 조작은 전용 executor에서 실행)
+            async with self.pool.acquire() as pooled:
+                page_source = await self.pool.run(self._load_results_page, pooled, url, max_results, known_ids)
+        if self.archive.recording:
+            self.archive.save(cache_key, page_source)
+        
+        cards = self._parse_cards(page_source, max_results)
+        # 카드를 찾은 페이지만 캐시 (차단되거나 카드 대기 시간이 초과된 빈 페이지는 저장하지 않음)
+        if cards and not from_cache:
+            self.response_cache.put(cache_key, page_source)
+        return cards
+    
+    @staticmethod
+    def _card_id(card: dict) -> str:
+        """카드 URL로 만든 공고 ID"""
+        return make_job_id("linkedin", card['url'])
+    
+    def _build_job(self, card: dict, description: str) -> JobPosting:
+        """카드 정보와 상세 설명으로 JobPosting 생성"""
+        return JobPosting(
+            id=self._card_id(card),
+            title=card['title'],
+            company=card['company'],
+            location=card['location'],
+            description=description,
+            url=card['url'],
+            source="linkedin",
+            posted_date=datetime.now()
+        )
+    
+    def _parse_cards(self, page_source: str, max_results: int) -> List[dict]:
+        """검색 결과 페이지에서 채용 공고 카드 정보 추출"""
+        cards = []
+        
+        # LinkedIn 채용 공고 요소만 파싱
+        job_cards = parse_elements(page_source, 'div', 'base-card')[:max_results]
+        
+        for card in job_cards:
+            try:
+                title_elem = card.find('h3', class_='base-search-card__title')
+                company_elem = card.find('h4', class_='base-search-card__subtitle')
+                location_elem = card.find('span', class_='job-search-card__location')
+                link_elem = card.find('a', class_='base-card__full-link')
+                
+                if title_elem and company_elem and link_elem:
+                    job_url = link_elem.get('href', '')
+                    cards.append({
+                        'title': title_elem.get_text(strip=True),
+                        'company': company_elem.get_text(strip=True),
+                        'location': location_elem.get_text(strip=True) if location_elem else None,
+                        'url': job_url if job_url.startswith('http') else f"https://www.linkedin.com{job_url}",
+                    })
+            except Exception as e:
+                print(f"채용 공고 파싱 오류: {e}")
+                continue
+        
+        return cards
+    
+    async def _fetch_descriptions(self, job_urls: List[str]) -> List[str]:
+        """상세 설명을 동시에 수집 (동시 요청 수와 공고별 타임아웃 제한)"""
+        return await asyncio.gather(*[self._fetch_description_bounded(job_url) for job_url in job_urls])
+    
+    async def _fetch_description_bounded(self, job_url: str) -> str:
+        """동시 실행 제한(스크래퍼 전체 공유)과 타임아웃을 적용해 상세 설명 하나를 수집"""
+        async with self.detail_semaphore:
+            try:
+                return await asyncio.wait_for(self._get_job_description(job_url), timeout=self.detail_timeout)
+            except asyncio.TimeoutError:
+                print(f"LinkedIn 상세 설명 시간 초과: {job_url}")
+                return ""
+    
+    def _load_results_page(
+        self, pooled: PooledDriver, url: str, max_results: int, known_ids: Optional[Set[str]] = None
+    ) -> str:
+        """검색 결과 페이지 로드 및 스크롤 (executor 스레드에서 실행)"""
+        driver = pooled.driver
+        pooled.get(url)
+        
+        # 첫 채용 공고 카드가 나타날 때까지 대기
+        try:
+            WebDriverWait(driver, self.page_timeout).until(
+                EC.presence_of_element_located((By.CLASS_NAME, 'base-card'))
+            )
+        except TimeoutException:
+            return driver.page_source
+        
+        # 카드가 충분히 모이거나 더 이상 늘지 않을 때까지 스크롤
+        # (증분 수집이면 새로 로드된 카드가 모두 이미 알고 있는 공고일 때도 중단)
+        card_count = self._count_cards(driver)
+        checked = 0
+        for _ in range(self.max_scrolls):
+            if card_count >= max_results:
+                break
+            if known_ids:
+                new_ids = [make_job_id("linkedin", href) for href in self._card_links(driver)[checked:card_count]]
+                checked = card_count
+                if new_ids and all(job_id in known_ids for job_id in new_ids):
+                    break
+            
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            try:
+                WebDriverWait(driver, self.scroll_timeout).until(
+                    lambda d: self._count_cards(d) > card_count
+                )
+            except TimeoutException:
+                break
+            card_count = self._count_cards(driver)
+        
+        return driver.page_source
+    
+    @staticmethod
+    def _count_cards(driver) -> int:
+        """현재 페이지에 로드된 채용 공고 카드 수"""
+        return len(driver.find_elements(By.CLASS_NAME, 'base-card'))
+    
+    @staticmethod
+    def _card_links(driver) -> List[str]:
+        """현재 페이지에 로드된 카드 링크 목록 (스크립트 한 번으로 조회)"""
+        return driver.execute_script(
+            "return Array.from(document.querySelectorAll('.base-card .base-card__full-link'), a => a.href);"
+        ) or []
+    
+    def _load_description_page(self, pooled: PooledDriver, job_url: str) -> str:
+        """채용 공고 상세 페이지 로드 (executor 스레드에서 실행)"""
+        pooled.get(job_url)
+        
+        # 상세 설명 요소가 나타날 때까지 대기
+        try:
+            WebDriverWait(pooled.driver, self.page_timeout).until(
+                EC.presence_of_element_located((By.CLASS_NAME, 'show-more-less-html__markup'))
+            )
+        except TimeoutException:
+            pass
+        return pooled.driver.page_source
+    
     async def _get_job_description(self, job_url: str) -> str:
         """채용 공고 상세 설명 가져오기"""
         try:
             if not job_url.startswith('http'):
                 job_url = f"https://www.linkedin.com{job_url}"
             
-            self.driver.get(job_url)
-            await asyncio.sleep(2)
+            # 이미 수집한 공고는 페이지를 열지 않고 캐시에서 반환 (기록 모드에서는 모든 페이지를 저장하기 위해 건너뜀)
+            # 디스크 캐시 조회/저장은 이벤트 루프를 막지 않도록 스레드에서 실행
+            cached = None if self.archive.recording else await asyncio.to_thread(self.description_cache.get, job_url)
+            if cached is not None:
+                return cached
+            
+            if self.archive.replaying:
+                page_source = self.archive.load(job_url) or ""
+            elif self.detail_mode == 'browser':
+                async with self.pool.acquire() as pooled:
+                    page_source = await self.pool.run(self._load_description_page, pooled, job_url)
+            else:
+                # 응답 캐시를 거치지 않음 (추출한 설명은 디스크 설명 캐시에 저장되므로 전체 HTML을 메모리에 둘 필요 없음)
+                response = await self.client.get(job_url)
+                response.raise_for_status()
+                page_source = response.text
+            
+            if self.archive.recording:
+                self.archive.save(job_url, page_source)
             
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            description_elem = soup.find('div', class_='show-more-less-html__markup')
+            description = parse_first_text(page_source, 'div', 'show-more-less-html__markup')
             
-            if description_elem:
-                return description_elem.get_text(strip=True)
+            if description:
+                await asyncio.to_thread(self.description_cache.set, job_url, description)
+                return description
             return ""
+        except asyncio.CancelledError:
+            raise
         except:
             return ""
     
+    def close(self):
+        """풀의 모든 드라이버 종료"""
+        self.pool.close()
+    
     def __del__(self):
         """드라이버 종료"""
-        if self.driver:
-            self.driver.quit()
-
+        if hasattr(self, 'pool'):
+            self.close()
@@ -1,45 +1,189 @@
 import os
-from typing import Dict
+import threading
+from typing import Dict, List, Optional, Tuple
 from app.models.resume import ResumeData
 from app.models.job import JobPosting
 from app.models.matching import MatchScore
+from app.services.skill_matcher import get_skill_matcher
+from app.services.job_features import JobFeatureCache, JobFeatures
+from app.services.tfidf import TfidfDescriptionMatcher
+from app.services.candidate_index import (
+    CandidateIndex, FLAG_EDUCATION, FLAG_JUNIOR, FLAG_SENIOR, candidate_pool_size
+)
 import json
+import numpy as np
+
+# 설명 매칭 방식: keywords (공통 단어 비율) 또는 tfidf (TF-IDF 코사인 유사도, 일괄 계산에서 사용)
+DESCRIPTION_MATCH_MODE = os.getenv('DESCRIPTION_MATCH_MODE', 'keywords')
+
+class ResumeFeatures:
+    """적합도 계산에 쓰는 이력서 쪽 특징 (이력서당 한 번만 계산해 여러 공고에 재사용)"""
+    
+    def __init__(self, resume: ResumeData):
+        self.resume = resume
+        self.skills = [s.lower() for s in resume.skills]
+        # 스킬 사전에 있는 스킬은 대표 이름으로 비교 (사전에 없으면 None)
+        matcher = get_skill_matcher()
+        canonical_skills = [matcher.canonical(s) for s in resume.skills]
+        self.skill_keys = [skill.lower() if skill else None for skill in canonical_skills]
+        self.words = set(resume.raw_text.lower().split())
+        self.experience_count = len(resume.experience)
+        self.has_education = bool(resume.education)
 
 class MatchingService:
     """이력서와 채용 공고 적합도 분석 서비스"""
     
-    def __init__(self):
+    # 항목별 가중치 (전체 점수 = 가중 평균)
+    SCORE_WEIGHTS = {'skills': 0.3, 'experience': 0.3, 'education': 0.1, 'description': 0.3}
+    
+    def __init__(
+        self,
+        feature_cache: Optional[JobFeatureCache] = None,
+        description_matcher: Optional[TfidfDescriptionMatcher] = None,
+    ):
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.use_openai = bool(self.openai_api_key)
+        self.feature_cache = feature_cache or JobFeatureCache()
+        self.candidate_index = CandidateIndex()
+        if description_matcher is None and DESCRIPTION_MATCH_MODE == 'tfidf':
+            description_matcher = TfidfDescriptionMatcher()
+        self.description_matcher = description_matcher
+        # 역색인과 TF-IDF 행렬은 공유 상태이므로 이를 쓰는 일괄 계산은 직렬화 (특징 캐시는 자체적으로 스레드 안전)
+        self._rank_lock = threading.Lock()
     
     async def calculate_match(self, resume_data: ResumeData, job: JobPosting) -> MatchScore:
         """이력서와 채용 공고의 적합도 계산"""
+        return self._score(self.prepare_resume(resume_data), job, self.feature_cache.get(job))
+    
+    async def calculate_match_batch(self, resume_data: ResumeData, jobs: List[JobPosting]) -> List[MatchScore]:
+        """이력서 하나와 여러 채용 공고의 적합도 계산 (이력서 특징은 한 번만 준비, 입력 순서대로 반환)"""
+        features = self.prepare_resume(resume_data)
+        job_features = self.feature_cache.get_many(jobs)
+        with self._rank_lock:
+            description_scores = self._description_scores(resume_data, job_features)
+        return [
+            self._score(features, job, job_feature, description_score)
+            for job, job_feature, description_score in zip(jobs, job_features, description_scores)
+        ]
+    
+    async def rank_matches(
+        self, resume_data: ResumeData, jobs: List[JobPosting], top_n: int
+    ) -> List[Tuple[JobPosting, MatchScore]]:
+        """적합도 상위 top_n개의 (공고, 점수)를 점수 순으로 반환"""
+        return self.rank(resume_data, jobs, top_n)
+    
+    def rank(
+        self, resume_data: ResumeData, jobs: List[JobPosting], top_n: int
+    ) -> List[Tuple[JobPosting, MatchScore]]:
+        """rank_matches의 동기 버전 (CPU 작업이므로 API에서는 스레드풀에서 호출)
+        
+        공고가 많으면 역색인으로 이력서와 겹치는 후보만 골라 전체 점수를 계산한다.
+        """
+        with self._rank_lock:
+            return self._rank(resume_data, jobs, top_n)
+    
+    def _rank(
+        self, resume_data: ResumeData, jobs: List[JobPosting], top_n: int
+    ) -> List[Tuple[JobPosting, MatchScore]]:
+        """상위 top_n개 계산 (호출 측에서 잠금)"""
+        features = self.prepare_resume(resume_data)
+        job_features = self.feature_cache.get_many(jobs)
+        description_scores = self._description_scores(resume_data, job_features)
+        pool_size = candidate_pool_size(top_n)
         
+        entries = list(zip(jobs, job_features, description_scores))
+        if len(jobs) > pool_size:
+            # 색인은 이번 코퍼스만 유지 (빠진 공고는 무효 처리되고 무효 슬롯이 많아지면 압축)
+            self.candidate_index.retain(job.id for job in jobs)
+            self.candidate_index.add_many((job.id for job in jobs), job_features)
+            by_id = {entry[0].id: entry for entry in entries}
+            aligned_scores = None
+            if self.description_matcher is not None:
+                aligned_scores = self.candidate_index.align(list(by_id), [entry[2] for entry in by_id.values()])
+            candidate_ids = self.candidate_index.candidates(
+                features, pool_size, self._approximate_scorer(features, aligned_scores), by_id
+            )
+            entries = [by_id[job_id] for job_id in candidate_ids]
+        
+        ranked = [
+            (job, self._score(features, job, job_feature, description_score))
+            for job, job_feature, description_score in entries
+        ]
+        ranked.sort(key=lambda pair: pair[1].overall_score, reverse=True)
+        return ranked[:top_n]
+    
+    def prepare_resume(self, resume_data: ResumeData) -> ResumeFeatures:
+        """이력서 쪽 특징 계산"""
+        return ResumeFeatures(resume_data)
+    
+    def _description_scores(self, resume_data: ResumeData, job_features: List[JobFeatures]) -> List[Optional[float]]:
+        """TF-IDF 설명 매칭을 켰으면 모든 공고의 설명 점수(0~100)를 한 번에 계산 (아니면 None)"""
+        if self.description_matcher is None:
+            return [None] * len(job_features)
+        similarities = self.description_matcher.scores(resume_data.raw_text, job_features)
+        return (np.minimum(similarities, 1.0) * 100).tolist()
+    
+    def _approximate_scorer(self, features: ResumeFeatures, description_scores: Optional[np.ndarray] = None):
+        """역색인의 스킬/설명 근사 점수와 공고 플래그로 전체 점수를 근사하는 함수
+        
+        경력/학력 점수는 플래그 조합(8가지)마다 실제 계산 함수로 한 번씩 구해 둔다.
+        description_scores(슬롯 순서)를 주면 설명 근사 점수 대신 사용한다.
+        """
+        flag_scores = np.zeros(8)
+        for flags in range(8):
+            job_features = JobFeatures(
+                content_hash='', full_text='', skills=[],
+                is_senior=bool(flags & FLAG_SENIOR),
+                is_junior=bool(flags & FLAG_JUNIOR),
+                requires_education=bool(flags & FLAG_EDUCATION),
+            )
+            flag_scores[flags] = (
+                self._calculate_experience_match(features, job_features) * self.SCORE_WEIGHTS['experience'] +
+                self._calculate_education_match(features, job_features) * self.SCORE_WEIGHTS['education']
+            )
+        
+        def approximate(skills_score, description_score, flags):
+            if description_scores is not None:
+                description_score = description_scores
+            return (
+                skills_score * self.SCORE_WEIGHTS['skills'] +
+                description_score * self.SCORE_WEIGHTS['description'] +
+                flag_scores[flags]
+            )
+        return approximate
+    
+    def _score(
+        self, features: ResumeFeatures, job: JobPosting, job_features: JobFeatures,
+        description_score: Optional[float] = None
+    ) -> MatchScore:
+        """준비된 이력서/공고 특징으로 채용 공고 하나의 적합도 계산 (description_score를 주면 설명 점수로 사용)"""
         # 1. 스킬 매칭
-        skills_score = self._calculate_skills_match(resume_data, job)
+        skills_score = self._calculate_skills_match(features, job_features)
         
         # 2. 경력 매칭
-        experience_score = self._calculate_experience_match(resume_data, job)
+        experience_score = self._calculate_experience_match(features, job_features)
         
         # 3. 학력 매칭
-        education_score = self._calculate_education_match(resume_data, job)
+        education_score = self._calculate_education_match(features, job_features)
         
-        # 4. 설명 매칭 (키워드 기반)
-        description_score, matched_keywords, missing_keywords = self._calculate_description_match(
-            resume_data, job
+        # 4. 설명 매칭 (키워드 기반, TF-IDF 점수를 받았으면 점수만 대체)
+        keyword_score, matched_keywords, missing_keywords = self._calculate_description_match(
+            features, job_features
         )
+        if description_score is None:
+            description_score = keyword_score
         
         # 전체 점수 계산 (가중 평균)
         overall_score = (
-            skills_score * 0.3 +
-            experience_score * 0.3 +
-            education_score * 0.1 +
-            description_score * 0.3
+            skills_score * self.SCORE_WEIGHTS['skills'] +
+            experience_score * self.SCORE_WEIGHTS['experience'] +
+            education_score * self.SCORE_WEIGHTS['education'] +
+            description_score * self.SCORE_WEIGHTS['description']
         )
         
         # 추천사항 생성
         recommendations = self._generate_recommendations(
-            resume_data, job, matched_keywords, missing_keywords
+            features.resume, job, matched_keywords, missing_keywords
         )
         
         return MatchScore(
@@ -53,28 +197,22 @@ class MatchingService:
             recommendations=recommendations
         )
     
-    def _calculate_skills_match(self, resume: ResumeData, job: JobPosting) -> float:
+    def _calculate_skills_match(self, resume: ResumeFeatures, job: JobFeatures) -> float:
         """스킬 매칭 점수 계산"""
         if not resume.skills:
             return 0.0
         
         # 채용 공고에서 스킬 키워드 추출
-        job_text = (job.title + " " + job.description).lower()
-        resume_skills_lower = [s.lower() for s in resume.skills]
+        job_text = job.full_text
         
-        # 공통 스킬 찾기
+        # 공통 스킬 찾기 (사전에 없는 스킬은 공고 본문에서 직접 검색)
         matched_skills = []
-        for skill in resume_skills_lower:
-            if skill in job_text:
+        for skill, key in zip(resume.skills, resume.skill_keys):
+            if (key in job.skills) if key else (skill in job_text):
                 matched_skills.append(skill)
         
-        # 채용 공고에서 요구하는 스킬 추정
-        common_tech_keywords = [
-            'python', 'javascript', 'java', 'react', 'vue', 'angular', 'node.js',
-            'django', 'flask', 'fastapi', 'spring', 'sql', 'mongodb', 'postgresql',
-            'aws', 'docker', 'kubernetes', 'git', 'linux', 'agile', 'machine learning'
-        ]
-        required_skills = [kw for kw in common_tech_keywords if kw in job_text]
+        # 채용 공고에서 요구하는 스킬 추정 (스킬 사전에 있는 스킬)
+        required_skills = job.skills
         
         if not required_skills:
             return 50.0  # 스킬 요구사항이 명확하지 않으면 중간 점수
@@ -83,21 +221,17 @@ class MatchingService:
         match_ratio = len(matched_skills) / len(required_skills) if required_skills else 0
         return min(match_ratio * 100, 100.0)
     
-    def _calculate_experience_match(self, resume: ResumeData, job: JobPosting) -> float:
+    def _calculate_experience_match(self, resume: ResumeFeatures, job: JobFeatures) -> float:
         """경력 매칭 점수 계산"""
-        if not resume.experience:
+        if not resume.experience_count:
             return 0.0
         
-        # 채용 공고에서 경력 관련 키워드 추출
-        job_text = job.description.lower()
-        experience_keywords = ['experience', 'years', 'senior', 'junior', 'lead', 'manager']
-        
-        # 경력 수준 추정
-        is_senior = any(kw in job_text for kw in ['senior', 'lead', 'manager', '5+', '10+'])
-        is_junior = any(kw in job_text for kw in ['junior', 'entry', '0-2', '1-3'])
+        # 경력 수준 (공고 특징에서 미리 계산)
+        is_senior = job.is_senior
+        is_junior = job.is_junior
         
         # 이력서 경력 항목 수로 추정
-        experience_count = len(resume.experience)
+        experience_count = resume.experience_count
         
         if is_senior and experience_count >= 3:
             return 90.0
@@ -110,16 +244,13 @@ class MatchingService:
         else:
             return 20.0
     
-    def _calculate_education_match(self, resume: ResumeData, job: JobPosting) -> float:
+    def _calculate_education_match(self, resume: ResumeFeatures, job: JobFeatures) -> float:
         """학력 매칭 점수 계산"""
-        if not resume.education:
+        if not resume.has_education:
             return 50.0  # 학력 정보가 없으면 중간 점수
         
-        job_text = job.description.lower()
-        education_keywords = ['bachelor', 'master', 'phd', 'degree', 'university', 'college']
-        
-        # 학력 요구사항이 있는지 확인
-        has_education_requirement = any(kw in job_text for kw in education_keywords)
+        # 학력 요구사항이 있는지 확인 (공고 특징에서 미리 계산)
+        has_education_requirement = job.requires_education
         
         if has_education_requirement:
             # 학력 정보가 있으면 높은 점수
@@ -128,15 +259,12 @@ class MatchingService:
             return 70.0  # 학력 요구사항이 없으면 중간 점수
     
     def _calculate_description_match(
-        self, resume: ResumeData, job: JobPosting
+        self, resume: ResumeFeatures, job: JobFeatures
     ) -> tuple[float, list, list]:
         """설명 매칭 점수 계산 및 키워드 추출"""
-        resume_text = resume.raw_text.lower()
-        job_text = (job.title + " " + job.description).lower()
-        
         # 중요한 키워드 추출 (간단한 방법)
-        job_words = set(job_text.split())
-        resume_words = set(resume_text.split())
+        job_words = job.words
+        resume_words = resume.words
         
         # 공통 키워드 (3글자 이상)
         common_keywords = [
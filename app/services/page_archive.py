@@ -0,0 +1,80 @@
+import os
+import json
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# 기록/재생 설정 (환경 변수로 조정 가능)
+# off: 사용 안 함, record: 가져온 페이지를 디스크에 저장, replay: 네트워크 대신 디스크에서 제공
+SCRAPER_ARCHIVE_MODE = os.getenv('SCRAPER_ARCHIVE_MODE', 'off')
+SCRAPER_ARCHIVE_DIR = os.getenv('SCRAPER_ARCHIVE_DIR', 'archive')
+
+class PageArchive:
+    """스크래퍼가 가져온 페이지(검색 결과, 상세 페이지)의 기록/재생 저장소"""
+    
+    MODES = ('off', 'record', 'replay')
+    
+    def __init__(self, mode: str = SCRAPER_ARCHIVE_MODE, directory: str = SCRAPER_ARCHIVE_DIR):
+        if mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 아카이브 모드: {mode}")
+        self.mode = mode
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        if self.recording:
+            self.directory.mkdir(parents=True, exist_ok=True)
+    
+    @property
+    def recording(self) -> bool:
+        """기록 모드 여부"""
+        return self.mode == 'record'
+    
+    @property
+    def replaying(self) -> bool:
+        """재생 모드 여부"""
+        return self.mode == 'replay'
+    
+    @staticmethod
+    def make_key(url: str) -> str:
+        """URL로 파일 이름용 키 생성"""
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+    
+    def _path(self, url: str) -> Path:
+        """URL에 해당하는 페이지 파일 경로"""
+        key = self.make_key(url)
+        return self.directory / key[:2] / f"{key}.html"
+    
+    def load(self, url: str) -> Optional[str]:
+        """저장된 페이지 반환 (없으면 None)"""
+        path = self._path(url)
+        if not path.exists():
+            return None
+        return path.read_text(encoding='utf-8')
+    
+    def save(self, url: str, html: str):
+        """페이지 저장 및 인덱스(index.jsonl)에 URL 기록"""
+        path = self._path(url)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(html, encoding='utf-8')
+            with open(self.directory / 'index.jsonl', 'a', encoding='utf-8') as f:
+                f.write(json.dumps({
+                    'key': self.make_key(url),
+                    'url': url,
+                    'recorded_at': datetime.now().isoformat()
+                }, ensure_ascii=False) + '\n')
+    
+    def iter_pages(self):
+        """저장된 모든 페이지 HTML 생성"""
+        for path in sorted(self.directory.glob('*/*.html')):
+            yield path.read_text(encoding='utf-8')
+
+_shared_archive: Optional[PageArchive] = None
+
+def get_page_archive() -> PageArchive:
+    """환경 변수 설정으로 만든 공유 아카이브 반환"""
+    global _shared_archive
+    if _shared_archive is None:
+        _shared_archive = PageArchive()
+    return _shared_archive
@@ -0,0 +1,71 @@
+import os
+import time
+from typing import Any, Hashable, Optional, Tuple
+from app.utils.lru import LRUCache
+
+# 검색 결과 캐시 설정 (환경 변수로 조정 가능)
+SEARCH_CACHE_TTL = float(os.getenv('SEARCH_CACHE_TTL', '600'))
+SEARCH_CACHE_STALE_TTL = float(os.getenv('SEARCH_CACHE_STALE_TTL', '3600'))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', '200'))
+
+class SearchResultCache:
+    """검색 결과 캐시 (TTL + LRU, stale-while-revalidate)
+    
+    TTL 이내의 결과는 "fresh", TTL이 지났지만 stale_ttl 이내면 "stale"로
+    반환한다. stale 결과는 바로 응답에 쓰고 호출 측에서 백그라운드로 갱신한다.
+    """
+    
+    def __init__(
+        self,
+        ttl: float = SEARCH_CACHE_TTL,
+        stale_ttl: float = SEARCH_CACHE_STALE_TTL,
+        max_entries: int = SEARCH_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: "LRUCache[Tuple[Any, float]]" = LRUCache(max_entries)
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable) -> Tuple[Optional[Any], str]:
+        """캐시된 값과 상태("fresh", "stale", "miss") 반환"""
+        entry = self._entries.peek(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            if age < self.ttl:
+                self._entries.touch(key)
+                self.fresh_hits += 1
+                return value, "fresh"
+            if age < self.ttl + self.stale_ttl:
+                self._entries.touch(key)
+                self.stale_hits += 1
+                return value, "stale"
+            self._entries.pop(key)
+        self.misses += 1
+        return None, "miss"
+    
+    def put(self, key: Hashable, value: Any):
+        """값 저장 (최대 개수를 넘으면 가장 오래 사용되지 않은 항목 제거)"""
+        self._entries.put(key, (value, time.time()))
+    
+    def clear(self):
+        """캐시 비우기"""
+        self._entries.clear()
+    
+    def stats(self) -> dict:
+        """캐시 크기 조정을 위한 통계"""
+        lookups = self.fresh_hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "stale_ttl_seconds": self.stale_ttl,
+            "fresh_hits": self.fresh_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self._entries.evictions,
+            "hit_rate": round((self.fresh_hits + self.stale_hits) / lookups, 3) if lookups else 0.0,
+        }
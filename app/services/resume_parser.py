@@ -5,6 +5,7 @@ import pdfplumber
 from docx import Document
 import re
 from app.models.resume import ResumeData
+from app.services.skill_matcher import get_skill_matcher
 
 class ResumeParser:
     """이력서 파싱 서비스"""
@@ -71,18 +72,8 @@ class ResumeParser:
             if len(first_line) < 50 and not '@' in first_line:
                 name = first_line
         
-        # 스킬 추출 (일반적인 기술 스킬 키워드)
-        skill_keywords = [
-            'Python', 'JavaScript', 'Java', 'C++', 'C#', 'React', 'Vue', 'Angular',
-            'Node.js', 'Django', 'Flask', 'FastAPI', 'Spring', 'SQL', 'MongoDB',
-            'PostgreSQL', 'AWS', 'Docker', 'Kubernetes', 'Git', 'Linux', 'Agile',
-            'Machine Learning', 'Deep Learning', 'TensorFlow', 'PyTorch', 'Data Science'
-        ]
-        found_skills = []
-        text_lower = text.lower()
-        for skill in skill_keywords:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
+        # 스킬 추출 (공유 스킬 사전으로 한 번에 매칭)
+        found_skills = get_skill_matcher().find(text)
         
         # 경력 추출 (간단한 패턴 매칭)
         experience = []
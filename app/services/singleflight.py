@@ -0,0 +1,53 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 하나의 실행으로 합치는 요청 병합기
+    
+    첫 호출만 실제로 실행하고, 실행 중에 같은 키로 들어온 호출은 그 결과(또는 예외)를
+    함께 받는다. 기다리던 호출이 모두 취소되면 실행 중인 작업도 취소한다.
+    """
+    
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.calls = 0
+        self.coalesced = 0
+    
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """키에 해당하는 실행 결과 반환 (실행 중이면 기존 실행에 합류)"""
+        self.calls += 1
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(func())
+            self._tasks[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.coalesced += 1
+        
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # 마지막으로 기다리던 호출까지 취소되면 공유 작업도 중단
+            if self._tasks.get(key) is task and self._waiters[key] == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            if self._tasks.get(key) is task:
+                self._waiters[key] -= 1
+    
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        """끝난 작업을 실행 중 목록에서 제거"""
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+            del self._waiters[key]
+    
+    def stats(self) -> dict:
+        """병합 통계"""
+        return {
+            'in_flight': len(self._tasks),
+            'calls': self.calls,
+            'coalesced': self.coalesced,
+        }
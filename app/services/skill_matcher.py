@@ -0,0 +1,147 @@
+import os
+import re
+import json
+import hashlib
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 추가 스킬 사전 경로 (JSON: {"스킬": ["별칭", ...]} 또는 ["스킬", ...])
+SKILL_DICTIONARY_PATH = os.getenv('SKILL_DICTIONARY_PATH')
+
+# 기본 스킬 사전 (대표 이름 -> 별칭)
+DEFAULT_SKILLS: Dict[str, List[str]] = {
+    'Python': [], 'JavaScript': [], 'TypeScript': [], 'Java': [], 'Kotlin': [], 'Scala': [],
+    'Golang': [], 'Rust': [], 'C++': ['cpp'], 'C#': [], 'Ruby': [], 'PHP': [], 'Swift': [],
+    'React': ['react.js', 'reactjs'], 'Vue': ['vue.js', 'vuejs'], 'Angular': [], 'Next.js': ['nextjs'],
+    'Node.js': ['nodejs'], 'HTML': [], 'CSS': [],
+    'Django': [], 'Flask': [], 'FastAPI': [], 'Spring': [], 'Spring Boot': [], 'GraphQL': [],
+    'SQL': [], 'MySQL': [], 'PostgreSQL': ['postgres'], 'MongoDB': [], 'Redis': [], 'Elasticsearch': [],
+    'AWS': [], 'GCP': [], 'Azure': [], 'Docker': [], 'Kubernetes': ['k8s'], 'Terraform': [],
+    'Kafka': [], 'Spark': [], 'Airflow': [], 'Hadoop': [],
+    'Git': [], 'Linux': [], 'CI/CD': [], 'Jenkins': [], 'Microservices': [], 'Agile': [], 'Scrum': [],
+    'Machine Learning': [], 'Deep Learning': [], 'TensorFlow': [], 'PyTorch': [], 'Data Science': [],
+    'Pandas': [], 'NumPy': [], 'scikit-learn': ['sklearn'], 'NLP': [], 'Computer Vision': [],
+}
+
+# 스킬 이름에 쓰이는 +, #, . 을 단어 안에 포함하는 토큰 (예: c++, c#, node.js)
+_TOKEN_PATTERN = re.compile(r'\w+(?:[.+#]+\w+)*[+#]*')
+
+def tokenize(text: str) -> List[str]:
+    """소문자 변환 후 스킬 매칭용 토큰으로 분리"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+class SkillMatcher:
+    """스킬 사전으로 만든 토큰 단위 Aho-Corasick 오토마톤
+    
+    문서를 토큰으로 한 번 훑어 사전의 모든 스킬(여러 단어 스킬 포함)을 찾으므로
+    사전 크기와 관계없이 문서 길이에 비례하는 비용으로 매칭하고, 토큰 경계에서만
+    일치하므로 'java'가 'javascript' 안에서 잡히지 않는다.
+    """
+    
+    def __init__(self, skills: Optional[Dict[str, List[str]]] = None):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        self._canonical: Dict[Tuple[str, ...], str] = {}
+        self._signature: Optional[str] = None
+        self._built = False
+        for skill, aliases in (skills if skills is not None else DEFAULT_SKILLS).items():
+            self.add(skill, aliases)
+    
+    def __len__(self) -> int:
+        return len(self._canonical)
+    
+    def add(self, skill: str, aliases: Iterable[str] = ()):
+        """스킬(과 별칭) 추가 (다음 매칭 때 오토마톤을 다시 구성)"""
+        for term in [skill, *aliases]:
+            tokens = tuple(tokenize(term))
+            if not tokens or tokens in self._canonical:
+                continue
+            self._canonical[tokens] = skill
+            
+            state = 0
+            for token in tokens:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(skill)
+        self._signature = None
+        self._built = False
+    
+    @property
+    def signature(self) -> str:
+        """사전 내용의 해시 (사전이 바뀌면 저장된 스킬 매칭 결과를 무효화하는 데 사용)"""
+        if self._signature is None:
+            items = sorted(" ".join(tokens) + "=" + skill for tokens, skill in self._canonical.items())
+            self._signature = hashlib.sha1("\n".join(items).encode('utf-8')).hexdigest()[:16]
+        return self._signature
+    
+    def canonical(self, term: str) -> Optional[str]:
+        """용어(스킬 이름 또는 별칭)의 대표 스킬 이름 (사전에 없으면 None)"""
+        return self._canonical.get(tuple(tokenize(term)))
+    
+    def _build(self):
+        """실패 링크 계산 (너비 우선)"""
+        self._fail = [0] * len(self._goto)
+        outputs = [list(output) for output in self._output]
+        
+        # 루트의 자식은 루트로 실패하고, 그 아래는 부모의 실패 링크를 따라가며 계산
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(token, 0)
+                outputs[next_state] += outputs[self._fail[next_state]]
+        self._matches = outputs
+        self._built = True
+    
+    def find(self, text: str) -> List[str]:
+        """텍스트에 나오는 스킬의 대표 이름 목록 (처음 나온 순서, 중복 제거)"""
+        if not self._built:
+            self._build()
+        goto, fail, matches = self._goto, self._fail, self._matches
+        found: Dict[str, None] = {}
+        state = 0
+        for token in tokenize(text):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for skill in matches[state]:
+                found[skill] = None
+        return list(found)
+
+def load_skill_dictionary(path: Optional[str] = SKILL_DICTIONARY_PATH) -> Dict[str, List[str]]:
+    """기본 스킬 사전에 추가 사전 파일(JSON)을 합친 사전"""
+    skills = {skill: list(aliases) for skill, aliases in DEFAULT_SKILLS.items()}
+    if not path:
+        return skills
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            extra = json.load(f)
+    except Exception as e:
+        print(f"스킬 사전 로드 오류 ({path}): {e}")
+        return skills
+    
+    if isinstance(extra, list):
+        extra = {skill: [] for skill in extra}
+    for skill, aliases in extra.items():
+        skills.setdefault(skill, []).extend(aliases or [])
+    return skills
+
+_shared_matcher: Optional[SkillMatcher] = None
+
+def get_skill_matcher() -> SkillMatcher:
+    """기본 + 추가 사전으로 만든 공유 스킬 매처 반환"""
+    global _shared_matcher
+    if _shared_matcher is None:
+        _shared_matcher = SkillMatcher(load_skill_dictionary())
+    return _shared_matcher
@@ -0,0 +1,146 @@
+import os
+import gzip
+import json
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from app.utils.files import write_atomic
+
+# 스냅샷 저장 설정 (환경 변수로 조정 가능)
+SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', 'jobs/snapshots')
+SNAPSHOT_BASE_INTERVAL_DAYS = float(os.getenv('SNAPSHOT_BASE_INTERVAL_DAYS', '7'))
+
+# 실행마다 값이 바뀌어 변경 여부 판단에서 제외하는 필드 (수집 시각)
+VOLATILE_FIELDS = ('posted_date',)
+
+class SnapshotStore:
+    """주기적인 압축 기준(base) 스냅샷과 일일 변경분(delta)으로 채용 공고 목록을 저장하는 저장소
+    
+    - base_<시각>.json.gz: 그 시점의 전체 공고 목록
+    - delta_<시각>.json.gz: 직전 스냅샷 대비 추가/삭제/변경된 공고
+    - manifest.json: 스냅샷 목록 (파일을 모두 쓴 뒤 마지막에 교체)
+    
+    특정 시점의 목록은 가장 가까운 base에 이후 delta를 차례로 적용해 복원한다.
+    """
+    
+    def __init__(self, directory: str = SNAPSHOT_DIR, base_interval_days: float = SNAPSHOT_BASE_INTERVAL_DAYS):
+        self.directory = Path(directory)
+        self.base_interval = timedelta(days=base_interval_days)
+    
+    @property
+    def manifest_path(self) -> Path:
+        """스냅샷 목록 파일 경로"""
+        return self.directory / 'manifest.json'
+    
+    def entries(self) -> List[Dict]:
+        """스냅샷 목록 (오래된 순)"""
+        if not self.manifest_path.exists():
+            return []
+        with open(self.manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('snapshots', [])
+    
+    @staticmethod
+    def _content(job: Dict) -> Dict:
+        """변경 여부 비교에 쓰는 공고 내용 (수집 시각 제외)"""
+        return {key: value for key, value in job.items() if key not in VOLATILE_FIELDS}
+    
+    def _read(self, name: str) -> Dict:
+        """압축된 스냅샷 파일 읽기"""
+        with gzip.open(self.directory / name, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def write(self, jobs: List[Dict], keywords: List[str], location: str, timestamp: Optional[datetime] = None) -> Dict:
+        """현재 공고 목록(JSON 호환 dict)을 스냅샷으로 저장하고 manifest 항목 반환
+        
+        마지막 base가 없거나 base_interval보다 오래됐으면 base를, 아니면 직전 스냅샷 대비 delta를 쓴다.
+        """
+        timestamp = timestamp or datetime.now()
+        entries = self.entries()
+        last_base = next((entry for entry in reversed(entries) if entry['kind'] == 'base'), None)
+        
+        if last_base is None or timestamp - datetime.fromisoformat(last_base['timestamp']) >= self.base_interval:
+            kind = 'base'
+            payload = {'jobs': jobs}
+            counts = {'total': len(jobs)}
+        else:
+            kind = 'delta'
+            previous = {job['id']: job for job in self._reconstruct(entries)['jobs']}
+            current_ids = {job['id'] for job in jobs}
+            added = [job for job in jobs if job['id'] not in previous]
+            changed = [
+                job for job in jobs
+                if job['id'] in previous and self._content(job) != self._content(previous[job['id']])
+            ]
+            removed = [job_id for job_id in previous if job_id not in current_ids]
+            payload = {'added': added, 'changed': changed, 'removed': removed}
+            counts = {'total': len(jobs), 'added': len(added), 'changed': len(changed), 'removed': len(removed)}
+        
+        name = f"{kind}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json.gz"
+        payload = {'timestamp': timestamp.isoformat(), 'keywords': keywords, 'location': location, **payload}
+        
+        # 한 번만 직렬화해 압축 (mtime=0으로 같은 내용이면 같은 파일)
+        data = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        write_atomic(self.directory / name, gzip.compress(data, mtime=0))
+        
+        entry = {'name': name, 'kind': kind, 'timestamp': timestamp.isoformat(), **counts}
+        write_atomic(
+            self.manifest_path,
+            json.dumps({'snapshots': entries + [entry]}, ensure_ascii=False, indent=2).encode('utf-8')
+        )
+        return entry
+    
+    @staticmethod
+    def parse_time(at: str) -> datetime:
+        """YYYY-MM-DD(그날의 마지막 시각) 또는 ISO 형식 시각 해석 (형식이 틀리면 ValueError)"""
+        try:
+            return datetime.combine(date.fromisoformat(at), time.max)
+        except ValueError:
+            limit = datetime.fromisoformat(at)
+        # 스냅샷 시각은 로컬 시각(naive)으로 저장되므로 시간대가 있으면 로컬 시각으로 변환
+        return limit.astimezone().replace(tzinfo=None) if limit.tzinfo else limit
+    
+    def load_view(self, at: Optional[str] = None) -> Optional[Dict]:
+        """지정한 시각(ISO 형식 또는 YYYY-MM-DD, 없으면 최신) 기준의 전체 공고 목록 복원
+        
+        at의 형식이 틀리면 ValueError를 발생시킨다.
+        """
+        entries = self.entries()
+        if at is not None:
+            limit = self.parse_time(at)
+            entries = [entry for entry in entries if datetime.fromisoformat(entry['timestamp']) <= limit]
+        if not entries:
+            return None
+        return self._reconstruct(entries)
+    
+    def _reconstruct(self, entries: List[Dict]) -> Dict:
+        """마지막 base부터 이후 delta를 적용해 마지막 항목 시점의 목록 복원"""
+        start = max(index for index, entry in enumerate(entries) if entry['kind'] == 'base')
+        view = None
+        for _, view in self._apply(entries[start:]):
+            pass
+        return view
+    
+    def iter_views(self) -> Iterator[Tuple[Dict, Dict]]:
+        """모든 스냅샷 시점의 (manifest 항목, 전체 목록)을 오래된 순으로 생성"""
+        yield from self._apply(self.entries())
+    
+    def _apply(self, entries: List[Dict]) -> Iterator[Tuple[Dict, Dict]]:
+        """base/delta 항목을 차례로 적용하며 각 시점의 목록 생성 (새로 추가된 공고가 앞)"""
+        jobs: Dict[str, Dict] = {}
+        for entry in entries:
+            snapshot = self._read(entry['name'])
+            if entry['kind'] == 'base':
+                jobs = {job['id']: job for job in snapshot['jobs']}
+            else:
+                for job_id in snapshot['removed']:
+                    jobs.pop(job_id, None)
+                for job in snapshot['changed']:
+                    jobs[job['id']] = job
+                jobs = {**{job['id']: job for job in snapshot['added']}, **jobs}
+            yield entry, {
+                'timestamp': snapshot['timestamp'],
+                'total': len(jobs),
+                'keywords': snapshot['keywords'],
+                'location': snapshot['location'],
+                'jobs': list(jobs.values())
+            }
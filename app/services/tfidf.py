@@ -0,0 +1,172 @@
+import os
+import json
+import hashlib
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+from scipy import sparse
+from app.services.job_features import JobFeatureCache, JobFeatures
+from app.services.job_store import get_job_store
+from app.services.skill_matcher import tokenize
+from app.utils.files import write_atomic
+
+# TF-IDF 설정 (환경 변수로 조정 가능)
+TFIDF_MODEL_PATH = os.getenv('TFIDF_MODEL_PATH', 'data/tfidf_model.json')
+TFIDF_MIN_DF = int(os.getenv('TFIDF_MIN_DF', '1'))
+
+def corpus_signature(content_hashes: Iterable[str]) -> str:
+    """공고 내용 해시 집합으로 만든 코퍼스 서명 (순서 무관, 모델 버전 비교용)"""
+    return hashlib.sha1("\n".join(sorted(content_hashes)).encode('utf-8')).hexdigest()
+
+class TfidfModel:
+    """단어 사전과 IDF 표 (공고 코퍼스로 학습해 파일로 저장하고 재사용)
+    
+    signature는 학습에 쓴 코퍼스의 서명으로, 코퍼스가 바뀌었는지 판단해 다시 학습하는 데 쓴다.
+    """
+    
+    def __init__(self, vocabulary: List[str], idf: np.ndarray, documents: int, signature: Optional[str] = None):
+        self.vocabulary = vocabulary
+        self.term_ids: Dict[str, int] = {term: index for index, term in enumerate(vocabulary)}
+        self.idf = np.asarray(idf, dtype=np.float64)
+        self.documents = documents
+        self.signature = signature
+    
+    def __len__(self) -> int:
+        return len(self.vocabulary)
+    
+    @classmethod
+    def fit(cls, texts: List[str], min_df: int = TFIDF_MIN_DF, signature: Optional[str] = None) -> "TfidfModel":
+        """문서 빈도로 단어 사전과 IDF 계산 (min_df개 미만 문서에 나온 단어는 제외)"""
+        document_frequency = Counter()
+        for text in texts:
+            document_frequency.update(set(tokenize(text)))
+        
+        vocabulary = sorted(term for term, count in document_frequency.items() if count >= min_df)
+        df = np.array([document_frequency[term] for term in vocabulary], dtype=np.float64)
+        # 평활화한 IDF (모든 문서에 나오는 단어도 0이 되지 않음)
+        idf = np.log((1 + len(texts)) / (1 + df)) + 1
+        return cls(vocabulary, idf, len(texts), signature)
+    
+    def transform(self, texts: List[str]) -> sparse.csr_matrix:
+        """문서들을 L2 정규화한 TF-IDF 희소 행렬로 변환 (행: 문서, 사전에 없는 단어는 무시)"""
+        indptr = [0]
+        indices: List[np.ndarray] = []
+        counts: List[np.ndarray] = []
+        term_ids = self.term_ids
+        for text in texts:
+            ids = [term_ids[token] for token in tokenize(text) if token in term_ids]
+            unique_ids, unique_counts = np.unique(np.array(ids, dtype=np.int32), return_counts=True)
+            indices.append(unique_ids)
+            counts.append(unique_counts)
+            indptr.append(indptr[-1] + len(unique_ids))
+        
+        indices_array = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32)
+        counts_array = np.concatenate(counts) if counts else np.zeros(0)
+        # 로그 TF x IDF
+        data = (1 + np.log(counts_array)) * self.idf[indices_array]
+        matrix = sparse.csr_matrix(
+            (data, indices_array, np.array(indptr)), shape=(len(texts), len(self.vocabulary))
+        )
+        
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.diags(1 / norms) @ matrix
+    
+    def save(self, path: str = TFIDF_MODEL_PATH):
+        """단어 사전과 IDF 표를 JSON으로 저장"""
+        data = {
+            'documents': self.documents,
+            'signature': self.signature,
+            'vocabulary': self.vocabulary,
+            'idf': self.idf.tolist(),
+        }
+        write_atomic(Path(path), json.dumps(data, ensure_ascii=False).encode('utf-8'))
+    
+    @classmethod
+    def load(cls, path: str = TFIDF_MODEL_PATH) -> Optional["TfidfModel"]:
+        """저장된 단어 사전과 IDF 표 로드 (없거나 읽을 수 없으면 None)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return cls(data['vocabulary'], np.array(data['idf']), data['documents'], data.get('signature'))
+        except Exception as e:
+            print(f"TF-IDF 모델 로드 오류 ({path}): {e}")
+            return None
+
+def fit_job_store_model(path: Optional[str] = TFIDF_MODEL_PATH, force: bool = False) -> Optional[TfidfModel]:
+    """공고 저장소 전체로 모델 학습 후 저장 (저장된 모델이 같은 코퍼스로 학습됐으면 그대로 사용)
+    
+    저장소가 비어 있으면 None. 공고가 추가/변경/삭제되면 서명이 달라져 다시 학습한다.
+    """
+    store = get_job_store()
+    jobs = store.query_jobs(limit=store.count_jobs())
+    if not jobs:
+        return None
+    
+    job_features = JobFeatureCache(max_entries=len(jobs), persistent=True).get_many(jobs)
+    signature = corpus_signature(features.content_hash for features in job_features)
+    current = TfidfModel.load(path) if path and not force else None
+    if current is not None and current.signature == signature:
+        return current
+    
+    model = TfidfModel.fit([features.full_text for features in job_features], signature=signature)
+    if path:
+        model.save(path)
+    return model
+
+class TfidfDescriptionMatcher:
+    """이력서와 공고들의 TF-IDF 코사인 유사도를 한 번의 희소 행렬 곱으로 계산
+    
+    모델은 저장된 파일을 쓰고 (파일이 다시 학습되면 새로 로드), 없으면 공고 저장소 전체로
+    학습해 저장한다. 저장소도 비어 있으면 받은 공고로만 임시 모델을 만들고 저장하지 않는다.
+    공고 행렬은 모델과 코퍼스(공고 내용 해시 목록)가 같으면 재사용한다.
+    """
+    
+    def __init__(self, model_path: Optional[str] = TFIDF_MODEL_PATH, model: Optional[TfidfModel] = None):
+        self.model_path = model_path
+        self.model = model
+        self._model_mtime: Optional[float] = None
+        self._corpus_key: Optional[str] = None
+        self._matrix_model: Optional[TfidfModel] = None
+        self._matrix: Optional[sparse.csr_matrix] = None
+    
+    def _ensure_model(self, job_features: List[JobFeatures]) -> TfidfModel:
+        """모델 로드 (파일이 바뀌었으면 다시 로드) 또는 학습"""
+        if self.model_path and os.path.exists(self.model_path):
+            mtime = os.path.getmtime(self.model_path)
+            if mtime != self._model_mtime:
+                model = TfidfModel.load(self.model_path)
+                if model is not None:
+                    self.model, self._model_mtime = model, mtime
+        if self.model is None and self.model_path:
+            self.model = fit_job_store_model(self.model_path)
+            if self.model is not None:
+                self._model_mtime = os.path.getmtime(self.model_path)
+        if self.model is None:
+            texts = [features.full_text for features in job_features]
+            signature = corpus_signature(features.content_hash for features in job_features)
+            self.model = TfidfModel.fit(texts, signature=signature)
+        return self.model
+    
+    def job_matrix(self, job_features: List[JobFeatures]) -> sparse.csr_matrix:
+        """공고 TF-IDF 행렬 (행 순서는 입력 순서)"""
+        model = self._ensure_model(job_features)
+        corpus_key = hashlib.sha1(
+            "\n".join(features.content_hash for features in job_features).encode('utf-8')
+        ).hexdigest()
+        if corpus_key != self._corpus_key or model is not self._matrix_model:
+            self._matrix = model.transform([features.full_text for features in job_features])
+            self._corpus_key = corpus_key
+            self._matrix_model = model
+        return self._matrix
+    
+    def scores(self, text: str, job_features: List[JobFeatures]) -> np.ndarray:
+        """텍스트와 각 공고의 코사인 유사도 (0~1, 입력 순서대로)"""
+        if not job_features:
+            return np.zeros(0)
+        matrix = self.job_matrix(job_features)
+        query = self.model.transform([text])
+        return np.asarray((matrix @ query.T).todense()).ravel()
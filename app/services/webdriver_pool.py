@@ -0,0 +1,112 @@
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Callable, Optional, Set
+
+# 풀 설정 (환경 변수로 조정 가능)
+WEBDRIVER_POOL_SIZE = int(os.getenv('WEBDRIVER_POOL_SIZE', '2'))
+WEBDRIVER_MAX_PAGE_LOADS = int(os.getenv('WEBDRIVER_MAX_PAGE_LOADS', '50'))
+
+class PooledDriver:
+    """풀에서 관리하는 WebDriver와 페이지 로드 횟수"""
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.page_loads = 0
+    
+    def get(self, url: str):
+        """페이지 이동 (로드 횟수 기록)"""
+        self.page_loads += 1
+        self.driver.get(url)
+
+class WebDriverPool:
+    """크기가 제한된 Selenium WebDriver 풀
+    
+    Selenium 호출은 모두 동기 호출이므로 전용 스레드 풀(executor)에서 실행해
+    이벤트 루프가 막히지 않도록 한다.
+    """
+    
+    def __init__(
+        self,
+        driver_factory: Callable,
+        size: Optional[int] = None,
+        max_page_loads: Optional[int] = None,
+    ):
+        self.driver_factory = driver_factory
+        self.size = size or WEBDRIVER_POOL_SIZE
+        self.max_page_loads = max_page_loads or WEBDRIVER_MAX_PAGE_LOADS
+        self._live: Set[PooledDriver] = set()
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="webdriver")
+        
+        # 빈 슬롯(None)은 필요할 때 드라이버를 새로 생성
+        self._slots: asyncio.Queue = asyncio.Queue()
+        for _ in range(self.size):
+            self._slots.put_nowait(None)
+    
+    async def run(self, func: Callable, *args):
+        """동기 Selenium 작업을 전용 executor에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
+    async def checkout(self) -> PooledDriver:
+        """사용 가능한 드라이버를 가져오기 (없으면 반납될 때까지 대기)"""
+        pooled = await self._slots.get()
+        try:
+            if pooled is not None and not await self.run(self._is_healthy, pooled):
+                print("WebDriver 상태 확인 실패, 새 드라이버로 교체합니다.")
+                self._executor.submit(self._discard, pooled)
+                pooled = None
+            
+            if pooled is None:
+                pooled = PooledDriver(await self.run(self.driver_factory))
+                self._live.add(pooled)
+            return pooled
+        except BaseException:
+            self._slots.put_nowait(None)
+            raise
+    
+    def checkin(self, pooled: PooledDriver, discard: bool = False):
+        """드라이버 반납 (페이지 로드 한도를 넘으면 재생성 대상)"""
+        if discard or pooled.page_loads >= self.max_page_loads:
+            self._live.discard(pooled)
+            self._executor.submit(self._discard, pooled)
+            self._slots.put_nowait(None)
+        else:
+            self._slots.put_nowait(pooled)
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """checkout/checkin을 묶은 컨텍스트 매니저"""
+        pooled = await self.checkout()
+        discard = False
+        try:
+            yield pooled
+        except asyncio.CancelledError:
+            # executor 스레드가 아직 드라이버를 사용 중일 수 있으므로 재사용하지 않음
+            discard = True
+            raise
+        finally:
+            self.checkin(pooled, discard=discard)
+    
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """드라이버 세션이 살아 있는지 확인"""
+        try:
+            pooled.driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    def _discard(self, pooled: PooledDriver):
+        """드라이버 종료 및 풀에서 제거"""
+        self._live.discard(pooled)
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+    
+    def close(self):
+        """풀의 모든 드라이버 및 executor 종료"""
+        for pooled in list(self._live):
+            self._discard(pooled)
+        self._executor.shutdown(wait=False)
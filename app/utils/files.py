@@ -0,0 +1,18 @@
+import os
+import tempfile
+from pathlib import Path
+
+def write_atomic(path: Path, data: bytes):
+    """같은 디렉토리의 임시 파일에 쓴 뒤 교체 (읽는 쪽은 이전 파일 또는 완성된 파일만 봄)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,58 @@
+import re
+import hashlib
+import urllib.parse
+from typing import Optional
+
+# 공고 식별과 무관한 추적용 쿼리 파라미터
+TRACKING_PARAMS = {
+    'trk', 'trackingid', 'refid', 'position', 'pagenum', 'from', 'tk', 'vjs',
+    'fccid', 'advn', 'sjdu', 'acatk', 'pub', 'camk', 'xkcb', 'xpse', 'xfps', 'ebp', 'originalsubdomain',
+}
+TRACKING_PREFIXES = ('utm_', 'trk')
+
+LINKEDIN_JOB_ID_PATTERN = re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d+)')
+
+def canonicalize_url(url: str) -> str:
+    """추적용 파라미터와 fragment를 제거하고 쿼리 순서를 정렬한 URL"""
+    parts = urllib.parse.urlsplit(url.strip())
+    query = [
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    return urllib.parse.urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip('/'),
+        urllib.parse.urlencode(sorted(query)),
+        ''
+    ))
+
+def native_job_id(source: str, url: str) -> Optional[str]:
+    """URL에서 플랫폼 고유의 공고 ID 추출 (LinkedIn: /jobs/view/<id>, Indeed: jk=)"""
+    if not url:
+        return None
+    parts = urllib.parse.urlsplit(url)
+    params = urllib.parse.parse_qs(parts.query)
+    
+    if source == 'linkedin':
+        match = LINKEDIN_JOB_ID_PATTERN.search(parts.path)
+        if match:
+            return match.group(1)
+        return params.get('currentJobId', [None])[0]
+    
+    if source == 'indeed':
+        return (params.get('jk') or params.get('vjk') or [None])[0]
+    
+    return None
+
+def make_job_id(source: str, url: str, fallback: str = "") -> str:
+    """소스 + 고유 공고 ID(없으면 정규화된 URL)를 해시한 안정적인 공고 ID"""
+    native_id = native_job_id(source, url)
+    if native_id:
+        basis = f"{source}:id:{native_id}"
+    elif url:
+        basis = f"{source}:url:{canonicalize_url(url)}"
+    else:
+        basis = f"{source}:text:{fallback.strip().lower()}"
+    return f"{source}_{hashlib.sha1(basis.encode('utf-8')).hexdigest()[:16]}"
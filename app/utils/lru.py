@@ -0,0 +1,68 @@
+import threading
+from collections import OrderedDict
+from typing import Generic, Hashable, Iterator, Optional, TypeVar
+
+V = TypeVar('V')
+
+class LRUCache(Generic[V]):
+    """최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 제거하는 메모리 캐시
+    
+    만료 판단이 필요한 캐시는 peek으로 꺼내 확인한 뒤 유효할 때만 touch한다.
+    여러 스레드(이벤트 루프와 스레드풀)에서 함께 쓸 수 있도록 각 연산은 잠금으로 보호하고,
+    peek과 touch 사이에 항목이 제거됐으면 touch는 아무것도 하지 않는다.
+    """
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+        self.evictions = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+    
+    def peek(self, key: Hashable) -> Optional[V]:
+        """사용 순서를 바꾸지 않고 조회"""
+        with self._lock:
+            return self._entries.get(key)
+    
+    def get(self, key: Hashable) -> Optional[V]:
+        """조회 후 최근 사용으로 표시"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def touch(self, key: Hashable):
+        """항목을 최근 사용으로 표시 (그 사이 제거된 항목이면 무시)"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+    
+    def put(self, key: Hashable, value: V):
+        """항목 저장 후 최대 개수를 넘으면 가장 오래 사용되지 않은 항목 제거"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def pop(self, key: Hashable) -> Optional[V]:
+        """항목 제거"""
+        with self._lock:
+            return self._entries.pop(key, None)
+    
+    def values(self) -> Iterator[V]:
+        """저장된 값 (오래 사용되지 않은 순, 호출 시점의 복사본)"""
+        with self._lock:
+            return iter(list(self._entries.values()))
+    
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
@@ -9,6 +9,16 @@ interface JobFile {
   modified: string;
 }
 
+interface SnapshotEntry {
+  name: string;
+  kind: 'base' | 'delta';
+  timestamp: string;
+  total: number;
+  added?: number;
+  changed?: number;
+  removed?: number;
+}
+
 interface ResumeFile {
   name: string;
   size: number;
@@ -19,6 +29,7 @@ interface ResumeFile {
 const LocalDashboard: React.FC = () => {
   const [activeTab, setActiveTab] = useState<'search' | 'results' | 'compare'>('search');
   const [jobFiles, setJobFiles] = useState<JobFile[]>([]);
+  const [snapshots, setSnapshots] = useState<SnapshotEntry[]>([]);
   const [resumeFiles, setResumeFiles] = useState<ResumeFile[]>([]);
   const [selectedJobFile, setSelectedJobFile] = useState<string>('latest.json');
   const [selectedResume, setSelectedResume] = useState<string>('');
@@ -30,6 +41,7 @@ const LocalDashboard: React.FC = () => {
 
   useEffect(() => {
     loadJobFiles();
+    loadSnapshots();
     loadResumeFiles();
   }, []);
 
@@ -43,6 +55,17 @@ const LocalDashboard: React.FC = () => {
     }
   };
 
+  const loadSnapshots = async () => {
+    try {
+      const response = await fetch(`${API_BASE_URL}/api/local/snapshots`);
+      const data = await response.json();
+      // 최신 스냅샷이 위로 오도록
+      setSnapshots((data.snapshots || []).slice().reverse());
+    } catch (error) {
+      console.error('Failed to load snapshots:', error);
+    }
+  };
+
   const loadResumeFiles = async () => {
     try {
       const response = await fetch(`${API_BASE_URL}/api/local/uploads/list`);
@@ -80,6 +103,7 @@ const LocalDashboard: React.FC = () => {
       if (data.success) {
         setMessage({ type: 'success', text: '채용 공고 검색이 완료되었습니다!' });
         loadJobFiles();
+        loadSnapshots();
         setTimeout(() => setActiveTab('results'), 1000);
       } else {
         setMessage({ type: 'error', text: data.message || '검색 중 오류가 발생했습니다' });
@@ -159,6 +183,10 @@ const LocalDashboard: React.FC = () => {
     window.open(`${API_BASE_URL}/api/local/jobs/${filename}`, '_blank');
   };
 
+  const viewSnapshot = (timestamp: string) => {
+    window.open(`${API_BASE_URL}/api/local/snapshots/${encodeURIComponent(timestamp)}`, '_blank');
+  };
+
   return (
     <div className="local-dashboard">
       <header className="dashboard-header">
@@ -258,6 +286,33 @@ const LocalDashboard: React.FC = () => {
                 ))
               )}
             </div>
+
+            <h2>수집 이력</h2>
+            <div className="file-list">
+              {snapshots.length === 0 ? (
+                <p className="empty">저장된 스냅샷이 없습니다.</p>
+              ) : (
+                snapshots.map((snapshot) => (
+                  <div key={snapshot.name} className="file-item">
+                    <div className="file-info">
+                      <h3>{new Date(snapshot.timestamp).toLocaleString('ko-KR')}</h3>
+                      <p>
+                        {snapshot.kind === 'base' ? '기준 스냅샷' : '변경분'} | 
+                        공고: {snapshot.total}개
+                        {snapshot.kind === 'delta' &&
+                          ` | 추가 ${snapshot.added ?? 0} · 변경 ${snapshot.changed ?? 0} · 삭제 ${snapshot.removed ?? 0}`}
+                      </p>
+                    </div>
+                    <button
+                      className="secondary-button"
+                      onClick={() => viewSnapshot(snapshot.timestamp)}
+                    >
+                      JSON 보기
+                    </button>
+                  </div>
+                ))
+              )}
+            </div>
           </div>
         )}
 
@@ -0,0 +1,113 @@
+"""
+로컬 스텁 서버를 사용해 IndeedScraper의 동시 검색 처리량을 측정하는 스크립트
+"""
+import sys
+import io
+import time
+import asyncio
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    try:
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    except:
+        pass
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.indeed_scraper import IndeedScraper
+from app.services.http_client import create_http_client
+from app.services.http_cache import HttpResponseCache
+
+CARD_HTML = """
+<div class="job_seen_beacon">
+    <h2 class="jobTitle">Python Developer {idx}</h2>
+    <span class="companyName">Stub Company {idx}</span>
+    <div class="companyLocation">Seoul</div>
+    <a class="jcs-JobTitle" href="/viewjob?jk=stub{idx}">link</a>
+    <div class="job-snippet">Python, FastAPI, Docker</div>
+</div>
+"""
+
+def make_handler(delay: float, cards: int):
+    """지정한 지연 시간 후 가짜 검색 결과를 반환하는 핸들러 생성"""
+    body = ("<html><body>" + "".join(CARD_HTML.format(idx=i) for i in range(cards)) + "</body></html>").encode('utf-8')
+    
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def do_GET(self):
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return StubHandler
+
+async def run_sequential(scraper: IndeedScraper, count: int) -> float:
+    """검색을 하나씩 순서대로 실행"""
+    start = time.perf_counter()
+    for i in range(count):
+        await scraper.search(f"python {i}", max_results=10)
+    return time.perf_counter() - start
+
+async def run_concurrent(scraper: IndeedScraper, count: int) -> float:
+    """검색을 동시에 실행"""
+    start = time.perf_counter()
+    await asyncio.gather(*[scraper.search(f"python {i}", max_results=10) for i in range(count)])
+    return time.perf_counter() - start
+
+async def run_benchmark(base_url: str, count: int, max_connections: int):
+    """순차 실행과 동시 실행의 처리량 비교"""
+    client = create_http_client(max_connections=max_connections, max_keepalive_connections=max_connections)
+    
+    def make_scraper() -> IndeedScraper:
+        # 패스마다 캐시를 따로 두고 저장 시간을 0으로 해서 두 패스 모두 실제 요청을 측정
+        return IndeedScraper(base_url=base_url, client=client, response_cache=HttpResponseCache(ttl=0))
+    
+    try:
+        sequential = await run_sequential(make_scraper(), count)
+        concurrent = await run_concurrent(make_scraper(), count)
+    finally:
+        await client.aclose()
+    
+    print(f"[SEQUENTIAL] {count}회 검색: {sequential:.2f}초 ({count / sequential:.1f} req/s)")
+    print(f"[CONCURRENT] {count}회 검색: {concurrent:.2f}초 ({count / concurrent:.1f} req/s)")
+    print(f"[SPEEDUP] {sequential / concurrent:.1f}x")
+
+def main():
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='IndeedScraper 동시 검색 처리량 벤치마크')
+    parser.add_argument('--requests', type=int, default=20, help='검색 횟수 (기본: 20)')
+    parser.add_argument('--delay', type=float, default=0.2, help='스텁 서버 응답 지연 초 (기본: 0.2)')
+    parser.add_argument('--cards', type=int, default=15, help='페이지당 채용 공고 수 (기본: 15)')
+    parser.add_argument('--max-connections', type=int, default=20, help='커넥션 풀 크기 (기본: 20)')
+    args = parser.parse_args()
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.delay, args.cards))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/jobs"
+    
+    print("=" * 70)
+    print(f"[BENCHMARK] 스텁 서버: {base_url} (지연 {args.delay}초)")
+    print("=" * 70)
+    
+    try:
+        asyncio.run(run_benchmark(base_url, args.requests, args.max_connections))
+    finally:
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+저장된 검색 결과 페이지로 HTML 파싱 시간을 측정하는 마이크로 벤치마크 스크립트
+"""
+import sys
+import io
+import time
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    try:
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    except:
+        pass
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+from app.services.html_parser import PARSER_BACKEND, parse_elements
+
+# 소스별 채용 공고 카드 요소
+CARD_SELECTORS = {
+    'linkedin': ('div', 'base-card'),
+    'indeed': ('div', 'job_seen_beacon'),
+}
+
+def generate_page(source: str, cards: int) -> str:
+    """카드와 주변 마크업이 섞인 가짜 검색 결과 페이지 생성"""
+    tag, class_name = CARD_SELECTORS[source]
+    noise = "".join(
+        f'<nav class="menu"><ul>{"".join(f"<li><a href=/x/{j}>link {j}</a></li>" for j in range(20))}</ul></nav>'
+        for _ in range(10)
+    )
+    body = "".join(
+        f'<{tag} class="{class_name} extra"><h3 class="base-search-card__title">Engineer {i}</h3>'
+        f'<h4 class="base-search-card__subtitle">Company {i}</h4>'
+        f'<span class="job-search-card__location">Seoul</span>'
+        f'<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/{i}">view</a>'
+        f'<script>var tracking = {{"id": {i}, "data": "{"x" * 200}"}};</script></{tag}>'
+        f'<div class="ad-banner">{noise[:2000]}</div>'
+        for i in range(cards)
+    )
+    return f"<html><head><script>{'var a = 1;' * 500}</script></head><body>{noise}{body}</body></html>"
+
+def load_pages(paths: list) -> list:
+    """파일 또는 디렉토리에서 저장된 HTML 페이지 로드"""
+    pages = []
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.rglob('*.html')) if path.is_dir() else [path]
+        for file in files:
+            pages.append(file.read_text(encoding='utf-8', errors='ignore'))
+    return pages
+
+def time_parser(name: str, func, pages: list, repeat: int) -> float:
+    """페이지당 평균 파싱 시간(ms) 측정"""
+    cards = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            cards += len(func(page))
+    elapsed_ms = (time.perf_counter() - start) * 1000 / (repeat * len(pages))
+    print(f"  {name:<32} {elapsed_ms:8.2f} ms/page  (카드 {cards // repeat}개)")
+    return elapsed_ms
+
+def main():
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='HTML 파싱 마이크로 벤치마크')
+    parser.add_argument('pages', nargs='*', help='저장된 HTML 파일 또는 디렉토리 (없으면 가짜 페이지 생성)')
+    parser.add_argument('--source', choices=sorted(CARD_SELECTORS), default='linkedin', help='카드 형식 (기본: linkedin)')
+    parser.add_argument('--cards', type=int, default=100, help='생성할 페이지의 카드 수 (기본: 100)')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (기본: 5)')
+    args = parser.parse_args()
+    
+    pages = load_pages(args.pages) if args.pages else [generate_page(args.source, args.cards)]
+    if not pages:
+        print("[ERROR] HTML 페이지를 찾을 수 없습니다.")
+        sys.exit(1)
+    
+    tag, class_name = CARD_SELECTORS[args.source]
+    total_kb = sum(len(page) for page in pages) / 1024
+    
+    print("=" * 70)
+    print(f"[BENCHMARK] 페이지 {len(pages)}개 ({total_kb:.0f} KB), 반복 {args.repeat}회")
+    print("=" * 70)
+    
+    baseline = time_parser(
+        "html.parser 전체 트리",
+        lambda page: BeautifulSoup(page, 'html.parser').find_all(tag, class_=class_name),
+        pages, args.repeat
+    )
+    restricted = time_parser(
+        f"{PARSER_BACKEND} + SoupStrainer",
+        lambda page: parse_elements(page, tag, class_name),
+        pages, args.repeat
+    )
+    
+    print(f"\n[SPEEDUP] {baseline / restricted:.1f}x")
+
+if __name__ == '__main__':
+    main()
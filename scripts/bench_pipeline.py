@@ -0,0 +1,149 @@
+"""
+기록해 둔 페이지(아카이브)로 일일 검색 파이프라인을 단계별로 측정하는 벤치마크 스크립트
+
+먼저 기록 모드로 실제 검색을 한 번 실행해 페이지를 저장한다:
+    SCRAPER_ARCHIVE_MODE=record python scripts/daily_job_search.py
+
+그 다음 네트워크 없이 재생 모드로 측정한다:
+    python scripts/bench_pipeline.py --archive archive
+"""
+import os
+import sys
+import io
+import json
+import time
+import asyncio
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    try:
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    except:
+        pass
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.job import JobSearchRequest
+from app.services.job_search import JobSearchService
+from app.services.linkedin_scraper import LinkedInScraper
+from app.services.indeed_scraper import IndeedScraper
+from app.services.description_cache import DescriptionCache
+from app.services.http_cache import HttpResponseCache
+from app.services.page_archive import PageArchive
+from app.services.html_parser import parse_elements
+from app.services.dedup import dedupe_jobs
+
+# 아카이브 페이지에서 찾을 요소 (검색 결과 카드, 상세 설명)
+PARSE_TARGETS = [
+    ('div', 'base-card'),
+    ('div', 'job_seen_beacon'),
+    ('div', 'show-more-less-html__markup'),
+]
+
+def build_service(archive: PageArchive, cache_dir: str) -> JobSearchService:
+    """재생 아카이브를 사용하는 검색 서비스 생성 (캐시는 매번 비어 있는 상태)"""
+    linkedin = LinkedInScraper(
+        archive=archive,
+        response_cache=HttpResponseCache(),
+        description_cache=DescriptionCache(path=os.path.join(cache_dir, f"descriptions_{time.time_ns()}.sqlite3")),
+    )
+    indeed = IndeedScraper(archive=archive, response_cache=HttpResponseCache())
+    return JobSearchService(linkedin_scraper=linkedin, indeed_scraper=indeed)
+
+async def scrape(service: JobSearchService, keywords: list, location: str, max_results: int) -> list:
+    """daily_job_search.py와 같은 방식으로 모든 키워드 검색"""
+    requests = [
+        JobSearchRequest(keyword=keyword, location=location, max_results=max_results, sources=['linkedin', 'indeed'])
+        for keyword in keywords
+    ]
+    results = await asyncio.gather(*[service.search_jobs(request) for request in requests])
+    return [job for jobs in results for job in jobs]
+
+def parse_archive(archive: PageArchive) -> int:
+    """아카이브의 모든 페이지를 다시 파싱해 찾은 요소 수 반환"""
+    found = 0
+    for html in archive.iter_pages():
+        for tag, class_name in PARSE_TARGETS:
+            found += len(parse_elements(html, tag, class_name))
+    return found
+
+def serialize(jobs: list, keywords: list, location: str) -> int:
+    """결과 JSON 직렬화 후 바이트 수 반환"""
+    payload = json.dumps({
+        'timestamp': datetime.now().isoformat(),
+        'total': len(jobs),
+        'keywords': keywords,
+        'location': location,
+        'jobs': [job.model_dump(mode='json') for job in jobs]
+    }, ensure_ascii=False)
+    return len(payload.encode('utf-8'))
+
+def run_once(archive: PageArchive, cache_dir: str, keywords: list, location: str, max_results: int) -> dict:
+    """파이프라인을 한 번 실행하고 단계별 시간(ms) 반환"""
+    timings = {}
+    service = build_service(archive, cache_dir)
+    try:
+        start = time.perf_counter()
+        jobs = asyncio.run(scrape(service, keywords, location, max_results))
+        timings['scrape'] = (time.perf_counter() - start) * 1000
+    finally:
+        service.close()
+    
+    start = time.perf_counter()
+    elements = parse_archive(archive)
+    timings['parse'] = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    unique_jobs = dedupe_jobs(jobs)
+    timings['dedup'] = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    size = serialize(unique_jobs, keywords, location)
+    timings['serialize'] = (time.perf_counter() - start) * 1000
+    
+    timings['_counts'] = {'jobs': len(jobs), 'unique': len(unique_jobs), 'elements': elements, 'bytes': size}
+    return timings
+
+def main():
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='기록된 페이지로 검색 파이프라인 단계별 벤치마크')
+    parser.add_argument('--archive', default=os.getenv('SCRAPER_ARCHIVE_DIR', 'archive'), help='아카이브 디렉토리 (기본: archive)')
+    parser.add_argument('--keywords', default=os.getenv('SEARCH_KEYWORDS', 'Python Developer,Software Engineer'), help='쉼표로 구분한 검색 키워드')
+    parser.add_argument('--location', default=os.getenv('SEARCH_LOCATION', 'Seoul, South Korea'), help='검색 지역')
+    parser.add_argument('--max-results', type=int, default=30, help='키워드당 최대 결과 수 (기록 시와 같아야 함, 기본: 30)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (기본: 3)')
+    args = parser.parse_args()
+    
+    if not Path(args.archive).exists():
+        print(f"[ERROR] 아카이브를 찾을 수 없습니다: {args.archive}")
+        print("[TIP] 먼저 기록 모드로 검색하세요: SCRAPER_ARCHIVE_MODE=record python scripts/daily_job_search.py")
+        sys.exit(1)
+    
+    keywords = [keyword.strip() for keyword in args.keywords.split(',') if keyword.strip()]
+    archive = PageArchive(mode='replay', directory=args.archive)
+    
+    print("=" * 70)
+    print(f"[BENCHMARK] 아카이브: {args.archive}, 키워드 {len(keywords)}개, 반복 {args.repeat}회")
+    print("=" * 70)
+    
+    stages = ['scrape', 'parse', 'dedup', 'serialize']
+    runs = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for _ in range(args.repeat):
+            runs.append(run_once(archive, cache_dir, keywords, args.location, args.max_results))
+    
+    counts = runs[-1]['_counts']
+    print(f"  공고 {counts['jobs']}개 (고유 {counts['unique']}개), 파싱 요소 {counts['elements']}개, JSON {counts['bytes'] / 1024:.0f} KB\n")
+    print(f"  {'stage':<12}{'min (ms)':>12}{'avg (ms)':>12}")
+    for stage in stages:
+        values = [run[stage] for run in runs]
+        print(f"  {stage:<12}{min(values):>12.2f}{sum(values) / len(values):>12.2f}")
+
+if __name__ == '__main__':
+    main()
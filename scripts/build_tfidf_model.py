@@ -0,0 +1,47 @@
+"""
+채용 공고 저장소(DATABASE_URL) 전체로 TF-IDF 단어 사전/IDF 표를 학습해 저장하는 스크립트
+
+저장된 모델이 같은 코퍼스로 학습됐으면 다시 학습하지 않는다 (--force로 강제).
+
+    python scripts/build_tfidf_model.py
+    python scripts/build_tfidf_model.py --force
+"""
+import sys
+import io
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    try:
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    except:
+        pass
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.tfidf import TFIDF_MODEL_PATH, TfidfModel, fit_job_store_model
+
+def main():
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='공고 저장소로 TF-IDF 모델 학습')
+    parser.add_argument('--model', default=TFIDF_MODEL_PATH, help=f'모델 파일 경로 (기본: {TFIDF_MODEL_PATH})')
+    parser.add_argument('--force', action='store_true', help='코퍼스가 같아도 다시 학습')
+    args = parser.parse_args()
+    
+    previous = TfidfModel.load(args.model)
+    model = fit_job_store_model(args.model, force=args.force)
+    if model is None:
+        print("[ERROR] 공고 저장소가 비어 있습니다. 먼저 채용 공고를 수집하세요: python scripts/daily_job_search.py")
+        sys.exit(1)
+    
+    if previous is not None and previous.signature == model.signature and not args.force:
+        print(f"[SKIP] 코퍼스가 바뀌지 않아 기존 모델을 유지합니다: {args.model}")
+    else:
+        print(f"[SUCCESS] TF-IDF 모델 저장: {args.model}")
+    print(f"  공고 {model.documents}개, 단어 {len(model)}개, 코퍼스 서명 {model.signature[:12]}")
+
+if __name__ == '__main__':
+    main()
@@ -20,7 +20,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.services.resume_parser import ResumeParser
 from app.services.matching import MatchingService
+from app.services.tfidf import TfidfDescriptionMatcher
 from app.models.job import JobPosting
+from app.services.snapshot_store import SnapshotStore
 
 def load_resume(file_path):
     """이력서 파일 로드 및 파싱"""
@@ -57,55 +59,61 @@ def load_jobs(jobs_file=None):
     try:
         with open(jobs_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
-        
-        # JSON 데이터를 JobPosting 객체로 변환
-        jobs = []
-        for job_data in data.get('jobs', []):
-            try:
-                job = JobPosting(**job_data)
-                jobs.append(job)
-            except Exception as e:
-                print(f"[WARNING] 채용 공고 파싱 오류: {e}")
-                continue
-        
-        print(f"[SUCCESS] {len(jobs)}개의 채용 공고 로드 완료")
-        return jobs
+        return parse_jobs(data)
     except Exception as e:
         print(f"[ERROR] 채용 공고 파일 읽기 오류: {e}")
         return None
 
-def compare_resume_with_jobs(resume_data, jobs, top_n=10):
-    """이력서와 채용 공고 비교"""
-    matching_service = MatchingService()
+def load_snapshot_jobs(at):
+    """jobs/snapshots 이력에서 지정한 날짜(YYYY-MM-DD) 또는 시각 기준의 채용 공고 로드"""
+    store = SnapshotStore(str(Path(__file__).parent.parent / 'jobs' / 'snapshots'))
+    try:
+        view = store.load_view(at)
+    except Exception as e:
+        print(f"[ERROR] 스냅샷 읽기 오류: {e}")
+        return None
+    
+    if view is None:
+        print(f"[ERROR] {at} 시점의 스냅샷을 찾을 수 없습니다")
+        return None
+    return parse_jobs(view)
+
+def parse_jobs(data):
+    """JSON 데이터를 JobPosting 객체로 변환"""
+    jobs = []
+    for job_data in data.get('jobs', []):
+        try:
+            job = JobPosting(**job_data)
+            jobs.append(job)
+        except Exception as e:
+            print(f"[WARNING] 채용 공고 파싱 오류: {e}")
+            continue
+    
+    print(f"[SUCCESS] {len(jobs)}개의 채용 공고 로드 완료")
+    return jobs
+
+def compare_resume_with_jobs(resume_data, jobs, top_n=10, use_tfidf=False):
+    """이력서와 채용 공고 비교 (use_tfidf: 설명 매칭을 TF-IDF 코사인 유사도로 계산)"""
+    matching_service = MatchingService(description_matcher=TfidfDescriptionMatcher() if use_tfidf else None)
     
     print(f"\n[COMPARING] 이력서와 {len(jobs)}개 채용 공고 비교 중...")
     print("=" * 70)
     
     results = []
     
+    # 공고가 많으면 역색인으로 고른 후보만 전체 점수를 계산 (점수순 상위 top_n개)
     import asyncio
-    async def compare_all():
-        tasks = []
-        for job in jobs:
-            tasks.append(matching_service.calculate_match(resume_data, job))
-        
-        match_scores = await asyncio.gather(*tasks)
-        return match_scores
-    
-    match_scores = asyncio.run(compare_all())
+    ranked = asyncio.run(matching_service.rank_matches(resume_data, jobs, top_n))
     
     # 결과 정리
-    for job, score in zip(jobs, match_scores):
+    for job, score in ranked:
         results.append({
             'job': job,
             'score': score,
             'overall_score': score.overall_score
         })
     
-    # 점수순으로 정렬
-    results.sort(key=lambda x: x['overall_score'], reverse=True)
-    
-    return results[:top_n]
+    return results
 
 def display_comparison_results(resume_data, results):
     """비교 결과 출력"""
@@ -424,8 +432,10 @@ def main():
     parser = argparse.ArgumentParser(description='이력서와 채용 공고 비교 분석')
     parser.add_argument('resume', help='이력서 파일 경로 (PDF, DOCX, TXT)')
     parser.add_argument('--jobs', help='채용 공고 JSON 파일 경로 (기본: jobs/latest.json)')
+    parser.add_argument('--snapshot', help='jobs/snapshots 이력에서 이 날짜(YYYY-MM-DD) 기준 채용 공고와 비교')
     parser.add_argument('--top', type=int, default=10, help='상위 N개 결과만 표시 (기본: 10)')
     parser.add_argument('--html', action='store_true', help='HTML 리포트 생성')
+    parser.add_argument('--tfidf', action='store_true', help='설명 매칭을 TF-IDF 코사인 유사도로 계산')
     parser.add_argument('--output', help='HTML 리포트 출력 파일 경로')
     
     args = parser.parse_args()
@@ -440,12 +450,12 @@ def main():
         sys.exit(1)
     
     # 채용 공고 로드
-    jobs = load_jobs(args.jobs)
+    jobs = load_snapshot_jobs(args.snapshot) if args.snapshot else load_jobs(args.jobs)
     if not jobs:
         sys.exit(1)
     
     # 비교 분석
-    results = compare_resume_with_jobs(resume_data, jobs, args.top)
+    results = compare_resume_with_jobs(resume_data, jobs, args.top, use_tfidf=args.tfidf)
     
     # 결과 출력
     display_comparison_results(resume_data, results)
@@ -4,14 +4,40 @@ GitHub Actions에서 실행되는 일일 채용 공고 검색 스크립트
 import os
 import sys
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.services.job_search import JobSearchService
-from app.models.job import JobSearchRequest
+from app.models.job import JobPosting, JobSearchRequest
+from app.services.dedup import NearDuplicateIndex, dedupe_jobs
+from app.services.job_store import get_job_store
+from app.services.snapshot_store import SnapshotStore
+from app.services.tfidf import fit_job_store_model
+from app.utils.files import write_atomic
+
+# 증분 수집: 이전 결과(latest.json)에 있는 공고는 건너뛰고 새 공고만 수집
+INCREMENTAL_CRAWL = os.getenv('INCREMENTAL_CRAWL', 'false').lower() in ('1', 'true', 'yes')
+# 증분 수집에서 이 기간(일) 동안 검색 결과에 다시 나오지 않은 이전 공고는 마감된 것으로 보고 제외
+INCREMENTAL_RETENTION_DAYS = float(os.getenv('INCREMENTAL_RETENTION_DAYS', '7'))
+
+def load_previous_jobs(latest_file: Path) -> tuple:
+    """이전 실행의 전체 결과(latest.json)와 공고별 마지막 확인 시각 로드 (없거나 읽을 수 없으면 빈 값)"""
+    if not latest_file.exists():
+        return [], {}
+    try:
+        with open(latest_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        jobs = [JobPosting(**job) for job in data.get('jobs', [])]
+        # 마지막 확인 시각이 없는 이전 형식은 결과 저장 시각에 확인한 것으로 간주
+        saved_at = data.get('timestamp') or datetime.now().isoformat()
+        last_seen = data.get('last_seen', {})
+        return jobs, {job.id: last_seen.get(job.id, saved_at) for job in jobs}
+    except Exception as e:
+        print(f"⚠️  이전 결과를 읽을 수 없어 전체 수집합니다: {e}")
+        return [], {}
 
 def main():
     """메인 실행 함수"""
@@ -22,11 +48,19 @@ def main():
     # 결과 저장 디렉토리
     jobs_dir = Path(__file__).parent.parent / 'jobs'
     jobs_dir.mkdir(exist_ok=True)
+    latest_file = jobs_dir / 'latest.json'
     
     all_jobs = []
     search_service = JobSearchService()
     
+    # 증분 수집이면 이전 결과의 공고 ID를 알고 있는 공고로 사용
+    previous_jobs, last_seen = load_previous_jobs(latest_file) if INCREMENTAL_CRAWL else ([], {})
+    known_ids = {job.id for job in previous_jobs}
+    seen_known_ids = set()  # 이번 검색 결과에 다시 나온 이전 공고
+    
     print(f"🔍 채용 공고 검색 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    if INCREMENTAL_CRAWL:
+        print(f"♻️  증분 수집 모드: 이전 공고 {len(known_ids)}개는 건너뜀")
     
     # 비동기 실행을 위한 래퍼
     import asyncio
@@ -48,7 +82,10 @@ def main():
                 sources=['linkedin', 'indeed']
             )
             
-            tasks.append(search_service.search_jobs(request))
+            if known_ids:
+                tasks.append(search_service.search_new_jobs(request, known_ids, seen_known_ids))
+            else:
+                tasks.append(search_service.search_jobs(request))
         
         # 모든 검색을 병렬로 실행
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -63,46 +100,75 @@ def main():
         
         return jobs_list
     
-    all_jobs = asyncio.run(search_all_keywords())
-    
-    # 중복 제거 (URL 기준)
-    seen_urls = set()
-    unique_jobs = []
-    for job in all_jobs:
-        if job.url not in seen_urls:
-            seen_urls.add(job.url)
-            unique_jobs.append(job)
+    try:
+        all_jobs = asyncio.run(search_all_keywords())
+    finally:
+        search_service.close()
     
-    print(f"\n📊 총 {len(unique_jobs)}개의 고유한 채용 공고 발견")
+    timestamp = datetime.now()
     
-    # 결과를 JSON 파일로 저장
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    output_file = jobs_dir / f'jobs_{timestamp}.json'
+    # 다시 나온 이전 공고는 마지막 확인 시각을 갱신하고, 보존 기간 동안 나오지 않은 공고는 제외
+    for job_id in seen_known_ids:
+        last_seen[job_id] = timestamp.isoformat()
+    cutoff = timestamp - timedelta(days=INCREMENTAL_RETENTION_DAYS)
+    kept_jobs = [job for job in previous_jobs if datetime.fromisoformat(last_seen[job.id]) >= cutoff]
     
-    # Pydantic 모델을 dict로 변환
-    jobs_data = [job.model_dump() for job in unique_jobs]
+    # 중복 제거 (공고 ID 및 MinHash/LSH 유사 중복 기준, 증분 수집이면 이전 공고와도 비교)
+    near_duplicates = NearDuplicateIndex()
+    for job in kept_jobs:
+        near_duplicates.add(job.id, job)
+    new_jobs = dedupe_jobs(all_jobs, near_duplicates)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'total': len(unique_jobs),
-            'keywords': keywords,
-            'location': location,
-            'jobs': jobs_data
-        }, f, ensure_ascii=False, indent=2)
+    # 전체 결과: 새 공고 + 보존 기간 안의 이전 공고
+    unique_jobs = new_jobs + kept_jobs
     
-    print(f"💾 결과 저장: {output_file}")
-    
-    # 최신 결과를 latest.json으로도 저장
-    latest_file = jobs_dir / 'latest.json'
-    with open(latest_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'total': len(unique_jobs),
-            'keywords': keywords,
-            'location': location,
-            'jobs': jobs_data
-        }, f, ensure_ascii=False, indent=2)
+    if INCREMENTAL_CRAWL:
+        print(f"\n📊 새 채용 공고 {len(new_jobs)}개, 다시 확인 {len(seen_known_ids)}개, "
+              f"만료 {len(previous_jobs) - len(kept_jobs)}개, 전체 {len(unique_jobs)}개")
+    else:
+        print(f"\n📊 총 {len(unique_jobs)}개의 고유한 채용 공고 발견")
+    
+    # 이번에 수집하거나 다시 확인한 공고를 저장소에 반영 (last_seen 갱신, API와 같은 데이터베이스 공유)
+    seen_jobs = new_jobs + [job for job in kept_jobs if job.id in seen_known_ids]
+    try:
+        store = get_job_store()
+        store.upsert_jobs(seen_jobs, seen_at=timestamp)
+        print(f"🗄️  저장소 반영: {len(seen_jobs)}개 (전체 {store.count_jobs()}개)")
+        
+        # 저장소 공고가 바뀌었으면 TF-IDF 모델을 다시 학습 (같은 코퍼스면 기존 모델 유지)
+        model = fit_job_store_model()
+        if model is not None:
+            print(f"🧮 TF-IDF 모델: 공고 {model.documents}개, 단어 {len(model)}개")
+    except Exception as e:
+        print(f"⚠️  저장소 반영 실패: {e}")
+    
+    # 상세 설명 캐시 통계
+    cache_stats = search_service.linkedin_scraper.description_cache.stats()
+    print(f"🗂️  상세 설명 캐시: 적중 {cache_stats['hits']}회, 미스 {cache_stats['misses']}회, 저장 {cache_stats['entries']}개")
+    
+    # 결과 저장: 이력은 압축 base + 일일 변경분(추가/삭제/변경) 스냅샷으로,
+    # 최신 전체 목록은 한 번만 직렬화해 latest.json에 원자적으로 저장
+    
+    # Pydantic 모델을 JSON 호환 dict로 변환 (datetime은 ISO 문자열)
+    jobs_data = [job.model_dump(mode='json') for job in unique_jobs]
+    
+    snapshot = SnapshotStore(str(jobs_dir / 'snapshots')).write(jobs_data, keywords, location, timestamp)
+    if snapshot['kind'] == 'base':
+        print(f"💾 기준 스냅샷 저장: {snapshot['name']} ({snapshot['total']}개)")
+    else:
+        print(f"💾 변경분 스냅샷 저장: {snapshot['name']} "
+              f"(추가 {snapshot['added']}, 변경 {snapshot['changed']}, 삭제 {snapshot['removed']})")
+    
+    latest_payload = json.dumps({
+        'timestamp': timestamp.isoformat(),
+        'total': len(unique_jobs),
+        'keywords': keywords,
+        'location': location,
+        'jobs': jobs_data,
+        # 공고별 마지막 확인 시각 (증분 수집의 보존 기간 판단용)
+        'last_seen': {job.id: last_seen.get(job.id, timestamp.isoformat()) for job in unique_jobs}
+    }, ensure_ascii=False)
+    write_atomic(latest_file, latest_payload.encode('utf-8'))
     
     print(f"💾 최신 결과 저장: {latest_file}")
     
@@ -0,0 +1,80 @@
+"""
+기존 결과(jobs/snapshots 스냅샷 또는 jobs/*.json 파일)를 채용 공고 저장소(DATABASE_URL)로 가져오는 스크립트
+"""
+import sys
+import io
+import json
+from datetime import datetime
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    try:
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+    except:
+        pass
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.job import JobPosting
+from app.services.job_store import JobStore, DATABASE_URL
+from app.services.snapshot_store import SnapshotStore
+
+def snapshot_time(data: dict, path: Path) -> datetime:
+    """결과 파일의 수집 시각 (없으면 파일 수정 시각)"""
+    try:
+        return datetime.fromisoformat(data['timestamp'])
+    except (KeyError, TypeError, ValueError):
+        return datetime.fromtimestamp(path.stat().st_mtime)
+
+def main():
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='jobs/*.json 결과 파일을 저장소로 가져오기')
+    parser.add_argument('files', nargs='*', help='가져올 JSON 파일 (기본: jobs/snapshots 스냅샷과 jobs/jobs_*.json)')
+    parser.add_argument('--database', default=DATABASE_URL, help=f'데이터베이스 URL (기본: {DATABASE_URL})')
+    args = parser.parse_args()
+    
+    jobs_dir = Path(__file__).parent.parent / 'jobs'
+    files = [Path(file) for file in args.files] or sorted(jobs_dir.glob('jobs_*.json'))
+    snapshot_store = SnapshotStore(str(jobs_dir / 'snapshots'))
+    if not files and not snapshot_store.entries():
+        print("[ERROR] 가져올 결과 파일이 없습니다.")
+        sys.exit(1)
+    
+    # 오래된 파일부터 반영해야 first_seen/last_seen이 수집 순서를 따름
+    snapshots = []
+    if not args.files:
+        for entry, view in snapshot_store.iter_views():
+            snapshots.append((datetime.fromisoformat(entry['timestamp']), Path(entry['name']), view))
+    for path in files:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[SKIP] {path.name}: {e}")
+            continue
+        snapshots.append((snapshot_time(data, path), path, data))
+    snapshots.sort(key=lambda snapshot: snapshot[0])
+    
+    store = JobStore(args.database)
+    try:
+        total = 0
+        for seen_at, path, data in snapshots:
+            jobs = []
+            for job_data in data.get('jobs', []):
+                try:
+                    jobs.append(JobPosting(**job_data))
+                except Exception as e:
+                    print(f"[SKIP] {path.name}의 공고 변환 오류: {e}")
+            total += store.upsert_jobs(jobs, seen_at=seen_at)
+            print(f"[OK] {path.name}: {len(jobs)}개")
+        
+        print(f"\n[DONE] 공고 {total}건 반영, 저장소 전체 {store.count_jobs()}개")
+    finally:
+        store.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""후보 역색인 무효화/압축 테스트"""
+import random
+from app.models.job import JobPosting
+from app.models.resume import ResumeData
+from app.services.candidate_index import CandidateIndex
+from app.services.job_features import JobFeatures
+from app.services.matching import MatchingService
+
+SKILLS = ["Python", "Java", "FastAPI", "Docker", "Kubernetes", "PostgreSQL", "React", "AWS"]
+VOCABULARY = [f"term{index:04d}" for index in range(600)]
+
+def make_job(generator: random.Random, job_id: str) -> JobPosting:
+    """무작위 설명/스킬의 테스트용 공고"""
+    words = generator.choices(VOCABULARY, k=40) + generator.sample(SKILLS, 3)
+    return JobPosting(
+        id=job_id,
+        title=generator.choice(["Senior Backend Engineer", "Junior Developer", "Software Engineer"]),
+        company="Acme",
+        description=" ".join(words),
+        url=f"https://example.com/{job_id}",
+        source="indeed",
+    )
+
+def make_resume(generator: random.Random) -> ResumeData:
+    """무작위 이력서"""
+    return ResumeData(
+        skills=generator.sample(SKILLS, 4),
+        experience=[{"title": "Developer"}],
+        raw_text=" ".join(generator.choices(VOCABULARY, k=120)),
+    )
+
+def build_index(jobs: list) -> CandidateIndex:
+    """주어진 공고만으로 새로 만든 색인"""
+    index = CandidateIndex()
+    index.add_many((job.id for job in jobs), (JobFeatures.from_job(job) for job in jobs))
+    return index
+
+def test_compact_keeps_candidates():
+    """내용 변경/코퍼스 제외 후 압축해도 새로 만든 색인과 후보가 같음"""
+    generator = random.Random(11)
+    jobs = {str(index): make_job(generator, str(index)) for index in range(200)}
+    index = CandidateIndex(max_dead_fraction=1.0)
+    index.add_many(jobs, (JobFeatures.from_job(job) for job in jobs.values()))
+    
+    for job_id in list(jobs)[:50]:
+        jobs[job_id] = make_job(generator, job_id)
+    index.add_many(list(jobs)[:50], (JobFeatures.from_job(jobs[job_id]) for job_id in list(jobs)[:50]))
+    for job_id in list(jobs)[150:]:
+        del jobs[job_id]
+    index.retain(jobs)
+    assert len(index) == 150
+    assert index.dead_fraction == 100 / 250
+    
+    resume = MatchingService().prepare_resume(make_resume(generator))
+    before = index.candidates(resume, limit=len(jobs))
+    index.compact()
+    
+    assert index.dead_fraction == 0.0
+    assert len(index._job_ids) == 150
+    assert index.candidates(resume, limit=len(jobs)) == before
+    assert set(before) == set(build_index(list(jobs.values())).candidates(resume, limit=len(jobs)))
+
+def test_rolling_corpus_matches_fresh_ranking():
+    """10일간 공고가 추가/변경/만료되는 코퍼스에서 매일 새 서비스와 같은 상위 결과를 내고 색인 크기가 제한됨"""
+    generator = random.Random(5)
+    resume = make_resume(generator)
+    service = MatchingService()
+    jobs = {f"0-{index}": make_job(generator, f"0-{index}") for index in range(300)}
+    
+    for day in range(10):
+        if day:
+            for job_id in list(jobs)[:60]:
+                del jobs[job_id]
+            for job_id in generator.sample(list(jobs), 20):
+                jobs[job_id] = make_job(generator, job_id)
+            jobs.update({f"{day}-{index}": make_job(generator, f"{day}-{index}") for index in range(60)})
+        
+        ranked = service.rank(resume, list(jobs.values()), top_n=10)
+        expected = MatchingService().rank(resume, list(jobs.values()), top_n=10)
+        assert [score.overall_score for _, score in ranked] == [score.overall_score for _, score in expected]
+        assert len(service.candidate_index) == len(jobs)
+        assert len(service.candidate_index._job_ids) <= 2 * len(jobs)
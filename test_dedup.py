@@ -0,0 +1,70 @@
+"""유사 중복 공고 판정 테스트"""
+import random
+from app.models.job import JobPosting
+from app.services.dedup import NearDuplicateIndex, dedupe_jobs
+
+DESCRIPTION = (
+    "We are looking for a Python developer to build and operate our data platform. "
+    "You will design REST APIs with FastAPI, maintain PostgreSQL schemas, run services on AWS "
+    "with Docker and Kubernetes, and work closely with product managers and data scientists. "
+    "Requirements: three or more years of backend experience, strong testing habits, "
+    "and experience with asynchronous programming."
+)
+
+def make_job(job_id: str, source: str = "linkedin", location: str = "Seoul, South Korea", description: str = DESCRIPTION) -> JobPosting:
+    """테스트용 공고"""
+    return JobPosting(
+        id=job_id,
+        title="Python Developer",
+        company="Acme",
+        location=location,
+        description=description,
+        url=f"https://example.com/{job_id}",
+        source=source,
+    )
+
+def test_cross_source_summary_is_duplicate():
+    """Indeed 요약(설명 앞부분)과 LinkedIn 전체 설명은 같은 공고로 판정"""
+    index = NearDuplicateIndex()
+    assert index.add("linkedin_1", make_job("linkedin_1")) is None
+    snippet = make_job("indeed_1", source="indeed", location="Seoul", description=DESCRIPTION[:160])
+    assert index.add("indeed_1", snippet) == "linkedin_1"
+
+def test_cross_source_summary_first_is_duplicate():
+    """요약이 먼저 색인돼도 같은 공고로 판정"""
+    index = NearDuplicateIndex()
+    assert index.add("indeed_1", make_job("indeed_1", source="indeed", description=DESCRIPTION[:160])) is None
+    assert index.add("linkedin_1", make_job("linkedin_1")) == "indeed_1"
+
+def test_cross_source_different_city_is_not_duplicate():
+    """제목/회사/설명이 같아도 도시가 다르면 다른 공고"""
+    index = NearDuplicateIndex()
+    assert index.add("linkedin_1", make_job("linkedin_1")) is None
+    snippet = make_job("indeed_1", source="indeed", location="Busan", description=DESCRIPTION[:160])
+    assert index.add("indeed_1", snippet) is None
+
+def test_empty_descriptions_are_not_merged():
+    """설명 수집에 실패한 공고는 제목/회사가 같아도 합치지 않음 (ID로만 판정)"""
+    index = NearDuplicateIndex()
+    assert index.add("c", make_job("c", location="Seoul", description="")) is None
+    assert index.add("d", make_job("d", location="Busan", description="")) is None
+    assert index.add("e", make_job("e", location="Seoul", description="")) is None
+    assert index.add("c", make_job("c", location="Seoul", description="")) == "c"
+    assert len(index) == 3
+
+def test_same_source_repost_is_duplicate():
+    """같은 소스에서 설명이 조금 바뀐 재게시 공고는 중복으로 판정"""
+    index = NearDuplicateIndex()
+    assert index.add("a", make_job("a")) is None
+    assert index.add("b", make_job("b", description=DESCRIPTION + " Apply now!")) == "a"
+
+def test_unrelated_postings_are_kept():
+    """서로 다른 설명의 공고는 모두 유지"""
+    generator = random.Random(7)
+    vocabulary = [f"word{index}" for index in range(2000)]
+    jobs = [
+        make_job(str(index), description=" ".join(generator.choices(vocabulary, k=80)))
+        for index in range(300)
+    ]
+    assert len(dedupe_jobs(jobs)) == len(jobs)
+    assert len(dedupe_jobs(jobs + jobs[:10])) == len(jobs)
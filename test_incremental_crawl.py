@@ -0,0 +1,59 @@
+"""증분 수집(이미 알고 있는 공고에서 중단) 테스트"""
+import asyncio
+import httpx
+from app.services.http_cache import HttpResponseCache
+from app.services.indeed_scraper import IndeedScraper
+from app.utils.job_id import make_job_id
+
+def card(job_key: str) -> str:
+    """Indeed 검색 결과 카드 HTML"""
+    return (
+        '<div class="job_seen_beacon">'
+        f'<h2 class="jobTitle">Python Developer {job_key}</h2>'
+        '<span class="companyName">Acme</span>'
+        '<div class="companyLocation">Seoul</div>'
+        f'<a class="jcs-JobTitle" href="/viewjob?jk={job_key}">view</a>'
+        '<div class="job-snippet">Build APIs</div>'
+        '</div>'
+    )
+
+def job_id(job_key: str) -> str:
+    """카드의 공고 ID"""
+    return make_job_id("indeed", f"https://www.indeed.com/viewjob?jk={job_key}")
+
+async def crawl(pages: dict, known_keys: set, max_results: int = 30):
+    """start= 오프셋별 카드 목록을 돌려주는 Indeed로 검색하고 (새 공고, 다시 본 공고, 요청 목록) 반환"""
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params)
+        keys = pages.get(int(request.url.params.get('start', 0)), [])
+        return httpx.Response(200, text="<html>" + "".join(card(key) for key in keys) + "</html>")
+    
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        scraper = IndeedScraper(base_url="http://indeed.test/jobs", client=client, response_cache=HttpResponseCache(ttl=0))
+        seen_known_ids = set()
+        jobs = []
+        async for page_jobs in scraper.search_iter(
+            "python", max_results=max_results, known_ids={job_id(key) for key in known_keys}, seen_known_ids=seen_known_ids
+        ):
+            jobs.extend(page_jobs)
+    return jobs, seen_known_ids, requests
+
+def test_incremental_uses_date_sort_and_stops_at_known_page():
+    """증분 수집은 최신순으로 한 페이지씩 요청하고 알고 있는 공고만 있는 페이지 이후는 요청하지 않음"""
+    pages = {0: ["n1", "n2", "k1"], 10: ["k2", "k3"], 20: ["n3"]}
+    jobs, seen_known_ids, requests = asyncio.run(crawl(pages, {"k1", "k2", "k3"}))
+    
+    assert [job.id for job in jobs] == [job_id("n1"), job_id("n2")]
+    assert seen_known_ids == {job_id("k1"), job_id("k2"), job_id("k3")}
+    assert all(params.get('sort') == 'date' for params in requests)
+    assert [params.get('start') for params in requests] == ['0', '10']
+
+def test_full_crawl_keeps_relevance_order():
+    """알고 있는 공고가 없으면 기본(관련도순) 검색으로 모든 페이지를 가져옴"""
+    pages = {0: ["a", "b"], 10: ["c"], 20: ["d"]}
+    jobs, _, requests = asyncio.run(crawl(pages, set()))
+    
+    assert [job.id for job in jobs] == [job_id(key) for key in ("a", "b", "c", "d")]
+    assert all('sort' not in params for params in requests)
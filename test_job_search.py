@@ -0,0 +1,36 @@
+"""검색 서비스 소스 오류 처리 테스트"""
+import asyncio
+import httpx
+from app.models.job import JobSearchRequest
+from app.services.http_cache import HttpResponseCache
+from app.services.indeed_scraper import IndeedScraper
+from app.services.job_search import JobSearchService
+
+def blocked(request: httpx.Request) -> httpx.Response:
+    """모든 요청을 차단하는 응답"""
+    return httpx.Response(403, text="blocked")
+
+async def search_twice(max_results: int):
+    """차단된 Indeed로 같은 검색을 두 번 실행"""
+    async with httpx.AsyncClient(transport=httpx.MockTransport(blocked)) as client:
+        scraper = IndeedScraper(base_url="http://indeed.test/jobs", client=client, response_cache=HttpResponseCache(ttl=0))
+        service = JobSearchService(indeed_scraper=scraper)
+        request = JobSearchRequest(keyword="python", max_results=max_results, sources=["indeed"])
+        first = await service.search_jobs_with_status(request)
+        second = await service.search_jobs_with_status(request)
+        return first, second, service.result_cache.stats()
+
+def test_failing_source_is_reported():
+    """차단된 소스는 오류로 표시되고 부분 결과가 됨"""
+    for max_results in (5, 30):
+        first, _, _ = asyncio.run(search_twice(max_results))
+        assert first.source_status == {"indeed": "error"}
+        assert first.partial
+        assert first.jobs == []
+
+def test_failing_source_is_not_cached():
+    """오류가 난 검색 결과는 캐시하지 않고 다음 요청에서 다시 검색"""
+    _, second, stats = asyncio.run(search_twice(30))
+    assert second.cache_status == "miss"
+    assert second.source_status == {"indeed": "error"}
+    assert stats["entries"] == 0
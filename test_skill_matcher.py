@@ -0,0 +1,64 @@
+"""토큰 단위 Aho-Corasick 스킬 매처 테스트"""
+import random
+from app.services.skill_matcher import DEFAULT_SKILLS, SkillMatcher, tokenize
+
+def brute_force(skills: dict, text: str) -> set:
+    """모든 스킬(별칭 포함)의 토큰 열을 문서 토큰에서 직접 찾은 대표 이름 집합"""
+    tokens = tokenize(text)
+    found = set()
+    for skill, aliases in skills.items():
+        for term in [skill, *aliases]:
+            pattern = tokenize(term)
+            if any(tokens[i:i + len(pattern)] == pattern for i in range(len(tokens) - len(pattern) + 1)):
+                found.add(skill)
+    return found
+
+def test_word_boundaries():
+    """'java'는 'javascript' 안에서 잡히지 않고, 'c'는 'c++'/'c#'와 구분"""
+    matcher = SkillMatcher()
+    assert matcher.find("Senior JavaScript developer") == ["JavaScript"]
+    assert matcher.find("Java and JavaScript") == ["Java", "JavaScript"]
+    assert matcher.find("Experience with C++ and C#") == ["C++", "C#"]
+    assert matcher.find("rustic sparkling gitlab") == []
+
+def test_multi_token_skills():
+    """여러 단어 스킬과 그 접두어 스킬을 모두 찾음"""
+    matcher = SkillMatcher()
+    assert matcher.find("We use Spring Boot") == ["Spring", "Spring Boot"]
+    assert matcher.find("machine learning and deep learning") == ["Machine Learning", "Deep Learning"]
+    assert matcher.find("machine vision") == []
+
+def test_aliases_map_to_canonical_name():
+    """별칭은 대표 이름으로 반환"""
+    matcher = SkillMatcher()
+    assert matcher.find("k8s, postgres, ReactJS, react.js, node.js") == ["Kubernetes", "PostgreSQL", "React", "Node.js"]
+    assert matcher.canonical("sklearn") == "scikit-learn"
+    assert matcher.canonical("cobol") is None
+
+def test_overlapping_patterns():
+    """겹치는 패턴은 실패 링크를 따라 모두 찾음"""
+    matcher = SkillMatcher({"a b c": [], "b c": [], "b d": [], "c": []})
+    assert matcher.find("a b c") == ["a b c", "b c", "c"]
+    assert matcher.find("a b d") == ["b d"]
+    assert matcher.find("a a b c") == ["a b c", "b c", "c"]
+
+def test_add_rebuilds_automaton():
+    """매칭 후 스킬을 추가해도 다음 매칭에 반영"""
+    matcher = SkillMatcher({"python": []})
+    assert matcher.find("python and elixir") == ["python"]
+    signature = matcher.signature
+    matcher.add("Elixir", ["ex"])
+    assert matcher.find("python and elixir") == ["python", "Elixir"]
+    assert matcher.signature != signature
+
+def test_matches_brute_force_on_generated_postings():
+    """생성한 공고 3000개에서 직접 찾은 결과와 같음"""
+    matcher = SkillMatcher()
+    generator = random.Random(3)
+    terms = [term for skill, aliases in DEFAULT_SKILLS.items() for term in [skill, *aliases]]
+    filler = "the team builds scalable services with modern tooling and learning boot spring data".split()
+    for _ in range(3000):
+        words = generator.choices(terms, k=5) + generator.choices(filler, k=30)
+        generator.shuffle(words)
+        text = " ".join(words)
+        assert set(matcher.find(text)) == brute_force(DEFAULT_SKILLS, text), text
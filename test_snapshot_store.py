@@ -0,0 +1,53 @@
+"""스냅샷 저장소 테스트"""
+from datetime import datetime
+import pytest
+from app.services.snapshot_store import SnapshotStore
+
+def make_job(job_id: str, title: str = "Python Developer") -> dict:
+    """테스트용 공고 dict"""
+    return {"id": job_id, "title": title, "company": "Acme", "description": "Build APIs", "url": f"https://example.com/{job_id}", "source": "indeed"}
+
+def test_load_view_by_date(tmp_path):
+    """날짜만 주면 그날의 마지막 스냅샷 기준 목록"""
+    store = SnapshotStore(str(tmp_path))
+    store.write([make_job("a")], ["python"], "Seoul", datetime(2025, 1, 15, 9))
+    store.write([make_job("a"), make_job("b")], ["python"], "Seoul", datetime(2025, 1, 15, 21))
+    store.write([make_job("c")], ["python"], "Seoul", datetime(2025, 1, 16, 9))
+    
+    assert [job["id"] for job in store.load_view("2025-01-15")["jobs"]] == ["b", "a"]
+    assert [job["id"] for job in store.load_view("2025-01-15T12:00:00")["jobs"]] == ["a"]
+    assert store.load_view("2025-01-14") is None
+
+def test_load_view_rejects_invalid_time(tmp_path):
+    """날짜/시각 형식이 아니면 최신 목록 대신 ValueError"""
+    store = SnapshotStore(str(tmp_path))
+    store.write([make_job("a")], ["python"], "Seoul", datetime(2025, 1, 15, 9))
+    
+    for at in ("abc", "2025-13-01", "latest"):
+        with pytest.raises(ValueError):
+            store.load_view(at)
+
+def test_delta_reconstruction(tmp_path):
+    """base 이후 추가/변경/삭제 delta를 적용한 목록이 각 시점에 쓴 목록과 같고 주기가 지나면 새 base를 씀"""
+    store = SnapshotStore(str(tmp_path), base_interval_days=7)
+    days = [
+        [make_job("a"), make_job("b"), make_job("c")],
+        [make_job("a"), make_job("b", "Senior Python Developer"), make_job("d")],
+        [make_job("d"), make_job("e"), make_job("b", "Senior Python Developer")],
+        [make_job("e"), make_job("f")],
+    ]
+    timestamps = [datetime(2025, 1, 1), datetime(2025, 1, 2), datetime(2025, 1, 3), datetime(2025, 1, 8)]
+    entries = [store.write(jobs, ["python"], "Seoul", timestamp) for jobs, timestamp in zip(days, timestamps)]
+    
+    assert [entry["kind"] for entry in entries] == ["base", "delta", "delta", "base"]
+    assert (entries[1]["added"], entries[1]["changed"], entries[1]["removed"]) == (1, 1, 1)
+    assert (entries[2]["added"], entries[2]["changed"], entries[2]["removed"]) == (1, 0, 1)
+    
+    views = list(store.iter_views())
+    assert len(views) == len(days)
+    for (entry, view), jobs, written in zip(views, days, entries):
+        assert entry == written
+        assert view["total"] == len(jobs)
+        assert sorted(view["jobs"], key=lambda job: job["id"]) == sorted(jobs, key=lambda job: job["id"])
+    assert [job["id"] for job in views[1][1]["jobs"]] == ["d", "a", "b"]
+    assert store.load_view("2025-01-02")["jobs"] == views[1][1]["jobs"]